@@ -0,0 +1,105 @@
+"""
+Latency of /api/v1/statistics from 1k to 1M synthetic draws: building the
+prefix-sum index, full-history and draw-range requests served by it, five
+windows fetched by /statistics/multi vs five separate /statistics requests,
+and on the SQL side the GROUP BY rebuild over draw_numbers vs the read of
+the materialized statistics row.
+
+Usage (from backend/): python -m benchmarks.bench_statistics
+"""
+
+import time
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import services.statistics_service as statistics_service
+from database import Base, DrawNumber, LottoResult
+from routers.statistics import router
+from services.draw_store import DrawStore
+from services.statistics_store import StatisticsStore, prefix_totals, statistics_from_totals
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+WINDOWS = ("all", "10", "50", "100", "500")
+SQL_MAX_DRAWS = 100_000  # Loading 7 index rows per draw dominates beyond this
+REPEAT = 5
+
+
+def synthetic_store(n: int, seed: int = 0) -> DrawStore:
+    """Draw store of n random draws (no feature rows; statistics never read them)."""
+    rng = np.random.default_rng(seed)
+    numbers = np.argpartition(rng.random((n, 45)), 6, axis=1)[:, :6] + 1
+    return DrawStore(
+        draw_no=np.arange(1, n + 1, dtype=np.int32),
+        draw_dates=np.array(["2024-01-01"] * n, dtype=object),
+        numbers=numbers.astype(np.uint8),
+        bonus=rng.integers(1, 46, n).astype(np.uint8),
+        features=np.zeros((n + 1, 0)),
+        version=0
+    )
+
+
+def synthetic_database(store: DrawStore) -> Session:
+    """In-memory SQLite database holding the store's draws and their draw_numbers rows."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    draws, rows = [], []
+    for draw_no, numbers, bonus in zip(store.draw_no.tolist(), store.numbers.tolist(), store.bonus.tolist()):
+        draws.append({"draw_no": draw_no, "draw_date": "2024-01-01", "bonus": bonus,
+                      **{f"num{j + 1}": n for j, n in enumerate(numbers)}})
+        rows.extend({"draw_no": draw_no, "number": n, "is_bonus": False} for n in numbers)
+        rows.append({"draw_no": draw_no, "number": bonus, "is_bonus": True})
+    db.bulk_insert_mappings(LottoResult, draws)
+    db.bulk_insert_mappings(DrawNumber, rows)
+    db.commit()
+    return db
+
+
+def _median_ms(fn) -> float:
+    fn()  # Warm up
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1000
+
+
+def main() -> None:
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    client = TestClient(app)
+
+    statistics_service.STATISTICS_SOURCE = "memory"
+    print(f"{'draws':>10}{'prefix build ms':>17}{'endpoint ms':>14}{'range ms':>10}"
+          f"{'5 singles ms':>14}{'multi ms':>10}{'rebuild ms':>12}{'row ms':>10}")
+    for n in SIZES:
+        store = synthetic_store(n)
+        statistics_service.get_draw_store = lambda: store
+        endpoint_ms = _median_ms(lambda: client.get("/api/v1/statistics").raise_for_status())
+        build_ms = _median_ms(lambda: prefix_totals(store.numbers))
+        window = {"from_draw": n // 4, "to_draw": n // 2}
+        range_ms = _median_ms(lambda: client.get("/api/v1/statistics", params=window).raise_for_status())
+        singles_ms = _median_ms(lambda: [
+            client.get("/api/v1/statistics", params=None if w == "all" else {"recent": w}).raise_for_status()
+            for w in WINDOWS
+        ])
+        multi_ms = _median_ms(
+            lambda: client.get("/api/v1/statistics/multi", params={"windows": ",".join(WINDOWS)}).raise_for_status()
+        )
+        rebuild = row = "-"
+        if n <= SQL_MAX_DRAWS:
+            db = synthetic_database(store)
+            rebuild = f"{_median_ms(lambda: StatisticsStore.rebuild(db)):.2f}"
+            row = f"{_median_ms(lambda: statistics_from_totals(StatisticsStore.get_totals(db))):.2f}"
+            db.close()
+        print(f"{n:>10,}{build_ms:>17.2f}{endpoint_ms:>14.2f}{range_ms:>10.2f}"
+              f"{singles_ms:>14.2f}{multi_ms:>10.2f}{rebuild:>12}{row:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Peak memory of building the training matrices: the float32 copy-free split
+vs the former float64 train_test_split + StandardScaler pipeline.
+
+Usage (from backend/): python -m benchmarks.bench_training_memory [draws]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from services.draw_store import DrawStore
+from services.feature_service import build_feature_matrix
+from services.ml_service import split_training_data
+
+DEFAULT_DRAWS = 200_000
+
+
+def _float64_split(store: DrawStore):
+    X = store.features[5:len(store)]
+    y = store.numbers[5:].astype(np.int64)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    scaler = StandardScaler()
+    return scaler, scaler.fit_transform(X_train), scaler.transform(X_test), y_train, y_test
+
+
+def _measure(fn, store: DrawStore):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(store)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / (1024 * 1024), elapsed
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DRAWS
+    rng = np.random.default_rng(0)
+    numbers = np.sort(rng.permuted(np.tile(np.arange(1, 46), (n, 1)), axis=1)[:, :6], axis=1)
+    store = DrawStore(
+        draw_no=np.arange(1, n + 1, dtype=np.int32),
+        draw_dates=np.array(["2024-01-01"] * n, dtype=object),
+        numbers=numbers.astype(np.uint8),
+        bonus=rng.integers(1, 46, n).astype(np.uint8),
+        features=build_feature_matrix(numbers),
+        version=0
+    )
+
+    print(f"draws: {n:,}  store features: {store.features.nbytes / (1024 * 1024):.1f} MB")
+    print(f"{'pipeline':<28}{'peak MB':>10}{'seconds':>10}")
+    for label, fn in (("float64 train_test_split", _float64_split), ("float32 copy-free split", split_training_data)):
+        peak_mb, elapsed = _measure(fn, store)
+        print(f"{label:<28}{peak_mb:>10.1f}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
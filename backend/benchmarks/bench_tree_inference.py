@@ -0,0 +1,45 @@
+"""
+Latency of compiled tree inference vs sklearn predict.
+
+Usage (from backend/): python -m benchmarks.bench_tree_inference
+"""
+
+import time
+
+import numpy as np
+
+from services.ml_service import build_models
+from services.tree_compiler import compile_model
+
+REPEAT = 50
+
+
+def _latency_ms(fn, X: np.ndarray) -> float:
+    fn(X)  # Warm up
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(X)
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(1000, 79))
+    y = np.sort(rng.integers(1, 46, (1000, 6)), axis=1)
+
+    print(f"{'model':<20}{'rows':>6}{'sklearn ms':>12}{'compiled ms':>13}{'speedup':>9}")
+    for model_name, model in build_models().items():
+        model.fit(X, y)
+        compiled_model = compile_model(model)
+        if compiled_model is None:
+            continue
+        for rows in (1, 10, 100):
+            batch = X[:rows]
+            sklearn_ms = _latency_ms(model.predict, batch)
+            compiled_ms = _latency_ms(compiled_model.predict, batch)
+            assert np.array_equal(model.predict(batch), compiled_model.predict(batch))
+            print(f"{model_name:<20}{rows:>6}{sklearn_ms:>12.3f}{compiled_ms:>13.3f}{sklearn_ms / compiled_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
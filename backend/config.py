@@ -9,6 +9,12 @@ BASE_DIR = Path(__file__).parent
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'data' / 'lotto_data.db'}")
 DB_PATH = BASE_DIR / "data" / "lotto_data.db"
+# Columnar snapshot of the draw table, rewritten when the table changes
+SNAPSHOT_PATH = BASE_DIR / os.getenv("SNAPSHOT_PATH", "data/draw_snapshot.npz")
+
+# Full-history statistics: "sql" (materialized lotto_statistics row) or "memory" (draw store
+# prefix-sum index); recent and draw-range windows always use the prefix-sum index
+STATISTICS_SOURCE = os.getenv("STATISTICS_SOURCE", "sql")
 
 # API Settings
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
@@ -30,6 +36,43 @@ CORS_ORIGINS = os.getenv(
 
 # ML Models
 MODEL_PATH = BASE_DIR / os.getenv("MODEL_PATH", "ml_models")
+MODEL_KEEP_VERSIONS = int(os.getenv("MODEL_KEEP_VERSIONS", "3"))
+# Serve tree ensembles from flattened node arrays instead of sklearn predict
+COMPILED_INFERENCE = os.getenv("COMPILED_INFERENCE", "true").lower() == "true"
+
+# Parallel training (TRAIN_WORKERS=0 uses every core the resource policy allows)
+TRAIN_PARALLEL = os.getenv("TRAIN_PARALLEL", "true").lower() == "true"
+TRAIN_WORKERS = int(os.getenv("TRAIN_WORKERS", "0"))
+# Training resource policy (training, backtest and search jobs; see services/parallel.py)
+TRAIN_MAX_WORKERS = int(os.getenv("TRAIN_MAX_WORKERS", "0"))  # 0: bounded by the CPU quota only
+TRAIN_RESERVED_CPUS = int(os.getenv("TRAIN_RESERVED_CPUS", "1"))  # CPUs left to the API server
+TRAIN_THREADS = int(os.getenv("TRAIN_THREADS", "1"))  # BLAS/OpenMP/joblib threads per process
+TRAIN_NICE = int(os.getenv("TRAIN_NICE", "10"))  # Priority increment for training (0: unchanged)
+# Model families trained and served (see services/model_zoo.py)
+MODEL_SET = [
+    name.strip()
+    for name in os.getenv("MODEL_SET", "random_forest,gradient_boosting,neural_network").split(",")
+    if name.strip()
+]
+# Feature groups per model family, e.g. "knn=frequency+gaps;ridge=prev_draws+mean_std"
+# (families not listed use their zoo default; see services/feature_service.py)
+MODEL_FEATURE_GROUPS = {
+    model.strip(): [group.strip() for group in groups.split("+") if group.strip()]
+    for model, _, groups in (entry.partition("=") for entry in os.getenv("MODEL_FEATURE_GROUPS", "").split(";"))
+    if model.strip()
+}
+# "wrapped": one regressor per number position, "native": single multi-output
+# regressor where the model family supports it
+TRAIN_OUTPUT_MODE = os.getenv("TRAIN_OUTPUT_MODE", "wrapped")
+# Trace the peak allocation of building the training matrices (tracemalloc is
+# process-global and slows every thread while tracing, so it is opt-in)
+TRAIN_TRACE_MEMORY = os.getenv("TRAIN_TRACE_MEMORY", "false").lower() == "true"
+
+# Incremental model updates after an incremental sync
+INCREMENTAL_UPDATES = os.getenv("INCREMENTAL_UPDATES", "true").lower() == "true"
+INCREMENTAL_TREES = int(os.getenv("INCREMENTAL_TREES", "10"))  # Trees/stages added per update
+INCREMENTAL_FULL_RETRAIN_EVERY = int(os.getenv("INCREMENTAL_FULL_RETRAIN_EVERY", "8"))
+INCREMENTAL_DRIFT_TOLERANCE = float(os.getenv("INCREMENTAL_DRIFT_TOLERANCE", "0.02"))
 
 # Excel Data File
 EXCEL_DATA_PATH = BASE_DIR / "data" / "lotto_data.xlsx"
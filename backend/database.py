@@ -3,7 +3,7 @@ Database configuration and models for Lotto ML application.
 Using SQLAlchemy with SQLite for data persistence.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, BigInteger, Index
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, BigInteger, Boolean, LargeBinary, Index
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
 import os
@@ -70,6 +70,67 @@ class LottoResult(Base):
         }
 
 
+class LottoFeature(Base):
+    """
+    Feature store row keyed by draw_no.
+    Holds the ML feature vector used to predict `draw_no` together with the
+    rolling frequency window state needed to derive the next row in O(45).
+    """
+    __tablename__ = "lotto_features"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    draw_no = Column(Integer, unique=True, nullable=False, index=True)
+    is_next = Column(Boolean, default=False, nullable=False)  # Features for the upcoming draw
+
+    features = Column(LargeBinary, nullable=False)  # float64[79]
+    window_counts = Column(LargeBinary, nullable=False)  # int32[45] number counts in rolling window
+    window_len = Column(Integer, nullable=False)  # Number of draws in rolling window
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<LottoFeature(draw_no={self.draw_no}, is_next={self.is_next})>"
+
+
+class DrawNumber(Base):
+    """
+    Normalized draw numbers: one row per main number (6 per draw) and one
+    for the bonus, so per-number aggregates run as indexed GROUP BY queries.
+    """
+    __tablename__ = "draw_numbers"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    draw_no = Column(Integer, nullable=False)
+    number = Column(Integer, nullable=False)  # 1-45
+    is_bonus = Column(Boolean, default=False, nullable=False)
+
+    def __repr__(self):
+        return f"<DrawNumber(draw_no={self.draw_no}, number={self.number}, is_bonus={self.is_bonus})>"
+
+
+class LottoStatistics(Base):
+    """
+    Materialized statistics of the whole draw history (a single row).
+    Running totals are updated in the same transaction as each draw insert
+    or delete; count vectors are stored as int64 arrays.
+    """
+    __tablename__ = "lotto_statistics"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    total_draws = Column(Integer, nullable=False, default=0)
+    latest_draw = Column(Integer, nullable=True)  # Latest draw_no covered (None: empty history)
+    number_counts = Column(LargeBinary, nullable=False)  # int64[45] occurrences of numbers 1-45
+    odd_even_counts = Column(LargeBinary, nullable=False)  # int64[7] draws with 0-6 odd numbers
+    sum_counts = Column(LargeBinary, nullable=False)  # int64[8] draws per sum range
+    section_counts = Column(LargeBinary, nullable=False)  # int64[3, 7] draws with 0-6 numbers per section
+    consecutive_draws = Column(Integer, nullable=False, default=0)  # Draws with a consecutive pair
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<LottoStatistics(total_draws={self.total_draws})>"
+
+
 class SystemInfo(Base):
     """
     System information and configuration storage.
@@ -90,6 +151,8 @@ class SystemInfo(Base):
 # Create indexes for better performance
 Index('idx_lotto_draw_date', LottoResult.draw_date)
 Index('idx_lotto_numbers', LottoResult.num1, LottoResult.num2, LottoResult.num3, LottoResult.num4, LottoResult.num5, LottoResult.num6)
+Index('idx_draw_numbers_number', DrawNumber.number, DrawNumber.is_bonus, DrawNumber.draw_no)
+Index('idx_draw_numbers_draw', DrawNumber.draw_no, DrawNumber.is_bonus, DrawNumber.number, unique=True)
 
 
 def create_tables():
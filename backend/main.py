@@ -3,7 +3,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import CORS_ORIGINS, API_HOST, API_PORT, DEBUG
+from database import create_tables
 from services.excel_service import ensure_data_dir
+from services.model_registry import model_registry
 from routers import (
     results_router,
     statistics_router,
@@ -17,8 +19,11 @@ from routers.simulation import router as simulation_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup - ensure data directory exists
+    # Startup - ensure data directory and tables (incl. feature store) exist
     ensure_data_dir()
+    create_tables()
+    # Load trained model artifacts once so the first prediction is fast
+    model_registry.get()
     yield
     # Shutdown (cleanup if needed)
 
@@ -92,6 +92,12 @@ class StatisticsResponse(BaseModel):
     total_draws: int
 
 
+class MultiStatisticsResponse(BaseModel):
+    """Statistics of several windows ("all" or latest N draws), keyed by window."""
+    windows: Dict[str, StatisticsResponse]
+    latest_draw: Optional[int] = None
+
+
 class ModelPrediction(BaseModel):
     """Single model prediction."""
     numbers: List[int]
@@ -105,6 +111,50 @@ class PredictionResponse(BaseModel):
     last_trained: Optional[str] = None
 
 
+class AsOfModelPrediction(BaseModel):
+    """One model's ticket for a draw, scored when the draw has happened."""
+    numbers: List[int]
+    hits: Optional[int] = None
+    rank: Optional[int] = None  # 1-5 prize rank, 0 = no prize
+
+
+class AsOfDrawPrediction(BaseModel):
+    """Predictions for one draw from the history before it."""
+    draw_no: int
+    actual: Optional[List[int]] = None  # None for the upcoming draw
+    bonus: Optional[int] = None
+    in_training_data: bool  # Draw was available when the models were trained
+    predictions: Dict[str, AsOfModelPrediction]
+
+
+class AsOfModelSummary(BaseModel):
+    """Per-model outcome over the scored draws."""
+    mean_hits: float
+    rank_counts: Dict[str, int]
+
+
+class AsOfPredictionResponse(BaseModel):
+    """Point-in-time prediction API response."""
+    from_draw: int
+    to_draw: int
+    version: Optional[str] = None  # Model version used
+    draws: List[AsOfDrawPrediction]
+    summary: Dict[str, AsOfModelSummary]
+    disclaimer: str = "로또는 무작위 추첨이므로 예측이 불가능합니다. 이 결과는 참고용입니다."
+
+
+class TicketsResponse(BaseModel):
+    """Ensemble ticket API response."""
+    tickets: List[List[int]]
+    count: int
+    seed: Optional[int] = None
+    source: str  # ensemble (served models) or random (no trained models)
+    scores: List[float]  # Sampling probability of numbers 1-45
+    version: Optional[str] = None  # Model version used
+    latest_draw: Optional[int] = None
+    disclaimer: str = "로또는 무작위 추첨이므로 예측이 불가능합니다. 이 결과는 참고용입니다."
+
+
 class Recommendation(BaseModel):
     """Single recommendation."""
     numbers: List[int]
@@ -128,12 +178,26 @@ class MLModelStatus(BaseModel):
     trained: bool
     last_trained: Optional[str]
     models_available: List[str]
+    version: Optional[str] = None  # Loaded model artifact version
+    loaded_at: Optional[str] = None
+    compiled_models: List[str] = []  # Models served by the compiled tree path
+
+
+class PredictionCacheStatus(BaseModel):
+    """Prediction cache state."""
+    filled: bool
+    latest_draw: Optional[int] = None
+    model_version: Optional[str] = None
+    filled_at: Optional[str] = None
+    hits: int = 0
+    misses: int = 0
 
 
 class StatusResponse(BaseModel):
     """System status API response."""
     database: DatabaseStatus
     ml_models: MLModelStatus
+    prediction_cache: Optional[PredictionCacheStatus] = None
     last_sync: Optional[str] = None
 
 
@@ -143,11 +207,24 @@ class SyncResponse(BaseModel):
     latest_draw: int
 
 
+class EvaluationMetrics(BaseModel):
+    """Model evaluation metrics for one data split."""
+    accuracy_within: Dict[str, float]  # "k" -> share of positions within ±k (k = 0..5)
+    hit_distribution: Dict[str, int]  # "h" -> draws with h matching numbers (0..6)
+    position_mae: List[float]  # Mean absolute error per number position
+
+
 class ModelTrainResult(BaseModel):
     """Single model training result."""
     train_accuracy: float
     test_accuracy: float
     trained: bool
+    fit_time: Optional[float] = None  # Seconds spent fitting this model
+    predict_ms: Optional[float] = None  # Median single-row latency of the served path
+    model_bytes: Optional[int] = None  # Serialized model size
+    feature_groups: Optional[List[str]] = None  # Feature groups the model consumed
+    train_metrics: Optional[EvaluationMetrics] = None
+    test_metrics: Optional[EvaluationMetrics] = None
 
 
 class TrainResponse(BaseModel):
@@ -156,3 +233,158 @@ class TrainResponse(BaseModel):
     trained_at: str
     training_samples: int
     test_samples: int
+    version: Optional[str] = None  # Published model artifact version
+    output_mode: str = "wrapped"  # wrapped (per-position models) or native (multi-output)
+    parallel: bool = False
+    workers: int = 1
+    fit_wall_time: Optional[float] = None  # Wall-clock seconds for all model fits
+    update_mode: str = "full"  # full retrain or incremental update
+    full_retrain_reason: Optional[str] = None  # Why an automatic update retrained fully
+    incremental_updates: Optional[int] = None  # Updates since the last full retrain
+    drift: Optional[Dict[str, float]] = None  # Test accuracy drop vs the last full retrain
+    memory: Optional[Dict[str, Optional[float]]] = None  # data_peak_mb (if traced) and max_rss_mb of a full retrain
+
+
+class JobStatus(BaseModel):
+    """Background job status."""
+    job_id: str
+    kind: str
+    status: str  # queued, running, completed, failed, cancelled
+    phase: str
+    progress: float = Field(..., ge=0, le=1)
+    elapsed: float  # Seconds since the job started
+    created_at: str
+    error: Optional[str] = None
+
+
+class TrainJobStatus(JobStatus):
+    """Training job status with the training result once completed."""
+    result: Optional[TrainResponse] = None
+
+
+class BacktestRequest(BaseModel):
+    """Walk-forward backtest parameters."""
+    model: str = Field("random_forest", description="Model family to backtest")
+    step: int = Field(10, ge=1, le=500, description="Retrain every N draws")
+    min_train: int = Field(100, ge=15, description="Draws in the first training window")
+
+
+class BacktestDraw(BaseModel):
+    """Backtest outcome for one draw."""
+    draw_no: int
+    numbers: List[int]
+    hits: int
+    rank: int  # 1-5 prize rank, 0 = no prize
+
+
+class BacktestResult(BaseModel):
+    """Walk-forward backtest summary."""
+    model: str
+    output_mode: Optional[str] = None  # Training output mode of the backtested estimator
+    step: int
+    min_train: int
+    folds: int
+    computed_folds: int
+    cached_folds: int
+    draws_evaluated: int
+    mean_hits: float
+    hit_distribution: Dict[str, int]
+    rank_counts: Dict[str, int]
+    draws: List[BacktestDraw]
+
+
+class BacktestJobStatus(JobStatus):
+    """Backtest job status with the result once completed."""
+    result: Optional[BacktestResult] = None
+
+
+class SearchRequest(BaseModel):
+    """Hyperparameter search parameters."""
+    model: str = Field("random_forest", description="Model family to tune")
+    method: str = Field("grid", pattern="^(grid|random)$", description="grid or random search")
+    n_iter: int = Field(10, ge=1, le=200, description="Candidates sampled by random search")
+    n_splits: int = Field(5, ge=2, le=10, description="Time-series CV folds")
+
+
+class SearchEntry(BaseModel):
+    """One ranked hyperparameter candidate."""
+    rank: int
+    params: Dict[str, Any]
+    mean_score: float
+    std_score: float
+    mean_hits: float
+    fit_time: float
+
+
+class SearchResult(BaseModel):
+    """Hyperparameter search leaderboard."""
+    model: str
+    method: str
+    output_mode: Optional[str] = None  # Training output mode the candidates were scored in
+    n_splits: int
+    candidates: int
+    samples: int
+    searched_at: str
+    search_time: float
+    leaderboard: List[SearchEntry]
+
+
+class SearchJobStatus(JobStatus):
+    """Search job status with the leaderboard once completed."""
+    result: Optional[SearchResult] = None
+
+
+class PromoteRequest(BaseModel):
+    """Promote a leaderboard entry into the served model set."""
+    model: str = Field("random_forest", description="Model family")
+    rank: int = Field(1, ge=1, description="Leaderboard rank to promote")
+
+
+class OutputModeModelStats(BaseModel):
+    """One model family measured in one output mode."""
+    native: bool  # False when the family has no native multi-output estimator
+    fit_time: float
+    pickle_bytes: int
+    predict_ms: float  # Median single-row sklearn predict latency
+    compiled_predict_ms: Optional[float] = None
+    test_metrics: EvaluationMetrics
+
+
+class OutputModeComparison(BaseModel):
+    """Wrapped vs native multi-output comparison."""
+    training_samples: int
+    test_samples: int
+    modes: Dict[str, Dict[str, OutputModeModelStats]]
+
+
+class CompareJobStatus(JobStatus):
+    """Comparison job status with the report once completed."""
+    result: Optional[OutputModeComparison] = None
+
+
+class ModelZooEntry(BaseModel):
+    """Model family available for training."""
+    name: str
+    label: str
+    native_multi_output: bool
+    enabled: bool  # Part of the configured MODEL_SET
+    feature_groups: List[str] = []  # Feature groups the model consumes
+
+
+class FeatureGroupEntry(BaseModel):
+    """Feature group available to the models."""
+    name: str
+    width: int  # Number of feature columns
+    description: str
+    used_by: List[str]  # Configured models consuming the group
+
+
+class ResourcePolicyStatus(BaseModel):
+    """CPU budget of training, backtest and search jobs."""
+    max_workers: int  # 0: bounded by the CPU quota only
+    reserved_cpus: int
+    threads: int  # BLAS/OpenMP/joblib threads per training process
+    nice: int
+    available_cpus: int
+    cpu_quota: Optional[float] = None  # Container CPU quota (None: unlimited)
+    worker_limit: int  # Most worker processes a job may start
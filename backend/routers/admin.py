@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
 
 from models.schemas import (
     APIResponse,
@@ -7,7 +9,19 @@ from models.schemas import (
     StatusResponse,
     DatabaseStatus,
     MLModelStatus,
-    ModelTrainResult
+    ModelTrainResult,
+    TrainJobStatus,
+    PredictionCacheStatus,
+    BacktestRequest,
+    BacktestJobStatus,
+    SearchRequest,
+    SearchResult,
+    SearchJobStatus,
+    PromoteRequest,
+    CompareJobStatus,
+    ModelZooEntry,
+    FeatureGroupEntry,
+    ResourcePolicyStatus
 )
 from services.data_service import (
     sync_incremental,
@@ -17,7 +31,15 @@ from services.data_service import (
     get_latest_draw,
     get_result_by_draw_no
 )
-from services.ml_service import train_models, get_model_status
+from services.ml_service import OUTPUT_MODES, train_models, get_model_status
+from services.model_comparison import compare_output_modes
+from services.model_zoo import MODEL_ZOO, enabled_models, model_feature_groups
+from services.feature_service import FEATURE_GROUPS
+from services.incremental_service import update_models
+from services.backtest_service import run_backtest
+from services.search_service import run_search, load_leaderboard, promote
+from services.job_service import Job, job_manager
+from services.parallel import resource_policy
 
 router = APIRouter()
 
@@ -85,41 +107,321 @@ async def sync_data_full():
         )
 
 
-@router.post("/train", response_model=APIResponse[TrainResponse])
-async def train():
-    """Train all ML models."""
-    try:
-        result = train_models()
+def _to_train_response(result: Dict[str, Any]) -> TrainResponse:
+    """Convert train_models() output to the API schema."""
+    models = {
+        model_name: ModelTrainResult(
+            train_accuracy=model_data["train_accuracy"],
+            test_accuracy=model_data["test_accuracy"],
+            trained=model_data["trained"],
+            fit_time=model_data.get("fit_time"),
+            predict_ms=model_data.get("predict_ms"),
+            model_bytes=model_data.get("model_bytes"),
+            feature_groups=model_data.get("feature_groups"),
+            train_metrics=model_data.get("train_metrics"),
+            test_metrics=model_data.get("test_metrics")
+        )
+        for model_name, model_data in result["models"].items()
+    }
+
+    return TrainResponse(
+        models=models,
+        trained_at=result["trained_at"],
+        training_samples=result["training_samples"],
+        test_samples=result["test_samples"],
+        version=result.get("version"),
+        output_mode=result.get("output_mode", "wrapped"),
+        parallel=result["parallel"],
+        workers=result["workers"],
+        fit_wall_time=result["fit_wall_time"],
+        update_mode=result.get("update_mode", "full"),
+        full_retrain_reason=result.get("full_retrain_reason"),
+        incremental_updates=result.get("incremental_updates"),
+        drift=result.get("drift"),
+        memory=result.get("memory")
+    )
+
+
+def _to_train_job_status(job: Job) -> TrainJobStatus:
+    """Convert a training job to the API schema."""
+    job_data = job.to_dict()
+    result = job_data.pop("result")
+    return TrainJobStatus(
+        **job_data,
+        result=_to_train_response(result) if result is not None else None
+    )
 
-        models = {
-            model_name: ModelTrainResult(
-                train_accuracy=model_data["train_accuracy"],
-                test_accuracy=model_data["test_accuracy"],
-                trained=model_data["trained"]
+
+@router.get("/models", response_model=APIResponse[List[ModelZooEntry]])
+async def list_models():
+    """List the model zoo and which families are configured for training."""
+    return APIResponse(
+        status="success",
+        data=[ModelZooEntry(**spec.to_dict()) for spec in MODEL_ZOO.values()]
+    )
+
+
+@router.get("/features", response_model=APIResponse[List[FeatureGroupEntry]])
+async def list_feature_groups():
+    """List the feature groups and which configured models consume them."""
+    model_groups = {model_name: model_feature_groups(model_name) for model_name in enabled_models()}
+    return APIResponse(
+        status="success",
+        data=[
+            FeatureGroupEntry(
+                **group.to_dict(),
+                used_by=[model_name for model_name, groups in model_groups.items() if name in groups]
             )
-            for model_name, model_data in result["models"].items()
-        }
+            for name, group in FEATURE_GROUPS.items()
+        ]
+    )
 
-        return APIResponse(
-            status="success",
-            data=TrainResponse(
-                models=models,
-                trained_at=result["trained_at"],
-                training_samples=result["training_samples"],
-                test_samples=result["test_samples"]
-            ),
-            message="모델 학습 완료"
+
+@router.get("/resources", response_model=APIResponse[ResourcePolicyStatus])
+async def get_resources():
+    """Get the training resource policy and the CPUs it resolves to."""
+    return APIResponse(status="success", data=ResourcePolicyStatus(**resource_policy.to_dict()))
+
+
+@router.post("/train", response_model=APIResponse[TrainJobStatus])
+async def train(
+    output_mode: Optional[str] = Query(None, description="wrapped or native (default: TRAIN_OUTPUT_MODE)")
+):
+    """Start ML model training as a background job (joins the running one if any)."""
+    if get_total_draws() < 10:
+        raise HTTPException(
+            status_code=400,
+            detail="Not enough data to train models. Please sync data first."
         )
-    except ValueError as e:
+    if output_mode is not None and output_mode not in OUTPUT_MODES:
         raise HTTPException(
             status_code=400,
-            detail=str(e)
+            detail=f"알 수 없는 출력 모드입니다: {output_mode}"
         )
-    except Exception as e:
+
+    job, created = job_manager.submit(
+        "train",
+        lambda ctx: train_models(progress=ctx.report, output_mode=output_mode)
+    )
+
+    return APIResponse(
+        status="success",
+        data=_to_train_job_status(job),
+        message="모델 학습 작업을 시작했습니다" if created else "이미 진행 중인 학습 작업에 연결되었습니다"
+    )
+
+
+@router.post("/train/update", response_model=APIResponse[TrainJobStatus])
+async def update_trained_models(full: bool = Query(False, description="Force a full retrain")):
+    """Incrementally update the models with draws added since the last training."""
+    if get_total_draws() < 10:
         raise HTTPException(
-            status_code=500,
-            detail=f"모델 학습 중 오류가 발생했습니다: {str(e)}"
+            status_code=400,
+            detail="Not enough data to train models. Please sync data first."
+        )
+
+    job, created = job_manager.submit("train", lambda ctx: update_models(progress=ctx.report, force_full=full))
+
+    return APIResponse(
+        status="success",
+        data=_to_train_job_status(job),
+        message="모델 업데이트 작업을 시작했습니다" if created else "이미 진행 중인 학습 작업에 연결되었습니다"
+    )
+
+
+def _get_job(job_id: str, kind: str, label: str) -> Job:
+    """Get a job of the given kind or raise 404."""
+    job = job_manager.get(job_id)
+    if job is None or job.kind != kind:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{label} 작업 {job_id}을(를) 찾을 수 없습니다."
         )
+    return job
+
+
+def _check_model_name(model_name: str) -> None:
+    """Raise 400 for an unknown model family."""
+    if model_name not in MODEL_ZOO:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 모델입니다: {model_name}"
+        )
+
+
+@router.get("/train/{job_id}", response_model=APIResponse[TrainJobStatus])
+async def get_train_job(job_id: str):
+    """Get training job phase, progress and elapsed time."""
+    job = _get_job(job_id, "train", "학습")
+    return APIResponse(status="success", data=_to_train_job_status(job))
+
+
+@router.post("/train/{job_id}/cancel", response_model=APIResponse[TrainJobStatus])
+async def cancel_train_job(job_id: str):
+    """Request cancellation of a running training job."""
+    job = _get_job(job_id, "train", "학습")
+    job_manager.cancel(job_id)
+
+    return APIResponse(
+        status="success",
+        data=_to_train_job_status(job),
+        message="학습 취소를 요청했습니다" if not job.done else "이미 종료된 학습 작업입니다"
+    )
+
+
+@router.post("/compare", response_model=APIResponse[CompareJobStatus])
+async def compare_modes():
+    """Compare wrapped and native multi-output models as a background job."""
+    if get_total_draws() < 10:
+        raise HTTPException(
+            status_code=400,
+            detail="Not enough data to train models. Please sync data first."
+        )
+
+    job, created = job_manager.submit("compare", lambda ctx: compare_output_modes(progress=ctx.report))
+
+    return APIResponse(
+        status="success",
+        data=CompareJobStatus(**job.to_dict()),
+        message="출력 모드 비교 작업을 시작했습니다" if created else "이미 진행 중인 비교 작업에 연결되었습니다"
+    )
+
+
+@router.get("/compare/{job_id}", response_model=APIResponse[CompareJobStatus])
+async def get_compare_job(job_id: str):
+    """Get comparison job progress and, once completed, the report."""
+    job = _get_job(job_id, "compare", "비교")
+    return APIResponse(status="success", data=CompareJobStatus(**job.to_dict()))
+
+
+@router.post("/backtest", response_model=APIResponse[BacktestJobStatus])
+async def backtest(request: BacktestRequest):
+    """Start a walk-forward backtest as a background job."""
+    _check_model_name(request.model)
+
+    job, created = job_manager.submit(
+        "backtest",
+        lambda ctx: run_backtest(
+            model_name=request.model,
+            step=request.step,
+            min_train=request.min_train,
+            progress=ctx.report
+        ),
+        key=f"backtest:{request.model}:{request.step}:{request.min_train}"
+    )
+
+    return APIResponse(
+        status="success",
+        data=BacktestJobStatus(**job.to_dict()),
+        message="백테스트 작업을 시작했습니다" if created else "동일한 백테스트 작업이 이미 진행 중입니다"
+    )
+
+
+@router.get("/backtest/{job_id}", response_model=APIResponse[BacktestJobStatus])
+async def get_backtest_job(job_id: str):
+    """Get backtest job progress and, once completed, its draw-by-draw results."""
+    job = _get_job(job_id, "backtest", "백테스트")
+    return APIResponse(status="success", data=BacktestJobStatus(**job.to_dict()))
+
+
+@router.post("/backtest/{job_id}/cancel", response_model=APIResponse[BacktestJobStatus])
+async def cancel_backtest_job(job_id: str):
+    """Request cancellation of a running backtest job."""
+    job = _get_job(job_id, "backtest", "백테스트")
+    job_manager.cancel(job_id)
+
+    return APIResponse(
+        status="success",
+        data=BacktestJobStatus(**job.to_dict()),
+        message="백테스트 취소를 요청했습니다" if not job.done else "이미 종료된 백테스트 작업입니다"
+    )
+
+
+@router.post("/search", response_model=APIResponse[SearchJobStatus])
+async def search(request: SearchRequest):
+    """Start a hyperparameter search as a background job."""
+    _check_model_name(request.model)
+
+    job, created = job_manager.submit(
+        "search",
+        lambda ctx: run_search(
+            model_name=request.model,
+            method=request.method,
+            n_iter=request.n_iter,
+            n_splits=request.n_splits,
+            progress=ctx.report
+        ),
+        key=f"search:{request.model}"
+    )
+
+    return APIResponse(
+        status="success",
+        data=SearchJobStatus(**job.to_dict()),
+        message="하이퍼파라미터 탐색 작업을 시작했습니다" if created else "이미 진행 중인 탐색 작업에 연결되었습니다"
+    )
+
+
+@router.get("/search/leaderboard/{model_name}", response_model=APIResponse[SearchResult])
+async def get_search_leaderboard(model_name: str):
+    """Get the last persisted search leaderboard of a model family."""
+    _check_model_name(model_name)
+
+    result = load_leaderboard(model_name)
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{model_name} 모델의 탐색 결과가 없습니다."
+        )
+    return APIResponse(status="success", data=SearchResult(**result))
+
+
+@router.post("/search/promote", response_model=APIResponse[TrainJobStatus])
+async def promote_search_result(request: PromoteRequest):
+    """Retrain with a leaderboard entry's parameters and publish it (runs as a training job)."""
+    _check_model_name(request.model)
+    if request.model not in enabled_models():
+        raise HTTPException(
+            status_code=400,
+            detail=f"학습 대상(MODEL_SET)에 없는 모델입니다: {request.model}"
+        )
+
+    result = load_leaderboard(request.model)
+    if result is None or not any(entry["rank"] == request.rank for entry in result["leaderboard"]):
+        raise HTTPException(
+            status_code=404,
+            detail=f"{request.model} 모델의 {request.rank}위 탐색 결과가 없습니다."
+        )
+
+    job, created = job_manager.submit(
+        "train",
+        lambda ctx: promote(request.model, rank=request.rank, progress=ctx.report)
+    )
+
+    return APIResponse(
+        status="success",
+        data=_to_train_job_status(job),
+        message="탐색 결과로 모델 학습을 시작했습니다" if created else "이미 진행 중인 학습 작업이 있습니다"
+    )
+
+
+@router.get("/search/{job_id}", response_model=APIResponse[SearchJobStatus])
+async def get_search_job(job_id: str):
+    """Get search job progress and, once completed, its leaderboard."""
+    job = _get_job(job_id, "search", "탐색")
+    return APIResponse(status="success", data=SearchJobStatus(**job.to_dict()))
+
+
+@router.post("/search/{job_id}/cancel", response_model=APIResponse[SearchJobStatus])
+async def cancel_search_job(job_id: str):
+    """Request cancellation of a running search job."""
+    job = _get_job(job_id, "search", "탐색")
+    job_manager.cancel(job_id)
+
+    return APIResponse(
+        status="success",
+        data=SearchJobStatus(**job.to_dict()),
+        message="탐색 취소를 요청했습니다" if not job.done else "이미 종료된 탐색 작업입니다"
+    )
 
 
 @router.get("/status", response_model=APIResponse[StatusResponse])
@@ -148,7 +450,11 @@ async def get_status():
             ml_models=MLModelStatus(
                 trained=ml_status["trained"],
                 last_trained=ml_status.get("last_trained"),
-                models_available=ml_status.get("models_available", [])
-            )
+                models_available=ml_status.get("models_available", []),
+                version=ml_status.get("version"),
+                loaded_at=ml_status.get("loaded_at"),
+                compiled_models=ml_status.get("compiled_models", [])
+            ),
+            prediction_cache=PredictionCacheStatus(**ml_status["prediction_cache"])
         )
     )
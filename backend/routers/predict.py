@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
 
-from models.schemas import APIResponse, PredictionResponse, ModelPrediction
-from services.ml_service import predict_numbers
+from fastapi import APIRouter, HTTPException, Query
+
+from models.schemas import APIResponse, AsOfPredictionResponse, PredictionResponse, ModelPrediction, TicketsResponse
+from services.ml_service import predict_as_of, predict_numbers
+from services.ticket_service import MAX_TICKETS, generate_tickets
 
 router = APIRouter()
 
@@ -38,3 +41,44 @@ async def get_predictions():
             status_code=500,
             detail=f"예측 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.get("/predict/as-of", response_model=APIResponse[AsOfPredictionResponse])
+async def get_predictions_as_of(
+    from_draw: int = Query(..., ge=1, description="First draw to predict"),
+    to_draw: int = Query(..., ge=1, description="Last draw to predict")
+):
+    """Get what the models predict for each draw in a range from the history before it."""
+    try:
+        result = predict_as_of(from_draw, to_draw)
+        return APIResponse(status="success", data=AsOfPredictionResponse(**result))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"예측 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/predict/tickets", response_model=APIResponse[TicketsResponse])
+async def get_tickets(
+    count: int = Query(5, ge=1, le=MAX_TICKETS, description="Number of tickets"),
+    seed: Optional[int] = Query(None, ge=0, description="Generator seed for reproducible tickets")
+):
+    """Draw tickets from the per-number scores of the model ensemble."""
+    try:
+        return APIResponse(status="success", data=TicketsResponse(**generate_tickets(count, seed)))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"번호 생성 중 오류가 발생했습니다: {str(e)}"
+        )
@@ -1,37 +1,78 @@
-from typing import Optional
-from fastapi import APIRouter, Query
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, HTTPException, Query
 
-from models.schemas import APIResponse, StatisticsResponse, SumDistribution, ConsecutiveStats
-from services.statistics_service import calculate_statistics
+from models.schemas import (
+    APIResponse,
+    ConsecutiveStats,
+    MultiStatisticsResponse,
+    StatisticsResponse,
+    SumDistribution
+)
+from services.statistics_service import calculate_multi_statistics, calculate_statistics, parse_windows
 
 router = APIRouter()
 
 
+def _statistics_response(stats: Dict[str, Any]) -> StatisticsResponse:
+    """Convert a statistics dictionary to the response model."""
+    return StatisticsResponse(
+        number_frequency=stats["number_frequency"],
+        odd_even_distribution=stats["odd_even_distribution"],
+        sum_distribution=SumDistribution(
+            ranges=stats["sum_distribution"]["ranges"],
+            counts=stats["sum_distribution"]["counts"]
+        ),
+        consecutive_stats=ConsecutiveStats(
+            has_consecutive=stats["consecutive_stats"]["has_consecutive"],
+            no_consecutive=stats["consecutive_stats"]["no_consecutive"]
+        ),
+        section_distribution=stats["section_distribution"],
+        total_draws=stats["total_draws"]
+    )
+
+
 @router.get("/statistics", response_model=APIResponse[StatisticsResponse])
 async def get_statistics(
     recent: Optional[int] = Query(
         None,
         ge=1,
         description="Number of recent draws to analyze (default: all)"
+    ),
+    from_draw: Optional[int] = Query(None, ge=1, description="First draw to analyze"),
+    to_draw: Optional[int] = Query(None, ge=1, description="Last draw to analyze")
+):
+    """Get comprehensive lotto statistics (over a draw range with from_draw/to_draw)."""
+    try:
+        stats = calculate_statistics(recent=recent, from_draw=from_draw, to_draw=to_draw)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+
+    return APIResponse(status="success", data=_statistics_response(stats))
+
+
+@router.get("/statistics/multi", response_model=APIResponse[MultiStatisticsResponse])
+async def get_multi_statistics(
+    windows: str = Query(
+        "all",
+        description="Comma-separated windows: latest N draws or 'all' (e.g. 10,50,100,all)"
     )
 ):
-    """Get comprehensive lotto statistics."""
-    stats = calculate_statistics(recent=recent)
+    """Get statistics of several windows in one request and one pass over the data."""
+    try:
+        result = calculate_multi_statistics(parse_windows(windows))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
 
     return APIResponse(
         status="success",
-        data=StatisticsResponse(
-            number_frequency=stats["number_frequency"],
-            odd_even_distribution=stats["odd_even_distribution"],
-            sum_distribution=SumDistribution(
-                ranges=stats["sum_distribution"]["ranges"],
-                counts=stats["sum_distribution"]["counts"]
-            ),
-            consecutive_stats=ConsecutiveStats(
-                has_consecutive=stats["consecutive_stats"]["has_consecutive"],
-                no_consecutive=stats["consecutive_stats"]["no_consecutive"]
-            ),
-            section_distribution=stats["section_distribution"],
-            total_draws=stats["total_draws"]
+        data=MultiStatisticsResponse(
+            windows={key: _statistics_response(stats) for key, stats in result["windows"].items()},
+            latest_draw=result["latest_draw"]
         )
     )
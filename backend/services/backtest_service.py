@@ -0,0 +1,172 @@
+"""
+Walk-forward backtesting of the ML models.
+Retrains every `step` draws on all earlier draws, predicts the following
+draws and scores each ticket with the lottery rank rules.
+"""
+
+import hashlib
+import json
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.preprocessing import StandardScaler
+
+from config import MODEL_PATH, TRAIN_OUTPUT_MODE
+from services.draw_store import get_draw_store
+from services.evaluation_service import hit_counts, postprocess_batch
+from services.ml_service import base_estimator, build_models, single_threaded
+from services.model_zoo import model_feature_groups
+from services.parallel import create_process_pool
+from services.simulation_service import check_winner_rank
+
+BACKTEST_DIR = "backtests"
+MIN_FIRST_ROW = 5  # Feature rows need 5 previous draws
+BACKTEST_SEED = 42
+
+# Data shared with pool workers (set once per worker by the initializer)
+_worker_data: Dict[str, np.ndarray] = {}
+
+
+def _init_backtest_worker(X: np.ndarray, y: np.ndarray, bonus: np.ndarray) -> None:
+    """Pool initializer: receive the precomputed feature matrix once per worker."""
+    _worker_data.update(X=X, y=y, bonus=bonus)
+
+
+def _run_fold(estimator: Any, start: int, end: int) -> Dict[str, List[int]]:
+    """Train on rows [5, start) and score predictions for rows [start, end)."""
+    X, y, bonus = _worker_data["X"], _worker_data["y"], _worker_data["bonus"]
+
+    scaler = StandardScaler()
+    X_train = scaler.fit_transform(X[MIN_FIRST_ROW:start])
+    estimator.fit(X_train, y[MIN_FIRST_ROW:start])
+
+    raw = estimator.predict(scaler.transform(X[start:end]))
+    tickets = postprocess_batch(raw, np.random.default_rng([BACKTEST_SEED, start]))
+    ranks = [
+        check_winner_rank(ticket, actual, int(bonus_no))
+        for ticket, actual, bonus_no in zip(tickets.tolist(), y[start:end].tolist(), bonus[start:end])
+    ]
+    return {
+        "tickets": tickets.tolist(),
+        "hits": hit_counts(tickets, y[start:end]).tolist(),
+        "ranks": ranks
+    }
+
+
+def _config_key(model_name: str, estimator: Any, step: int, min_train: int, groups: Tuple[str, ...]) -> str:
+    """Stable identifier of a backtest configuration."""
+    params = {k: repr(v) for k, v in sorted(estimator.get_params().items())}
+    payload = json.dumps([model_name, params, step, min_train, BACKTEST_SEED, list(groups)], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _fold_bounds(n: int, step: int, min_train: int) -> List[Tuple[int, int]]:
+    """Walk-forward folds as (start, end) row ranges."""
+    return [(start, min(start + step, n)) for start in range(min_train, n, step)]
+
+
+def _prefix_fingerprints(numbers: np.ndarray, bonus: np.ndarray, ends: List[int]) -> Dict[int, str]:
+    """Digest of the draw history up to each fold end, in one pass."""
+    digest = hashlib.sha1()
+    fingerprints: Dict[int, str] = {}
+    position = 0
+    for end in sorted(set(ends)):
+        digest.update(np.ascontiguousarray(numbers[position:end]).tobytes())
+        digest.update(np.ascontiguousarray(bonus[position:end]).tobytes())
+        fingerprints[end] = digest.copy().hexdigest()
+        position = end
+    return fingerprints
+
+
+def run_backtest(
+    model_name: str = "random_forest",
+    step: int = 10,
+    min_train: int = 100,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[str, float], None]] = None,
+    cache_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Run a walk-forward backtest for one model family.
+    Models are built in the training output mode, so the backtest scores the
+    estimator that is trained and served. Fold results are cached on disk
+    per configuration and keyed by a fingerprint of the draws they saw, so
+    after a sync only new folds run.
+    """
+    report = progress or (lambda phase, fraction: None)
+    models = build_models(model_names=[model_name], output_mode=TRAIN_OUTPUT_MODE)
+    if step < 1:
+        raise ValueError("step must be at least 1")
+
+    report("loading_data", 0.0)
+    store = get_draw_store()
+    n = len(store)
+    min_train = max(min_train, MIN_FIRST_ROW + 10)
+    if n <= min_train:
+        raise ValueError("Not enough data to backtest. Please sync data first.")
+
+    # One feature matrix (the model's feature groups) shared by every fold
+    groups = model_feature_groups(model_name)
+    X = store.feature_matrix(groups)[:n]
+    y = store.numbers.astype(np.int64)
+    bonus = store.bonus.astype(np.int64)
+
+    estimator = models[model_name]
+    single_threaded(base_estimator(estimator))  # The pool provides the parallelism
+
+    cache_path = (cache_dir or MODEL_PATH / BACKTEST_DIR) / f"{_config_key(model_name, estimator, step, min_train, groups)}.pkl"
+    cache: Dict[str, Any] = joblib.load(cache_path) if cache_path.exists() else {}
+
+    folds = _fold_bounds(n, step, min_train)
+    fingerprints = _prefix_fingerprints(y, bonus, [end for _, end in folds])
+    fold_keys = {(start, end): f"{start}:{end}:{fingerprints[end]}" for start, end in folds}
+    pending = [fold for fold in folds if fold_keys[fold] not in cache]
+
+    report("backtesting", 0.05)
+    if pending:
+        pool = create_process_pool(workers, initializer=_init_backtest_worker, initargs=(X, y, bonus))
+        try:
+            futures = {pool.submit(_run_fold, clone(estimator), start, end): (start, end) for start, end in pending}
+            for done, future in enumerate(as_completed(futures), start=1):
+                cache[fold_keys[futures[future]]] = future.result()
+                report("backtesting", 0.05 + 0.9 * done / len(futures))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # Keep only folds of the current history
+        cache = {key: cache[key] for key in fold_keys.values()}
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(cache, cache_path)
+
+    report("summarizing", 0.95)
+    draws: List[Dict[str, Any]] = []
+    for start, end in folds:
+        fold = cache[fold_keys[(start, end)]]
+        for offset, row in enumerate(range(start, end)):
+            draws.append({
+                "draw_no": int(store.draw_no[row]),
+                "numbers": fold["tickets"][offset],
+                "hits": fold["hits"][offset],
+                "rank": fold["ranks"][offset]
+            })
+
+    hits = np.array([draw["hits"] for draw in draws], dtype=np.int64)
+    ranks = np.array([draw["rank"] for draw in draws], dtype=np.int64)
+    return {
+        "model": model_name,
+        "output_mode": TRAIN_OUTPUT_MODE,
+        "step": step,
+        "min_train": min_train,
+        "folds": len(folds),
+        "computed_folds": len(pending),
+        "cached_folds": len(folds) - len(pending),
+        "draws_evaluated": len(draws),
+        "mean_hits": round(float(hits.mean()), 4) if len(hits) else 0.0,
+        "hit_distribution": {str(h): int(c) for h, c in enumerate(np.bincount(hits, minlength=7))},
+        "rank_counts": {str(r): int(c) for r, c in enumerate(np.bincount(ranks, minlength=6))},
+        "draws": draws
+    }
@@ -7,6 +7,8 @@ from typing import Optional, Dict, List, Tuple, Any
 from sqlalchemy.orm import Session
 from database import get_db
 from services.db_service import LottoDBService
+from services.ml_service import refresh_prediction_cache
+from services.incremental_service import schedule_model_update
 import pandas as pd
 
 
@@ -25,6 +27,18 @@ def fetch_lotto_result(draw_no: int) -> Optional[Dict[str, Any]]:
     return LottoDBService.fetch_lotto_result_from_api(draw_no)
 
 
+def _after_sync(synced_count: int, update_models: bool = False) -> None:
+    """Refresh derived caches (and optionally the models) once new draws arrived."""
+    if synced_count <= 0:
+        return
+    try:
+        refresh_prediction_cache()
+    except Exception as e:
+        print(f"Error refreshing prediction cache: {e}")
+    if update_models:
+        schedule_model_update()
+
+
 def update_data() -> Tuple[int, int]:
     """Update data by fetching new draws from API and saving to database."""
     db = next(get_db())
@@ -41,6 +55,7 @@ def update_data() -> Tuple[int, int]:
             end_draw=current_draw
         )
 
+        _after_sync(synced_count, update_models=True)
         return synced_count, final_latest
 
     finally:
@@ -60,6 +75,7 @@ def sync_full() -> Tuple[int, int]:
             end_draw=current_draw
         )
 
+        _after_sync(synced_count)
         return synced_count, latest_draw
 
     finally:
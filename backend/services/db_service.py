@@ -7,15 +7,37 @@ from typing import List, Optional, Tuple, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, asc, func, and_
 from database import LottoResult, SystemInfo, get_db
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import requests
+import threading
 from config import DHLOTTERY_API_URL
+from services.feature_store import FeatureStore
+from services.number_index import DrawNumberIndex, number_frequency
+from services.snapshot_service import load_snapshot
+from services.statistics_store import StatisticsStore
 
 
 class LottoDBService:
     """Service class for database operations."""
 
+    # Process-wide data version, bumped by every write path
+    _data_version = 0
+    _version_lock = threading.Lock()
+
+    @staticmethod
+    def get_data_version() -> int:
+        """Get current data version (changes whenever draws are written)."""
+        return LottoDBService._data_version
+
+    @staticmethod
+    def bump_data_version() -> int:
+        """Invalidate in-memory caches of the draw history."""
+        with LottoDBService._version_lock:
+            LottoDBService._data_version += 1
+            return LottoDBService._data_version
+
     @staticmethod
     def get_total_draws(db: Session) -> int:
         """Get total number of draws in database."""
@@ -66,26 +88,19 @@ class LottoDBService:
 
     @staticmethod
     def get_all_draws_for_ml(db: Session) -> pd.DataFrame:
-        """Get all draws as pandas DataFrame for ML processing."""
-        results = db.query(LottoResult).order_by(asc(LottoResult.draw_no)).all()
-
-        if not results:
+        """Get all draws as pandas DataFrame for ML processing (from the columnar snapshot)."""
+        snapshot = load_snapshot(db)
+        if not len(snapshot["draw_no"]):
             return pd.DataFrame()
 
-        data = []
-        for result in results:
-            data.append({
-                'draw_no': result.draw_no,
-                'draw_date': result.draw_date,
-                'num1': result.num1,
-                'num2': result.num2,
-                'num3': result.num3,
-                'num4': result.num4,
-                'num5': result.num5,
-                'num6': result.num6,
-                'bonus': result.bonus,
-                'prize_1st': result.prize_1st
-            })
+        data = {
+            'draw_no': snapshot["draw_no"].astype(np.int64),
+            'draw_date': snapshot["draw_date"].astype(object)
+        }
+        for j in range(6):
+            data[f'num{j + 1}'] = snapshot["numbers"][:, j].astype(np.int64)
+        data['bonus'] = snapshot["bonus"].astype(np.int64)
+        data['prize_1st'] = snapshot["prize_1st"]
 
         return pd.DataFrame(data)
 
@@ -112,8 +127,14 @@ class LottoDBService:
         )
 
         db.add(draw)
+        DrawNumberIndex.add(db, draw)
+        StatisticsStore.on_draw_added(db, draw)
         db.commit()
         db.refresh(draw)
+
+        # Compute only the new feature row and the next-draw vector
+        FeatureStore.on_draw_added(db, draw)
+        LottoDBService.bump_data_version()
         return draw
 
     @staticmethod
@@ -223,18 +244,9 @@ class LottoDBService:
 
     @staticmethod
     def get_number_frequency(db: Session) -> Dict[int, int]:
-        """Get frequency of each lotto number (1-45)."""
-        frequency = {}
-
-        # Count each number position
-        for i in range(1, 7):  # num1 to num6
-            column = getattr(LottoResult, f'num{i}')
-            results = db.query(column).all()
-            for result in results:
-                number = result[0]
-                frequency[number] = frequency.get(number, 0) + 1
-
-        return frequency
+        """Get frequency of each lotto number (1-45), counted by SQLite."""
+        DrawNumberIndex.ensure_synced(db)
+        return number_frequency(db)
 
     @staticmethod
     def get_statistics(db: Session) -> Dict[str, Any]:
@@ -263,7 +275,11 @@ class LottoDBService:
         try:
             deleted_count = db.query(LottoResult).count()
             db.query(LottoResult).delete()
+            DrawNumberIndex.clear(db)
+            StatisticsStore.clear(db)
             db.commit()
+            FeatureStore.clear(db)
+            LottoDBService.bump_data_version()
             print(f"Cleared {deleted_count} draws from database")
             return deleted_count
         except Exception as e:
@@ -277,8 +293,12 @@ class LottoDBService:
         try:
             draw = db.query(LottoResult).filter(LottoResult.draw_no == draw_no).first()
             if draw:
+                StatisticsStore.on_draw_removed(db, draw)
                 db.delete(draw)
+                DrawNumberIndex.remove(db, draw_no)
                 db.commit()
+                FeatureStore.rebuild(db)
+                LottoDBService.bump_data_version()
                 return True
             return False
         except Exception as e:
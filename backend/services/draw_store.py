@@ -0,0 +1,165 @@
+"""
+Process-wide in-memory store of the draw history.
+Loaded once as compact NumPy arrays and reloaded only when the data version
+bumped by LottoDBService write paths changes.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from config import SNAPSHOT_PATH
+from database import SessionLocal
+from services.db_service import LottoDBService
+from services.feature_service import DEFAULT_FEATURE_GROUPS, FEATURE_GROUPS, build_feature_matrix, feature_width
+from services.snapshot_service import load_snapshot
+from services.statistics_store import prefix_totals
+
+
+def number_masks(numbers: np.ndarray) -> np.ndarray:
+    """Encode each draw's numbers as a 45-bit mask (bit k-1 set for number k)."""
+    bits = np.left_shift(np.int64(1), np.asarray(numbers, dtype=np.int64) - 1)
+    return np.bitwise_or.reduce(bits, axis=1) if len(bits) else np.empty(0, dtype=np.int64)
+
+
+class DrawStore:
+    """Immutable snapshot of the draw history as NumPy arrays."""
+
+    def __init__(
+        self,
+        draw_no: np.ndarray,
+        draw_dates: np.ndarray,
+        numbers: np.ndarray,
+        bonus: np.ndarray,
+        features: np.ndarray,
+        version: int
+    ):
+        self.draw_no = draw_no        # int16 (n,)
+        self.draw_dates = draw_dates  # object (n,) YYYY-MM-DD
+        self.numbers = numbers        # uint8 (n, 6), num1..num6 order
+        self.bonus = bonus            # uint8 (n,)
+        self.masks = number_masks(numbers)  # int64 (n,) 45-bit mask
+        self.features = features      # float32 (n + 1, 79), last row is next draw
+        self.version = version
+        # Feature groups beyond the default matrix and the statistics prefix
+        # sums, computed on first use
+        self._groups: Dict[str, np.ndarray] = {}
+        self._groups_lock = threading.Lock()
+        self._statistics_prefix: Optional[np.ndarray] = None
+
+        for array in (self.draw_no, self.draw_dates, self.numbers, self.bonus, self.masks, self.features):
+            array.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.draw_no)
+
+    @property
+    def latest_draw_no(self) -> Optional[int]:
+        """Latest draw number, or None when empty."""
+        return int(self.draw_no[-1]) if len(self) else None
+
+    def feature_group(self, name: str) -> np.ndarray:
+        """
+        Columns of one feature group for every draw index, (n + 1, width).
+        Default groups are views of `features`; other groups are computed
+        lazily and cached for the lifetime of this data version.
+        """
+        if name in DEFAULT_FEATURE_GROUPS:
+            offset = feature_width(DEFAULT_FEATURE_GROUPS[:DEFAULT_FEATURE_GROUPS.index(name)])
+            return self.features[:, offset:offset + FEATURE_GROUPS[name].width]
+
+        columns = self._groups.get(name)
+        if columns is None:
+            with self._groups_lock:
+                columns = self._groups.get(name)
+                if columns is None:
+                    columns = build_feature_matrix(self.numbers, dtype=np.float32, groups=[name])
+                    columns.setflags(write=False)
+                    self._groups[name] = columns
+        return columns
+
+    def feature_matrix(self, groups: Sequence[str] = DEFAULT_FEATURE_GROUPS, rows: Any = None) -> np.ndarray:
+        """Feature rows (all rows by default) built from `groups`, in the given group order."""
+        if tuple(groups) == DEFAULT_FEATURE_GROUPS:
+            return self.features if rows is None else self.features[rows]
+        return np.hstack([
+            self.feature_group(name) if rows is None else self.feature_group(name)[rows]
+            for name in groups
+        ])
+
+    def statistics_prefix(self) -> np.ndarray:
+        """
+        Cumulative statistics totals, (n + 1, TOTALS_WIDTH): the totals of
+        draw indices [i, j) are row j minus row i (see statistics_store).
+        """
+        prefix = self._statistics_prefix
+        if prefix is None:
+            with self._groups_lock:
+                prefix = self._statistics_prefix
+                if prefix is None:
+                    prefix = prefix_totals(self.numbers)
+                    prefix.setflags(write=False)
+                    self._statistics_prefix = prefix
+        return prefix
+
+    def fingerprint(self) -> str:
+        """Content digest of the draw history (stable across restarts)."""
+        digest = hashlib.sha1()
+        for array in (self.draw_no, self.numbers, self.bonus):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def latest_result(self) -> Optional[Dict[str, Any]]:
+        """Latest draw as a result dictionary."""
+        if not len(self):
+            return None
+        return {
+            "draw_no": int(self.draw_no[-1]),
+            "draw_date": self.draw_dates[-1],
+            "numbers": sorted(int(n) for n in self.numbers[-1]),
+            "bonus": int(self.bonus[-1])
+        }
+
+    @classmethod
+    def load(cls, version: int) -> "DrawStore":
+        """Load the draw history from the columnar snapshot (rebuilt from the database when stale)."""
+        db = SessionLocal()
+        try:
+            snapshot = load_snapshot(db, SNAPSHOT_PATH)
+        finally:
+            db.close()
+
+        return cls(
+            draw_no=snapshot["draw_no"],
+            draw_dates=snapshot["draw_date"].astype(object),
+            numbers=snapshot["numbers"],
+            bonus=snapshot["bonus"],
+            features=snapshot["features"],
+            version=version
+        )
+
+
+_store: Optional[DrawStore] = None
+_store_lock = threading.Lock()
+
+
+def get_draw_store() -> DrawStore:
+    """Get the shared DrawStore, reloading it if the data version changed."""
+    global _store
+    version = LottoDBService.get_data_version()
+    store = _store
+    if store is not None and store.version == version:
+        return store
+
+    with _store_lock:
+        if _store is None or _store.version != version:
+            _store = DrawStore.load(version)
+        return _store
+
+
+def invalidate_draw_store() -> None:
+    """Drop the cached store (e.g. after out-of-band database writes)."""
+    global _store
+    with _store_lock:
+        _store = None
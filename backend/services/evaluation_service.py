@@ -0,0 +1,115 @@
+"""
+Vectorized model evaluation engine.
+Computes the full family of metrics from a single `predict` call per split.
+"""
+
+import pickle
+import time
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+MAX_TOLERANCE = 5
+EVAL_SEED = 42
+LATENCY_REPEAT = 20
+
+
+def postprocess_batch(raw: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Batched equivalent of `ml_service._postprocess_prediction`.
+    Rounds and clips every row to 1-45, drops duplicates and fills each row
+    with random distinct numbers up to 6; returns sorted (m, 6) tickets.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    raw = np.atleast_2d(np.asarray(raw, dtype=np.float64))
+    numbers = np.clip(np.round(raw), 1, 45).astype(np.int64)
+
+    chosen = np.zeros((len(numbers), 45), dtype=bool)
+    chosen[np.arange(len(numbers))[:, None], numbers - 1] = True
+
+    # Predicted numbers always rank first; random keys order the fill candidates
+    keys = rng.random(chosen.shape)
+    keys[chosen] = 2.0
+    top = np.argpartition(-keys, 5, axis=1)[:, :6]
+    return np.sort(top + 1, axis=1)
+
+
+def hit_counts(tickets: np.ndarray, actual: np.ndarray) -> np.ndarray:
+    """Number of actual numbers matched by each ticket (0-6)."""
+    tickets = np.atleast_2d(tickets)
+    actual = np.atleast_2d(actual)
+    rows = np.arange(len(tickets))[:, None]
+
+    ticket_mask = np.zeros((len(tickets), 46), dtype=bool)
+    ticket_mask[rows, tickets] = True
+    actual_mask = np.zeros((len(actual), 46), dtype=bool)
+    actual_mask[np.arange(len(actual))[:, None], actual] = True
+    return (ticket_mask & actual_mask).sum(axis=1)
+
+
+def winner_ranks(tickets: np.ndarray, actual: np.ndarray, bonus: np.ndarray) -> np.ndarray:
+    """
+    Batched equivalent of `simulation_service.check_winner_rank`:
+    1-5 prize rank of each ticket (0 = no prize).
+    """
+    tickets = np.atleast_2d(tickets)
+    hits = hit_counts(tickets, actual)
+    has_bonus = (tickets == np.asarray(bonus)[:, None]).any(axis=1)
+
+    ranks = np.zeros(len(tickets), dtype=np.int64)
+    ranks[hits == 3] = 5
+    ranks[hits == 4] = 4
+    ranks[hits == 5] = np.where(has_bonus[hits == 5], 2, 3)
+    ranks[hits == 6] = 1
+    return ranks
+
+
+def evaluate_predictions(
+    predictions: np.ndarray,
+    y: np.ndarray,
+    rng: Optional[np.random.Generator] = None
+) -> Dict[str, Any]:
+    """
+    Compute evaluation metrics for raw (n, 6) predictions against targets.
+
+    - accuracy_within: share of positions with |round(pred) - actual| <= k, k = 0..5
+    - hit_distribution: draws by set-overlap hits (0-6) after post-processing
+    - position_mae: mean absolute error per number position
+    """
+    predictions = np.atleast_2d(np.asarray(predictions, dtype=np.float64))
+    y = np.atleast_2d(np.asarray(y, dtype=np.int64))
+    if predictions.size == 0:
+        return {
+            "accuracy_within": {str(k): 0.0 for k in range(MAX_TOLERANCE + 1)},
+            "hit_distribution": {str(h): 0 for h in range(7)},
+            "position_mae": [0.0] * 6
+        }
+
+    errors = np.abs(np.round(predictions) - y)
+    within = (errors[None, :, :] <= np.arange(MAX_TOLERANCE + 1)[:, None, None]).mean(axis=(1, 2))
+
+    rng = rng if rng is not None else np.random.default_rng(EVAL_SEED)
+    hits = hit_counts(postprocess_batch(predictions, rng), y)
+    distribution = np.bincount(hits, minlength=7)
+
+    return {
+        "accuracy_within": {str(k): round(float(within[k]), 4) for k in range(MAX_TOLERANCE + 1)},
+        "hit_distribution": {str(h): int(distribution[h]) for h in range(7)},
+        "position_mae": [round(float(v), 4) for v in np.abs(predictions - y).mean(axis=0)]
+    }
+
+
+def predict_latency_ms(predict: Callable[[np.ndarray], Any], row: np.ndarray, repeat: int = LATENCY_REPEAT) -> float:
+    """Median single-row predict latency in milliseconds."""
+    predict(row)  # Warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        predict(row)
+        timings.append(time.perf_counter() - start)
+    return round(float(np.median(timings)) * 1000, 3)
+
+
+def model_size_bytes(model: Any) -> int:
+    """Serialized size of a fitted model."""
+    return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
@@ -0,0 +1,217 @@
+"""
+Vectorized feature-matrix engine for ML processing.
+Features are declared as named groups; the default groups are the 79
+features of `ml_service.extract_features`. Each group is built for every
+draw at once.
+"""
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+N_FEATURES = 79
+N_PREV_DRAWS = 5
+FREQ_WINDOW = 100
+NUMBER_COLUMNS = [f'num{j}' for j in range(1, 7)]
+
+
+def to_number_matrix(df: pd.DataFrame) -> np.ndarray:
+    """Convert draws DataFrame to an (n, 6) number matrix in num1..num6 order."""
+    if df is None or len(df) == 0:
+        return np.empty((0, 6), dtype=np.int64)
+    return df[NUMBER_COLUMNS].to_numpy(dtype=np.int64)
+
+
+def incidence_matrix(numbers: np.ndarray) -> np.ndarray:
+    """Build (n, 45) draw-incidence array (1 where number was drawn)."""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    incidence = np.zeros((len(numbers), 45), dtype=np.int32)
+    rows = np.repeat(np.arange(len(numbers)), numbers.shape[1])
+    np.add.at(incidence, (rows, numbers.ravel() - 1), 1)
+    return incidence
+
+
+class FeatureGroup:
+    """Named block of feature columns computed for every draw index at once."""
+
+    def __init__(self, name: str, width: int, compute: Callable[[np.ndarray, np.ndarray], None], description: str):
+        self.name = name
+        self.width = width
+        self.compute = compute  # Fills `out` (n + 1, width) from the (n, 6) number matrix
+        self.description = description
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {"name": self.name, "width": self.width, "description": self.description}
+
+
+def _prev_draws(numbers: np.ndarray, out: np.ndarray) -> None:
+    # Shifted views of the number matrix
+    n = len(numbers)
+    for i in range(1, min(N_PREV_DRAWS, n) + 1):
+        out[i:, (i - 1) * 6:i * 6] = numbers[:n + 1 - i]
+
+
+def _odd_even(numbers: np.ndarray, out: np.ndarray) -> None:
+    out[0, 0] = 0.5
+    out[1:, 0] = (numbers % 2 == 1).sum(axis=1) / 6
+
+
+def _high_low(numbers: np.ndarray, out: np.ndarray) -> None:
+    out[0, 0] = 0.5
+    out[1:, 0] = (numbers > 23).sum(axis=1) / 6
+
+
+def _mean_std(numbers: np.ndarray, out: np.ndarray) -> None:
+    out[0] = [23.0, 10.0]
+    if len(numbers):
+        out[1:, 0] = numbers.mean(axis=1)
+        out[1:, 1] = numbers.std(axis=1)
+
+
+def _frequency(numbers: np.ndarray, out: np.ndarray) -> None:
+    counts, window_len = rolling_window_counts(numbers)
+    np.divide(counts, window_len[:, None], out=out, where=window_len[:, None] > 0)
+
+
+def _gaps(numbers: np.ndarray, out: np.ndarray) -> None:
+    # Draws since each number last appeared (idx + 1 when never drawn)
+    n = len(numbers)
+    seen = np.full((n + 1, 45), -1, dtype=np.int64)
+    seen[1:] = np.where(incidence_matrix(numbers) > 0, np.arange(n)[:, None], -1)
+    np.maximum.accumulate(seen, axis=0, out=seen)
+    out[:] = np.arange(n + 1)[:, None] - seen
+
+
+def _pair_counts(numbers: np.ndarray, out: np.ndarray) -> None:
+    # Times each number was drawn together with a number of the previous
+    # draw, over the FREQ_WINDOW draws before it
+    n = len(numbers)
+    incidence = incidence_matrix(numbers)
+    for offset in range(1, min(FREQ_WINDOW, n - 1) + 1):
+        # Row idx pairs the previous draw idx - 1 with draw idx - 1 - offset
+        previous, earlier = incidence[offset:], incidence[:n - offset]
+        shared = (previous * earlier).sum(axis=1)
+        out[offset + 1:] += shared[:, None] * earlier
+
+
+FEATURE_GROUPS: Dict[str, FeatureGroup] = {
+    group.name: group for group in [
+        FeatureGroup("prev_draws", 30, _prev_draws, "Numbers of the previous 5 draws"),
+        FeatureGroup("odd_even", 1, _odd_even, "Odd share of the previous draw"),
+        FeatureGroup("high_low", 1, _high_low, "High (24-45) share of the previous draw"),
+        FeatureGroup("mean_std", 2, _mean_std, "Mean and std of the previous draw"),
+        FeatureGroup("frequency", 45, _frequency, "Each number's frequency in the recent 100 draws"),
+        FeatureGroup("gaps", 45, _gaps, "Draws since each number last appeared"),
+        FeatureGroup("pair_counts", 45, _pair_counts, "Co-occurrences with the previous draw's numbers in the 100 draws before it"),
+    ]
+}
+
+# The 79 features of `extract_features`, in column order
+DEFAULT_FEATURE_GROUPS: Tuple[str, ...] = ("prev_draws", "odd_even", "high_low", "mean_std", "frequency")
+
+
+def resolve_feature_groups(groups: Sequence[str]) -> Tuple[str, ...]:
+    """Validate group names; returns them in registry order without duplicates."""
+    unknown = [name for name in groups if name not in FEATURE_GROUPS]
+    if unknown:
+        raise ValueError(f"Unknown feature groups: {', '.join(unknown)}")
+    if not groups:
+        raise ValueError("At least one feature group is required.")
+    return tuple(name for name in FEATURE_GROUPS if name in groups)
+
+
+def feature_width(groups: Sequence[str]) -> int:
+    """Number of columns of a matrix built from `groups`."""
+    return sum(FEATURE_GROUPS[name].width for name in groups)
+
+
+def group_columns(groups: Sequence[str], selected: Sequence[str]) -> np.ndarray:
+    """Column indices of the `selected` groups within a matrix built from `groups`."""
+    columns = []
+    offset = 0
+    for name in groups:
+        width = FEATURE_GROUPS[name].width
+        if name in selected:
+            columns.extend(range(offset, offset + width))
+        offset += width
+    return np.array(columns, dtype=np.int64)
+
+
+def model_columns(groups: Sequence[str], model_groups: Dict[str, Sequence[str]]) -> Dict[str, np.ndarray]:
+    """
+    Column indices, within a matrix built from `groups`, of each model that
+    consumes only some of them (models absent from the result use every column).
+    """
+    return {
+        model_name: group_columns(groups, own)
+        for model_name, own in model_groups.items()
+        if tuple(own) != tuple(groups)
+    }
+
+
+def build_feature_matrix(
+    numbers: np.ndarray,
+    dtype: Any = np.float64,
+    groups: Sequence[str] = DEFAULT_FEATURE_GROUPS
+) -> np.ndarray:
+    """
+    Build the feature matrix for every draw index in one pass.
+
+    Row `idx` holds the features of draw index idx from the draws before it,
+    for idx in 0..n, so the result has n + 1 rows and the last row holds the
+    next-draw features. With the default groups row `idx` equals
+    `extract_features(df, idx)`. Every group is written into one
+    preallocated matrix of `dtype`.
+    """
+    numbers = np.asarray(numbers, dtype=np.int64).reshape(-1, 6)
+    features = np.zeros((len(numbers) + 1, feature_width(groups)), dtype=dtype)
+
+    offset = 0
+    for name in groups:
+        group = FEATURE_GROUPS[name]
+        group.compute(numbers, features[:, offset:offset + group.width])
+        offset += group.width
+    return features
+
+
+def rolling_window_counts(numbers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-index number counts over the preceding 100 draws via cumulative sums."""
+    numbers = np.asarray(numbers, dtype=np.int64).reshape(-1, 6)
+    n = len(numbers)
+    cumulative = np.zeros((n + 1, 45), dtype=np.int64)
+    np.cumsum(incidence_matrix(numbers), axis=0, out=cumulative[1:])
+
+    idx = np.arange(n + 1)
+    start = np.maximum(0, idx - FREQ_WINDOW)
+    return cumulative[idx] - cumulative[start], idx - start
+
+
+def feature_row(prev_numbers: np.ndarray, window_counts: np.ndarray, window_len: int) -> np.ndarray:
+    """
+    Build a single feature row from its inputs.
+
+    `prev_numbers` holds up to 5 previous draws, most recent first, and
+    `window_counts` the number counts over the last `window_len` draws.
+    """
+    prev_numbers = np.asarray(prev_numbers, dtype=np.int64).reshape(-1, 6)[:N_PREV_DRAWS]
+    row = np.zeros(N_FEATURES, dtype=np.float64)
+    row[:len(prev_numbers) * 6] = prev_numbers.ravel()
+
+    if len(prev_numbers) > 0:
+        last = prev_numbers[0]
+        row[30:34] = [(last % 2 == 1).sum() / 6, (last > 23).sum() / 6, last.mean(), last.std()]
+    else:
+        row[30:34] = [0.5, 0.5, 23.0, 10.0]
+
+    if window_len > 0:
+        row[34:] = np.asarray(window_counts) / window_len
+
+    return row
+
+
+def build_features_from_df(df: pd.DataFrame, indices: Optional[np.ndarray] = None) -> np.ndarray:
+    """Build feature rows for a draws DataFrame (all indices 0..n by default)."""
+    features = build_feature_matrix(to_number_matrix(df))
+    return features if indices is None else features[indices]
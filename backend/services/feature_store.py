@@ -0,0 +1,158 @@
+"""
+Persistent ML feature store keyed by draw_no.
+Keeps one feature row per stored draw plus the row for the upcoming draw,
+updated incrementally when draws are appended.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import asc, desc
+from sqlalchemy.orm import Session
+
+from database import LottoFeature, LottoResult
+from services.feature_service import (
+    FREQ_WINDOW,
+    N_FEATURES,
+    N_PREV_DRAWS,
+    build_feature_matrix,
+    feature_row,
+    incidence_matrix,
+    rolling_window_counts,
+)
+
+
+def _numbers_of(result: LottoResult) -> List[int]:
+    """Get main numbers in num1..num6 column order."""
+    return [result.num1, result.num2, result.num3, result.num4, result.num5, result.num6]
+
+
+def _encode_row(draw_no: int, features: np.ndarray, counts: np.ndarray, window_len: int, is_next: bool) -> dict:
+    """Encode a feature row as column values."""
+    return {
+        "draw_no": int(draw_no),
+        "is_next": is_next,
+        "features": np.asarray(features, dtype=np.float64).tobytes(),
+        "window_counts": np.asarray(counts, dtype=np.int32).tobytes(),
+        "window_len": int(window_len),
+    }
+
+
+class FeatureStore:
+    """Service class for feature store operations."""
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute every feature row from the draw table."""
+        rows = db.query(
+            LottoResult.draw_no,
+            LottoResult.num1, LottoResult.num2, LottoResult.num3,
+            LottoResult.num4, LottoResult.num5, LottoResult.num6
+        ).order_by(asc(LottoResult.draw_no)).all()
+
+        db.query(LottoFeature).delete()
+        if not rows:
+            db.commit()
+            return 0
+
+        draw_nos = np.array([row[0] for row in rows], dtype=np.int64)
+        numbers = np.array([row[1:] for row in rows], dtype=np.int64)
+        features = build_feature_matrix(numbers)
+        counts, window_len = rolling_window_counts(numbers)
+
+        keys = np.append(draw_nos, draw_nos[-1] + 1)
+        db.bulk_insert_mappings(LottoFeature, [
+            _encode_row(keys[i], features[i], counts[i], window_len[i], is_next=(i == len(draw_nos)))
+            for i in range(len(keys))
+        ])
+        db.commit()
+        return len(keys)
+
+    @staticmethod
+    def clear(db: Session) -> None:
+        """Remove all feature rows."""
+        db.query(LottoFeature).delete()
+        db.commit()
+
+    @staticmethod
+    def is_synced(db: Session) -> bool:
+        """Check that the store covers exactly the stored draws plus the next draw."""
+        total_draws = db.query(LottoResult).count()
+        total_rows = db.query(LottoFeature).filter(LottoFeature.is_next.is_(False)).count()
+        pending = db.query(LottoFeature).filter(LottoFeature.is_next.is_(True)).count()
+        if total_draws == 0:
+            return total_rows == 0 and pending == 0
+        return total_rows == total_draws and pending == 1
+
+    @staticmethod
+    def ensure_synced(db: Session) -> None:
+        """Rebuild the store if it drifted from the draw table (e.g. bulk loads)."""
+        if not FeatureStore.is_synced(db):
+            FeatureStore.rebuild(db)
+
+    @staticmethod
+    def on_draw_added(db: Session, draw: LottoResult) -> None:
+        """
+        Update the store after a draw was inserted.
+        Appending the newest draw costs O(45); anything else triggers a rebuild.
+        """
+        pending = db.query(LottoFeature).filter(LottoFeature.is_next.is_(True)).first()
+        latest = db.query(LottoResult).order_by(desc(LottoResult.draw_no)).limit(N_PREV_DRAWS).all()
+        total_draws = db.query(LottoResult).count()
+        total_rows = db.query(LottoFeature).filter(LottoFeature.is_next.is_(False)).count()
+        position = total_draws - 1
+
+        if pending is None or latest[0].draw_no != draw.draw_no or total_rows != position:
+            FeatureStore.rebuild(db)
+            return
+
+        # The pending row already holds the new draw's features
+        pending.draw_no = draw.draw_no
+        pending.is_next = False
+
+        # Slide the rolling window: add the new draw, drop the one leaving it
+        counts = np.frombuffer(pending.window_counts, dtype=np.int32).astype(np.int64)
+        counts = counts + incidence_matrix([_numbers_of(draw)])[0]
+        window_len = pending.window_len + 1
+        if position >= FREQ_WINDOW:
+            leaving = db.query(LottoResult).order_by(desc(LottoResult.draw_no)).offset(FREQ_WINDOW).first()
+            counts = counts - incidence_matrix([_numbers_of(leaving)])[0]
+            window_len -= 1
+
+        prev_numbers = np.array([_numbers_of(result) for result in latest])
+        next_row = _encode_row(
+            draw.draw_no + 1, feature_row(prev_numbers, counts, window_len), counts, window_len, is_next=True
+        )
+        db.add(LottoFeature(**next_row))
+        db.commit()
+
+    @staticmethod
+    def get_feature_matrix(db: Session) -> np.ndarray:
+        """Get all feature rows ordered by draw_no; the last row is the next-draw vector."""
+        FeatureStore.ensure_synced(db)
+
+        blobs = db.query(LottoFeature.features).order_by(asc(LottoFeature.draw_no)).all()
+        return np.frombuffer(b"".join(blob[0] for blob in blobs), dtype=np.float64).reshape(-1, N_FEATURES)
+
+    @staticmethod
+    def get_training_rows(db: Session) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (X, y) for every draw with 5 previous draws, ordered by draw_no."""
+        X = FeatureStore.get_feature_matrix(db)[:-1]
+        targets = db.query(
+            LottoResult.num1, LottoResult.num2, LottoResult.num3,
+            LottoResult.num4, LottoResult.num5, LottoResult.num6
+        ).order_by(asc(LottoResult.draw_no)).all()
+        y = np.array(targets, dtype=np.int64).reshape(-1, 6)
+
+        # Start from index 5 (need 5 previous draws)
+        return X[N_PREV_DRAWS:], y[N_PREV_DRAWS:]
+
+    @staticmethod
+    def get_next_features(db: Session) -> Optional[np.ndarray]:
+        """Get the feature vector for the upcoming draw."""
+        FeatureStore.ensure_synced(db)
+
+        pending = db.query(LottoFeature).filter(LottoFeature.is_next.is_(True)).first()
+        if pending is None:
+            return None
+        return np.frombuffer(pending.features, dtype=np.float64).copy()
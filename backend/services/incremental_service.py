@@ -0,0 +1,194 @@
+"""
+Incremental model updates after new draws arrive.
+Instead of retraining from scratch, tree ensembles grow extra estimators
+with `warm_start` and MLPs take `partial_fit` steps on the new rows. A full
+retrain runs periodically and whenever the updated models drift too far
+from the metrics of the last full retrain.
+"""
+
+import copy
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import (
+    ExtraTreesRegressor,
+    GradientBoostingRegressor,
+    HistGradientBoostingRegressor,
+    RandomForestRegressor
+)
+from sklearn.model_selection import train_test_split
+from sklearn.multioutput import MultiOutputRegressor
+from sklearn.neural_network import MLPRegressor
+
+from config import (
+    INCREMENTAL_DRIFT_TOLERANCE,
+    INCREMENTAL_FULL_RETRAIN_EVERY,
+    INCREMENTAL_TREES,
+    INCREMENTAL_UPDATES
+)
+from services.draw_store import DrawStore, get_draw_store
+from services.evaluation_service import evaluate_predictions
+from services.job_service import Job, job_manager
+from services.ml_service import model_registry, refresh_prediction_cache, select_columns, train_models
+from services.model_registry import ModelBundle
+
+
+def _update_estimator(estimator: Any, X: np.ndarray, y: np.ndarray, X_new: np.ndarray, y_new: np.ndarray) -> None:
+    """Update one single- or multi-output regressor in place."""
+    if isinstance(estimator, (RandomForestRegressor, ExtraTreesRegressor, GradientBoostingRegressor)):
+        # New trees (forest) or boosting stages see every training row
+        estimator.set_params(warm_start=True, n_estimators=estimator.n_estimators + INCREMENTAL_TREES)
+        estimator.fit(X, y)
+        estimator.set_params(warm_start=False)
+    elif isinstance(estimator, HistGradientBoostingRegressor):
+        estimator.set_params(warm_start=True, max_iter=estimator.max_iter + INCREMENTAL_TREES)
+        estimator.fit(X, y)
+        estimator.set_params(warm_start=False)
+    elif isinstance(estimator, MLPRegressor):
+        # Early stopping only applies to full fits; partial_fit rejects it
+        early_stopping = estimator.early_stopping
+        estimator.set_params(early_stopping=False)
+        if getattr(estimator, "best_loss_", None) is None:
+            estimator.best_loss_ = np.inf  # Not tracked by early-stopped fits
+        estimator.partial_fit(X_new, y_new)
+        estimator.set_params(early_stopping=early_stopping)
+    else:
+        # Cheap baselines (Ridge, KNN) are simply refitted
+        estimator.fit(X, y)
+
+
+def _update_model(model: Any, X: np.ndarray, y: np.ndarray, X_new: np.ndarray, y_new: np.ndarray) -> None:
+    """Update a wrapped (per-position) or native model in place."""
+    if isinstance(model, MultiOutputRegressor):
+        for target, estimator in enumerate(model.estimators_):
+            _update_estimator(estimator, X, y[:, target], X_new, y_new[:, target])
+    else:
+        _update_estimator(model, X, y, X_new, y_new)
+
+
+def _full_retrain_reason(bundle: Optional[ModelBundle], store: DrawStore) -> Optional[str]:
+    """Why the next update has to be a full retrain (None: incremental is possible)."""
+    if bundle is None:
+        return "no_model"
+    info = bundle.training_info
+    trained_rows = info.get("trained_rows")
+    if trained_rows is None or "baseline_accuracies" not in info:
+        return "no_incremental_state"
+    if trained_rows > len(store) or int(store.draw_no[trained_rows - 1]) != info.get("latest_draw"):
+        return "history_changed"
+    if info.get("incremental_updates", 0) >= INCREMENTAL_FULL_RETRAIN_EVERY:
+        return "scheduled"
+    return None
+
+
+def _split_indices(trained_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Train/test row indices of the last full retrain (same split as train_models)."""
+    rows = np.arange(5, trained_rows)
+    train_idx, test_idx = train_test_split(rows, test_size=0.2, random_state=42)
+    return np.sort(train_idx), test_idx
+
+
+def update_models(
+    progress: Optional[Callable[[str, float], None]] = None,
+    force_full: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Bring the served models up to date with the draw history.
+    Runs an incremental update when possible and falls back to a full
+    retrain on schedule, when the history changed or when drift is detected.
+    Returns None when the models already cover every draw.
+    """
+    report = progress or (lambda phase, fraction: None)
+
+    report("loading_data", 0.0)
+    bundle = model_registry.get()
+    store = get_draw_store()
+    reason = "forced" if force_full else _full_retrain_reason(bundle, store)
+    if reason is not None:
+        return {**train_models(progress=progress), "update_mode": "full", "full_retrain_reason": reason}
+
+    info = bundle.training_info
+    trained_rows = info["trained_rows"]
+    if trained_rows == len(store):
+        return None
+
+    # The scaler stays frozen so the updated models keep their input space
+    train_idx, test_idx = _split_indices(trained_rows)
+    new_idx = np.arange(trained_rows, len(store))
+    train_idx = np.concatenate([train_idx, new_idx])
+    X = bundle.scaled_features(store, train_idx)
+    y = store.numbers[train_idx].astype(np.int64)
+    X_new = bundle.scaled_features(store, new_idx)
+    y_new = store.numbers[new_idx].astype(np.int64)
+    X_test = bundle.scaled_features(store, test_idx)
+    y_test = store.numbers[test_idx].astype(np.int64)
+
+    models = copy.deepcopy(bundle.models)
+    results: Dict[str, Any] = {}
+    model_accuracies: Dict[str, Dict[str, float]] = {}
+    drift: Dict[str, float] = {}
+    fit_start = time.perf_counter()
+    for i, (model_name, model) in enumerate(models.items()):
+        report("updating", 0.05 + 0.85 * i / len(models))
+        columns = bundle.columns.get(model_name)
+        start = time.perf_counter()
+        _update_model(model, select_columns(X, columns), y, select_columns(X_new, columns), y_new)
+        fit_time = time.perf_counter() - start
+
+        train_metrics = evaluate_predictions(model.predict(select_columns(X, columns)), y)
+        test_metrics = evaluate_predictions(model.predict(select_columns(X_test, columns)), y_test)
+        train_acc = train_metrics["accuracy_within"]["3"]
+        test_acc = test_metrics["accuracy_within"]["3"]
+        results[model_name] = {
+            "train_accuracy": train_acc,
+            "test_accuracy": test_acc,
+            "trained": True,
+            "fit_time": round(fit_time, 3),
+            "train_metrics": train_metrics,
+            "test_metrics": test_metrics
+        }
+        model_accuracies[model_name] = {"train_accuracy": train_acc, "test_accuracy": test_acc}
+        baseline = info["baseline_accuracies"].get(model_name, {}).get("test_accuracy", test_acc)
+        drift[model_name] = round(baseline - test_acc, 4)
+    fit_wall_time = time.perf_counter() - fit_start
+
+    # Drift check against the last full retrain on the same test rows
+    if max(drift.values()) > INCREMENTAL_DRIFT_TOLERANCE:
+        return {**train_models(progress=progress), "update_mode": "full", "full_retrain_reason": "drift"}
+
+    report("saving", 0.95)
+    training_info = {
+        **info,
+        "trained_at": datetime.now().isoformat(),
+        "training_samples": len(train_idx),
+        "trained_rows": len(store),
+        "latest_draw": store.latest_draw_no,
+        "incremental_updates": info.get("incremental_updates", 0) + 1
+    }
+    published = model_registry.publish(bundle.scaler, models, training_info, model_accuracies)
+    refresh_prediction_cache()
+
+    return {
+        "models": results,
+        "trained_at": training_info["trained_at"],
+        "training_samples": training_info["training_samples"],
+        "test_samples": len(test_idx),
+        "version": published.version,
+        "output_mode": info.get("output_mode", "wrapped"),
+        "parallel": False,
+        "workers": 1,
+        "fit_wall_time": round(fit_wall_time, 3),
+        "update_mode": "incremental",
+        "incremental_updates": training_info["incremental_updates"],
+        "drift": drift
+    }
+
+
+def schedule_model_update() -> Optional[Job]:
+    """Start a background model update after a sync (joins a running training job)."""
+    if not INCREMENTAL_UPDATES or model_registry.get() is None:
+        return None
+    job, _ = job_manager.submit("train", lambda ctx: update_models(progress=ctx.report))
+    return job
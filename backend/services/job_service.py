@@ -0,0 +1,161 @@
+"""
+Background job runner for long CPU-bound admin work (training etc.).
+Jobs run on a worker thread so the event loop keeps serving requests.
+"""
+
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from services.parallel import resource_policy
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+class JobContext:
+    """Handle passed to a running job for progress reporting and cancellation."""
+
+    def __init__(self, job: "Job"):
+        self._job = job
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job.cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise JobCancelled if cancellation was requested."""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, phase: str, progress: float) -> None:
+        """Report current phase and progress (0.0 - 1.0); acts as a cancellation point."""
+        self._job.phase = phase
+        self._job.progress = max(0.0, min(1.0, progress))
+        self.check_cancelled()
+
+
+class Job:
+    """State of a single background job."""
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"  # queued, running, completed, failed, cancelled
+        self.phase = "queued"
+        self.progress = 0.0
+        self.result: Optional[Any] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now().isoformat()
+        self.cancel_event = threading.Event()
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started running."""
+        if self._started is None:
+            return 0.0
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return round(end - self._started, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "phase": self.phase,
+            "progress": round(self.progress, 4),
+            "elapsed": self.elapsed,
+            "created_at": self.created_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+class JobManager:
+    """
+    Runs jobs on background threads.
+    At most one job per kind (or per explicit single-flight key) runs at a
+    time; concurrent submissions are coalesced into the running job.
+    """
+
+    def __init__(self, history: int = 50):
+        self._jobs: Dict[str, Job] = {}
+        self._active: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._history = history
+
+    def submit(self, kind: str, fn: Callable[[JobContext], Any], key: Optional[str] = None) -> Tuple[Job, bool]:
+        """Start `fn` as a background job; returns (job, created)."""
+        key = key or kind
+        with self._lock:
+            active_id = self._active.get(key)
+            if active_id is not None and active_id in self._jobs and not self._jobs[active_id].done:
+                return self._jobs[active_id], False
+
+            job = Job(kind)
+            self._jobs[job.id] = job
+            self._active[key] = job.id
+            self._prune()
+
+        thread = threading.Thread(target=self._run, args=(job, fn), name=f"job-{kind}-{job.id[:8]}", daemon=True)
+        thread.start()
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get job by id."""
+        return self._jobs.get(job_id)
+
+    def get_active(self, key: str) -> Optional[Job]:
+        """Get the running job for a kind or single-flight key, if any."""
+        job_id = self._active.get(key)
+        job = self._jobs.get(job_id) if job_id else None
+        return job if job is not None and not job.done else None
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; the job stops at its next cancellation point."""
+        job = self._jobs.get(job_id)
+        if job is not None and not job.done:
+            job.cancel_event.set()
+        return job
+
+    def _run(self, job: Job, fn: Callable[[JobContext], Any]) -> None:
+        job.status = "running"
+        job.phase = "starting"
+        job._started = time.perf_counter()
+        try:
+            # Jobs are CPU-bound ML work; keep them within the training budget
+            with resource_policy.governed():
+                result = fn(JobContext(job))
+            job._finished = time.perf_counter()
+            job.result = result
+            job.progress = 1.0
+            job.phase = "done"
+            job.status = "completed"
+        except JobCancelled:
+            job._finished = time.perf_counter()
+            job.phase = "cancelled"
+            job.status = "cancelled"
+        except Exception as e:
+            print(f"Job {job.kind} {job.id} failed: {e}")
+            job._finished = time.perf_counter()
+            job.error = str(e)
+            job.status = "failed"
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond the history limit."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(self._jobs) - self._history)]:
+            del self._jobs[job_id]
+
+
+job_manager = JobManager()
@@ -1,18 +1,39 @@
 import numpy as np
 import pandas as pd
-import joblib
 import random
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from concurrent.futures import as_completed
 from datetime import datetime
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.neural_network import MLPRegressor
 from sklearn.preprocessing import StandardScaler
 from sklearn.multioutput import MultiOutputRegressor
 from sklearn.model_selection import train_test_split
-
-from config import MODEL_PATH
-from services.data_service import get_all_results_df
+from sklearn.base import clone
+
+from config import TRAIN_OUTPUT_MODE, TRAIN_PARALLEL, TRAIN_TRACE_MEMORY
+from services.draw_store import DrawStore, get_draw_store
+from services.evaluation_service import (
+    evaluate_predictions,
+    hit_counts,
+    model_size_bytes,
+    postprocess_batch,
+    predict_latency_ms,
+    winner_ranks
+)
+from services.feature_service import (
+    DEFAULT_FEATURE_GROUPS,
+    build_feature_matrix,
+    feature_width,
+    model_columns,
+    resolve_feature_groups,
+    to_number_matrix
+)
+from services.model_zoo import MODEL_ZOO, enabled_models, model_feature_groups
+from services.model_registry import ModelBundle, model_registry
+from services.prediction_cache import prediction_cache
+from services.parallel import create_process_pool, resolve_workers
 
 
 def extract_features(df: pd.DataFrame, idx: int) -> List[float]:
@@ -67,185 +88,462 @@ def extract_features(df: pd.DataFrame, idx: int) -> List[float]:
 
 
 def prepare_training_data(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
-    """Prepare training data (X, y) from dataframe."""
-    X: List[List[float]] = []
-    y: List[List[int]] = []
+    """Prepare training data (X, y) from dataframe; X is float32."""
+    numbers = to_number_matrix(df)
 
     # Start from index 5 (need 5 previous draws)
-    for idx in range(5, len(df)):
-        features = extract_features(df, idx)
-        targets = [df.iloc[idx][f'num{j}'] for j in range(1, 7)]
-        X.append(features)
-        y.append(targets)
-
-    return np.array(X), np.array(y)
-
+    X = build_feature_matrix(numbers, dtype=np.float32)[5:len(numbers)]
+    y = numbers[5:]
 
-def train_models() -> Dict[str, Any]:
-    """Train all ML models and save them."""
-    MODEL_PATH.mkdir(parents=True, exist_ok=True)
+    return X, y
 
-    df = get_all_results_df()
-    if len(df) < 10:
-        raise ValueError("Not enough data to train models. Please sync data first.")
-
-    X, y = prepare_training_data(df)
 
-    # Train/Test split (80/20) for proper evaluation
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
+OUTPUT_MODES = ["wrapped", "native"]
 
-    # Scale features
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
 
-    # Save scaler
-    joblib.dump(scaler, MODEL_PATH / "scaler.pkl")
+def build_models(
+    params: Optional[Dict[str, Dict[str, Any]]] = None,
+    output_mode: str = "wrapped",
+    model_names: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Build the (unfitted) model families from the model zoo.
+    `model_names` defaults to the configured MODEL_SET.
+    "wrapped" fits one regressor per number position (MultiOutputRegressor);
+    "native" fits a single multi-output regressor where the model family
+    supports it. `params` maps a model name to hyperparameter overrides.
+    """
+    if output_mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode: {output_mode}")
+    model_names = enabled_models() if model_names is None else model_names
+    params = params or {}
 
-    results: Dict[str, Any] = {}
-
-    # Train Random Forest (reduced complexity)
-    rf_model = MultiOutputRegressor(
-        RandomForestRegressor(
-            n_estimators=100,
-            max_depth=6,  # Reduced from 10
-            min_samples_split=10,  # Added to prevent overfitting
-            min_samples_leaf=5,  # Added to prevent overfitting
-            random_state=42,
-            n_jobs=-1
-        )
+    models: Dict[str, Any] = {}
+    for model_name in model_names:
+        if model_name not in MODEL_ZOO:
+            raise ValueError(f"Unknown model: {model_name}")
+        spec = MODEL_ZOO[model_name]
+        estimator = spec.build()
+        if params.get(model_name):
+            estimator.set_params(**params[model_name])
+        native = output_mode == "native" and spec.native_multi_output
+        models[model_name] = estimator if native else MultiOutputRegressor(estimator)
+    return models
+
+
+def base_estimator(model: Any) -> Any:
+    """The underlying regressor of a wrapped model, or the model itself when native."""
+    return model.estimator if isinstance(model, MultiOutputRegressor) else model
+
+
+def feature_plan(model_names: List[str]) -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, ...]]]:
+    """Union of the feature groups consumed by `model_names`, and each model's own groups."""
+    model_groups = {model_name: model_feature_groups(model_name) for model_name in model_names}
+    groups = resolve_feature_groups([group for own in model_groups.values() for group in own])
+    return groups, model_groups
+
+
+def select_columns(X: np.ndarray, columns: Optional[np.ndarray]) -> np.ndarray:
+    """A model's input columns of X (None: every column)."""
+    return X if columns is None else X[:, columns]
+
+
+def single_threaded(estimator: Any) -> Any:
+    """Disable estimator-level threading when a process pool provides the parallelism."""
+    if "n_jobs" in estimator.get_params():
+        estimator.set_params(n_jobs=1)
+    return estimator
+
+
+# Training data shared with pool workers (set once per worker by the initializer)
+_worker_X: Optional[np.ndarray] = None
+_worker_y: Optional[np.ndarray] = None
+
+
+def _init_fit_worker(X: np.ndarray, y: np.ndarray) -> None:
+    """Pool initializer: receive the training data once per worker process."""
+    global _worker_X, _worker_y
+    _worker_X, _worker_y = X, y
+
+
+def _fit_target(estimator: Any, target: Optional[int], columns: Optional[np.ndarray] = None) -> Tuple[Any, float]:
+    """Fit one estimator on one number position (None: all positions) inside a pool worker."""
+    start = time.perf_counter()
+    estimator.fit(select_columns(_worker_X, columns), _worker_y if target is None else _worker_y[:, target])
+    return estimator, time.perf_counter() - start
+
+
+def _fit_sequential(
+    models: Dict[str, Any],
+    X: np.ndarray,
+    y: np.ndarray,
+    on_fit: Callable[[int, int], None],
+    columns: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, float]:
+    """Fit each model in turn; returns per-model fit time."""
+    columns = columns or {}
+    fit_times: Dict[str, float] = {}
+    for i, (model_name, model) in enumerate(models.items()):
+        start = time.perf_counter()
+        model.fit(select_columns(X, columns.get(model_name)), y)
+        fit_times[model_name] = time.perf_counter() - start
+        on_fit(i + 1, len(models))
+    return fit_times
+
+
+def _fit_parallel(
+    models: Dict[str, Any],
+    X: np.ndarray,
+    y: np.ndarray,
+    workers: int,
+    on_fit: Callable[[int, int], None],
+    columns: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, float]:
+    """
+    Fan every (model, target) fit out over a process pool; native
+    multi-output models are fitted as a single task.
+    Returns per-model fit time (sum of its target fits).
+    """
+    columns = columns or {}
+    pool = create_process_pool(workers, initializer=_init_fit_worker, initargs=(X, y))
+    try:
+        futures = {}
+        for model_name, model in models.items():
+            targets = range(y.shape[1]) if isinstance(model, MultiOutputRegressor) else [None]
+            for target in targets:
+                estimator = single_threaded(clone(base_estimator(model)))
+                futures[(model_name, target)] = pool.submit(_fit_target, estimator, target, columns.get(model_name))
+
+        for done, _ in enumerate(as_completed(futures.values()), start=1):
+            on_fit(done, len(futures))
+
+        fit_times: Dict[str, float] = {}
+        for model_name, model in models.items():
+            if not isinstance(model, MultiOutputRegressor):
+                models[model_name], fit_times[model_name] = futures[(model_name, None)].result()
+                continue
+            fitted = [futures[(model_name, target)].result() for target in range(y.shape[1])]
+            model.estimators_ = [estimator for estimator, _ in fitted]
+            model.n_features_in_ = select_columns(X[:1], columns.get(model_name)).shape[1]
+            fit_times[model_name] = sum(elapsed for _, elapsed in fitted)
+    finally:
+        # Drop queued fits if we are leaving early (error or cancellation)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return fit_times
+
+
+SPLIT_CHUNK_ROWS = 16384
+
+
+def split_training_data(
+    store: DrawStore,
+    groups: Tuple[str, ...] = DEFAULT_FEATURE_GROUPS
+) -> Tuple[StandardScaler, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scaled 80/20 train/test split of the store's training rows over the
+    columns of the feature `groups`.
+    The rows are gathered once, in split order, into a preallocated float32
+    matrix; the train and test sets are views of it and are scaled in place.
+    """
+    # Train/Test split (80/20) of the row indices (start from index 5)
+    train_rows, test_rows = train_test_split(
+        np.arange(5, len(store)), test_size=0.2, random_state=42
     )
-    rf_model.fit(X_train_scaled, y_train)
-    joblib.dump(rf_model, MODEL_PATH / "random_forest.pkl")
-    rf_train_acc = evaluate_model(rf_model, X_train_scaled, y_train)
-    rf_test_acc = evaluate_model(rf_model, X_test_scaled, y_test)
-    results["random_forest"] = {
-        "train_accuracy": rf_train_acc,
-        "test_accuracy": rf_test_acc,
-        "trained": True
+    order = np.concatenate([train_rows, test_rows])
+
+    # Gather in chunks so only one chunk of fancy-indexed rows is live at a time
+    X = np.empty((len(order), feature_width(groups)), dtype=np.float32)
+    for start in range(0, len(order), SPLIT_CHUNK_ROWS):
+        rows = order[start:start + SPLIT_CHUNK_ROWS]
+        X[start:start + len(rows)] = store.feature_matrix(groups, rows)
+    y = store.numbers[order].astype(np.int64)
+
+    n_train = len(train_rows)
+    X_train, X_test = X[:n_train], X[n_train:]
+    y_train, y_test = y[:n_train], y[n_train:]
+
+    # Scale features in place (X is private to this call); the statistics
+    # are accumulated chunk by chunk, as a full fit upcasts X_train to float64
+    scaler = StandardScaler(copy=False)
+    for start in range(0, n_train, SPLIT_CHUNK_ROWS):
+        scaler.partial_fit(X_train[start:start + SPLIT_CHUNK_ROWS])
+    scaler.transform(X_train)
+    scaler.transform(X_test)
+    # The published scaler must not modify the caller's arrays
+    scaler.set_params(copy=True)
+    return scaler, X_train, X_test, y_train, y_test
+
+
+def _memory_usage(peak_bytes: Optional[int]) -> Dict[str, Optional[float]]:
+    """Peak traced allocation of the data pipeline (None: not traced) and the process max RSS, in MB."""
+    try:
+        import resource
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        max_rss_mb = round(max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:  # Not available on Windows
+        max_rss_mb = None
+    data_peak_mb = round(peak_bytes / (1024 * 1024), 1) if peak_bytes is not None else None
+    return {"data_peak_mb": data_peak_mb, "max_rss_mb": max_rss_mb}
+
+
+def train_models(
+    parallel: Optional[bool] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[str, float], None]] = None,
+    params: Optional[Dict[str, Dict[str, Any]]] = None,
+    output_mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Train all ML models and save them.
+    `progress(phase, fraction)` is called between steps; it may raise to abort
+    training, in which case no artifacts are written.
+    `params` are hyperparameter overrides per model, merged over those of the
+    current model version (e.g. a promoted search result); `{name: {}}`
+    resets a model to its defaults.
+    `output_mode` is "wrapped" or "native" (see `build_models`).
+    Only the feature groups consumed by the trained models are built.
+    """
+    current = model_registry.get()
+    params = {
+        **(current.training_info.get("params", {}) if current is not None else {}),
+        **(params or {})
     }
+    output_mode = output_mode or TRAIN_OUTPUT_MODE
+    parallel = TRAIN_PARALLEL if parallel is None else parallel
+    workers = resolve_workers(workers) if parallel else 1
+    report = progress or (lambda phase, fraction: None)
+
+    report("loading_data", 0.0)
+    store = get_draw_store()
+    if len(store) < 10:
+        raise ValueError("Not enough data to train models. Please sync data first.")
 
-    # Train Gradient Boosting (reduced complexity)
-    gb_model = MultiOutputRegressor(
-        GradientBoostingRegressor(
-            n_estimators=50,
-            max_depth=3,  # Reduced from 5
-            min_samples_split=10,  # Added
-            min_samples_leaf=5,  # Added
-            learning_rate=0.1,
-            random_state=42
-        )
-    )
-    gb_model.fit(X_train_scaled, y_train)
-    joblib.dump(gb_model, MODEL_PATH / "gradient_boosting.pkl")
-    gb_train_acc = evaluate_model(gb_model, X_train_scaled, y_train)
-    gb_test_acc = evaluate_model(gb_model, X_test_scaled, y_test)
-    results["gradient_boosting"] = {
-        "train_accuracy": gb_train_acc,
-        "test_accuracy": gb_test_acc,
-        "trained": True
-    }
+    groups, model_groups = feature_plan(enabled_models())
+    columns = model_columns(groups, model_groups)
+
+    # Peak memory of building the training matrices (opt-in; never touches another tracer)
+    trace = TRAIN_TRACE_MEMORY and not tracemalloc.is_tracing()
+    if trace:
+        tracemalloc.start()
+    try:
+        scaler, X_train_scaled, X_test_scaled, y_train, y_test = split_training_data(store, groups)
+        data_peak = tracemalloc.get_traced_memory()[1] if trace else None
+    finally:
+        if trace:
+            tracemalloc.stop()
+
+    # Fit all model families
+    report("fitting", 0.05)
+    models = build_models(params, output_mode)
+
+    def on_fit(done: int, total: int) -> None:
+        report("fitting", 0.05 + 0.8 * done / total)
+
+    fit_start = time.perf_counter()
+    if parallel:
+        fit_times = _fit_parallel(models, X_train_scaled, y_train, workers, on_fit, columns)
+    else:
+        fit_times = _fit_sequential(models, X_train_scaled, y_train, on_fit, columns)
+    fit_wall_time = time.perf_counter() - fit_start
 
-    # Train Neural Network (MLP) with regularization
-    mlp_model = MultiOutputRegressor(
-        MLPRegressor(
-            hidden_layer_sizes=(64, 32),  # Reduced from (128, 64, 32)
-            activation='relu',
-            alpha=0.01,  # L2 regularization
-            learning_rate='adaptive',
-            learning_rate_init=0.001,
-            max_iter=300,  # Reduced from 500
-            early_stopping=True,  # Stop when validation score stops improving
-            validation_fraction=0.15,
-            n_iter_no_change=20,
-            random_state=42
-        )
-    )
-    mlp_model.fit(X_train_scaled, y_train)
-    joblib.dump(mlp_model, MODEL_PATH / "neural_network.pkl")
-    mlp_train_acc = evaluate_model(mlp_model, X_train_scaled, y_train)
-    mlp_test_acc = evaluate_model(mlp_model, X_test_scaled, y_test)
-    results["neural_network"] = {
-        "train_accuracy": mlp_train_acc,
-        "test_accuracy": mlp_test_acc,
-        "trained": True
-    }
+    results: Dict[str, Any] = {}
+    model_accuracies: Dict[str, Dict[str, float]] = {}
+    for i, (model_name, model) in enumerate(models.items()):
+        report("evaluating", 0.85 + 0.1 * i / len(models))
+        # One predict call per split feeds every metric
+        own_columns = columns.get(model_name)
+        train_metrics = evaluate_predictions(model.predict(select_columns(X_train_scaled, own_columns)), y_train)
+        test_metrics = evaluate_predictions(model.predict(select_columns(X_test_scaled, own_columns)), y_test)
+        train_acc = train_metrics["accuracy_within"]["3"]
+        test_acc = test_metrics["accuracy_within"]["3"]
+        results[model_name] = {
+            "train_accuracy": train_acc,
+            "test_accuracy": test_acc,
+            "trained": True,
+            "fit_time": round(fit_times[model_name], 3),
+            "feature_groups": list(model_groups[model_name]),
+            "train_metrics": train_metrics,
+            "test_metrics": test_metrics
+        }
+        model_accuracies[model_name] = {"train_accuracy": train_acc, "test_accuracy": test_acc}
 
-    # Save training info
+    # Publish scaler and models as a new version (last cancellation point is before any write)
+    report("saving", 0.95)
     training_info = {
         "trained_at": datetime.now().isoformat(),
-        "training_samples": len(X_train),
-        "test_samples": len(X_test)
+        "training_samples": len(X_train_scaled),
+        "test_samples": len(X_test_scaled),
+        "params": params,
+        "output_mode": output_mode,
+        # Scaler columns and the groups each model consumes (see ModelBundle)
+        "feature_groups": list(groups),
+        "model_feature_groups": {model_name: list(own) for model_name, own in model_groups.items()},
+        # State for incremental updates (see incremental_service)
+        "trained_rows": len(store),
+        "latest_draw": store.latest_draw_no,
+        "incremental_updates": 0,
+        "baseline_accuracies": model_accuracies
     }
-    joblib.dump(training_info, MODEL_PATH / "training_info.pkl")
+    bundle = model_registry.publish(scaler, models, training_info, model_accuracies)
+    refresh_prediction_cache()
 
-    # Save model accuracies for prediction
-    model_accuracies = {
-        "random_forest": {"train_accuracy": rf_train_acc, "test_accuracy": rf_test_acc},
-        "gradient_boosting": {"train_accuracy": gb_train_acc, "test_accuracy": gb_test_acc},
-        "neural_network": {"train_accuracy": mlp_train_acc, "test_accuracy": mlp_test_acc}
-    }
-    joblib.dump(model_accuracies, MODEL_PATH / "model_accuracies.pkl")
+    # Serving cost of each model (single-row latency through the served path)
+    for model_name in results:
+        results[model_name]["predict_ms"] = predict_latency_ms(
+            lambda row: bundle.predict(model_name, row), X_test_scaled[:1]
+        )
+        results[model_name]["model_bytes"] = model_size_bytes(models[model_name])
 
     return {
         "models": results,
         "trained_at": training_info["trained_at"],
         "training_samples": training_info["training_samples"],
-        "test_samples": training_info["test_samples"]
+        "test_samples": training_info["test_samples"],
+        "version": bundle.version,
+        "output_mode": output_mode,
+        "parallel": parallel,
+        "workers": workers,
+        "fit_wall_time": round(fit_wall_time, 3),
+        "memory": _memory_usage(data_peak)
     }
 
 
 def evaluate_model(model: Any, X: np.ndarray, y: np.ndarray) -> float:
     """Evaluate model with ±3 accuracy metric."""
-    predictions = model.predict(X)
-    correct = 0
-    total = 0
+    return evaluate_predictions(model.predict(X), y)["accuracy_within"]["3"]
 
-    for i in range(len(predictions)):
-        for j in range(6):
-            pred = round(predictions[i][j])
-            actual = y[i][j]
-            if abs(pred - actual) <= 3:
-                correct += 1
-            total += 1
 
-    return round(correct / total, 4) if total > 0 else 0.0
+def predict_numbers() -> Dict[str, Any]:
+    """Generate predictions from all models (served from cache when current)."""
+    bundle = model_registry.get()
+    if bundle is None:
+        raise ValueError("Models not trained. Please train models first.")
+
+    store = get_draw_store()
+    if len(store) < 5:
+        raise ValueError("Not enough data for prediction.")
 
+    key = (store.latest_draw_no, bundle.version)
+    cached = prediction_cache.get(key)
+    if cached is not None:
+        return cached
 
-def predict_numbers() -> Dict[str, Any]:
-    """Generate predictions from all models."""
-    if not _models_exist():
+    result = _compute_predictions(bundle, store)
+    prediction_cache.put(key, result)
+    return result
+
+
+def refresh_prediction_cache() -> bool:
+    """Eagerly compute predictions for the current data and model version."""
+    bundle = model_registry.get()
+    store = get_draw_store()
+    if bundle is None or len(store) < 5:
+        prediction_cache.clear()
+        return False
+
+    prediction_cache.put((store.latest_draw_no, bundle.version), _compute_predictions(bundle, store))
+    return True
+
+
+MAX_AS_OF_DRAWS = 1000
+AS_OF_SEED = 42
+
+
+def predict_as_of(from_draw: int, to_draw: int) -> Dict[str, Any]:
+    """
+    Point-in-time predictions for every draw in [from_draw, to_draw]: what
+    the current models predict for each draw from the history before it.
+    The feature rows come from the store's precomputed matrix; each model
+    predicts the whole batch in one call. Draws that already happened are
+    scored against the actual result.
+    """
+    bundle = model_registry.get()
+    if bundle is None:
         raise ValueError("Models not trained. Please train models first.")
+    if from_draw > to_draw:
+        raise ValueError("from_draw must not be greater than to_draw.")
+    if to_draw - from_draw + 1 > MAX_AS_OF_DRAWS:
+        raise ValueError(f"At most {MAX_AS_OF_DRAWS} draws can be predicted at once.")
 
-    df = get_all_results_df()
-    if len(df) < 5:
+    store = get_draw_store()
+    if len(store) < 5:
         raise ValueError("Not enough data for prediction.")
 
-    # Get latest features
-    features = extract_features(df, len(df))
+    # Feature row i predicts store draw i; row len(store) predicts the next draw
+    draw_no = np.append(store.draw_no.astype(np.int64), store.latest_draw_no + 1)
+    rows = np.flatnonzero((draw_no >= from_draw) & (draw_no <= to_draw) & (np.arange(len(draw_no)) >= 5))
+    if not len(rows):
+        raise ValueError(f"No draws with 5 previous draws in range {from_draw}-{to_draw}.")
+
+    X = bundle.scaled_features(store, rows)
+    played = rows[rows < len(store)]
+    actual = store.numbers[played].astype(np.int64)
+    bonus = store.bonus[played].astype(np.int64)
+
+    tickets: Dict[str, np.ndarray] = {}
+    hits: Dict[str, np.ndarray] = {}
+    ranks: Dict[str, np.ndarray] = {}
+    for model_name in bundle.models:
+        raw = bundle.predict(model_name, X)
+        tickets[model_name] = postprocess_batch(raw, np.random.default_rng([AS_OF_SEED, from_draw, to_draw]))
+        hits[model_name] = hit_counts(tickets[model_name][:len(played)], actual)
+        ranks[model_name] = winner_ranks(tickets[model_name][:len(played)], actual, bonus)
+
+    trained_rows = bundle.training_info.get("trained_rows", len(store))
+    draws = []
+    for i, row in enumerate(rows.tolist()):
+        is_played = i < len(played)
+        draws.append({
+            "draw_no": int(draw_no[row]),
+            "actual": sorted(actual[i].tolist()) if is_played else None,
+            "bonus": int(bonus[i]) if is_played else None,
+            # Rows before trained_rows were available to training (train or test split)
+            "in_training_data": row < trained_rows,
+            "predictions": {
+                model_name: {
+                    "numbers": tickets[model_name][i].tolist(),
+                    "hits": int(hits[model_name][i]) if is_played else None,
+                    "rank": int(ranks[model_name][i]) if is_played else None
+                }
+                for model_name in bundle.models
+            }
+        })
+
+    summary = {
+        model_name: {
+            "mean_hits": round(float(hits[model_name].mean()), 4) if len(played) else 0.0,
+            "rank_counts": {str(r): int(c) for r, c in enumerate(np.bincount(ranks[model_name], minlength=6))}
+        }
+        for model_name in bundle.models
+    }
+
+    return {
+        "from_draw": from_draw,
+        "to_draw": to_draw,
+        "version": bundle.version,
+        "draws": draws,
+        "summary": summary,
+        "disclaimer": "로또는 무작위 추첨이므로 예측이 불가능합니다. 이 결과는 참고용입니다."
+    }
 
-    # Load scaler and scale features
-    scaler = joblib.load(MODEL_PATH / "scaler.pkl")
-    features_scaled = scaler.transform([features])
 
-    # Load training info and model accuracies
-    training_info = joblib.load(MODEL_PATH / "training_info.pkl")
-    model_accuracies = joblib.load(MODEL_PATH / "model_accuracies.pkl") if (MODEL_PATH / "model_accuracies.pkl").exists() else {}
+def _compute_predictions(bundle: ModelBundle, store: DrawStore) -> Dict[str, Any]:
+    """Run every model of the bundle on the next-draw features."""
+    # Get latest (next-draw) features and scale with the bundle's scaler
+    features_scaled = bundle.scaled_features(store, [-1])
 
     predictions: Dict[str, Any] = {}
 
-    model_names = ["random_forest", "gradient_boosting", "neural_network"]
-    for model_name in model_names:
-        model = joblib.load(MODEL_PATH / f"{model_name}.pkl")
-        raw_pred = model.predict(features_scaled)[0]
+    for model_name in bundle.models:
+        raw_pred = bundle.predict(model_name, features_scaled)[0]
 
         # Post-process predictions
         numbers = _postprocess_prediction(raw_pred)
 
         # Use saved test accuracy (not re-evaluated on full training data)
-        accuracy = model_accuracies.get(model_name, {}).get("test_accuracy", 0.0)
+        accuracy = bundle.model_accuracies.get(model_name, {}).get("test_accuracy", 0.0)
 
         predictions[model_name] = {
             "numbers": numbers,
@@ -255,7 +553,7 @@ def predict_numbers() -> Dict[str, Any]:
     return {
         "predictions": predictions,
         "disclaimer": "로또는 무작위 추첨이므로 예측이 불가능합니다. 이 결과는 참고용입니다.",
-        "last_trained": training_info.get("trained_at")
+        "last_trained": bundle.training_info.get("trained_at")
     }
 
 
@@ -277,31 +575,26 @@ def _postprocess_prediction(raw_pred: np.ndarray) -> List[int]:
     return sorted(numbers[:6])
 
 
-def _models_exist() -> bool:
-    """Check if all model files exist."""
-    required_files = [
-        "scaler.pkl",
-        "random_forest.pkl",
-        "gradient_boosting.pkl",
-        "neural_network.pkl",
-        "training_info.pkl"
-    ]
-    return all((MODEL_PATH / f).exists() for f in required_files)
-
-
 def get_model_status() -> Dict[str, Any]:
     """Get current model status."""
-    if not _models_exist():
+    bundle = model_registry.get()
+    if bundle is None:
         return {
             "trained": False,
             "last_trained": None,
-            "models_available": []
+            "models_available": [],
+            "version": None,
+            "loaded_at": None,
+            "compiled_models": [],
+            "prediction_cache": prediction_cache.state()
         }
 
-    training_info = joblib.load(MODEL_PATH / "training_info.pkl")
-
     return {
         "trained": True,
-        "last_trained": training_info.get("trained_at"),
-        "models_available": ["random_forest", "gradient_boosting", "neural_network"]
+        "last_trained": bundle.training_info.get("trained_at"),
+        "models_available": bundle.model_names,
+        "version": bundle.version,
+        "loaded_at": bundle.loaded_at,
+        "compiled_models": list(bundle.compiled.keys()),
+        "prediction_cache": prediction_cache.state()
     }
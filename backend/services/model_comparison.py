@@ -0,0 +1,63 @@
+"""
+Side-by-side comparison of the model output modes.
+Fits every model family once per-position ("wrapped") and once as a single
+multi-output estimator ("native") on the training split, and reports fit
+time, artifact size, predict latency and evaluation metrics.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+from services.draw_store import get_draw_store
+from services.evaluation_service import LATENCY_REPEAT, evaluate_predictions, model_size_bytes, predict_latency_ms
+from services.feature_service import model_columns
+from services.ml_service import OUTPUT_MODES, build_models, feature_plan, select_columns, split_training_data
+from services.model_zoo import MODEL_ZOO, enabled_models
+from services.tree_compiler import compile_model
+
+
+def compare_output_modes(
+    progress: Optional[Callable[[str, float], None]] = None,
+    repeat: int = LATENCY_REPEAT
+) -> Dict[str, Any]:
+    """Train both output modes on the same split and compare them per model."""
+    report = progress or (lambda phase, fraction: None)
+
+    report("loading_data", 0.0)
+    store = get_draw_store()
+    if len(store) < 10:
+        raise ValueError("Not enough data to train models. Please sync data first.")
+    groups, model_groups = feature_plan(enabled_models())
+    columns = model_columns(groups, model_groups)
+    _, X_train_all, X_test_all, y_train, y_test = split_training_data(store, groups)
+
+    modes: Dict[str, Dict[str, Any]] = {}
+    for mode_index, output_mode in enumerate(OUTPUT_MODES):
+        modes[output_mode] = {}
+        models = build_models(output_mode=output_mode)
+        for model_index, (model_name, model) in enumerate(models.items()):
+            step = mode_index * len(models) + model_index
+            report(f"fitting_{output_mode}", 0.05 + 0.9 * step / (len(OUTPUT_MODES) * len(models)))
+            X_train = select_columns(X_train_all, columns.get(model_name))
+            X_test = select_columns(X_test_all, columns.get(model_name))
+            row = X_test[:1]
+
+            start = time.perf_counter()
+            model.fit(X_train, y_train)
+            fit_time = time.perf_counter() - start
+
+            compiled = compile_model(model)
+            modes[output_mode][model_name] = {
+                "native": output_mode == "native" and MODEL_ZOO[model_name].native_multi_output,
+                "fit_time": round(fit_time, 3),
+                "pickle_bytes": model_size_bytes(model),
+                "predict_ms": predict_latency_ms(model.predict, row, repeat),
+                "compiled_predict_ms": predict_latency_ms(compiled.predict, row, repeat) if compiled is not None else None,
+                "test_metrics": evaluate_predictions(model.predict(X_test), y_test)
+            }
+
+    return {
+        "training_samples": len(X_train_all),
+        "test_samples": len(X_test_all),
+        "modes": modes
+    }
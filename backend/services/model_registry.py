@@ -0,0 +1,191 @@
+"""
+In-memory registry of trained model artifacts.
+Each training run is written as a versioned artifact set; the registry keeps
+the current set loaded and swaps it atomically after a retrain.
+"""
+
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import joblib
+import numpy as np
+
+from config import COMPILED_INFERENCE, MODEL_KEEP_VERSIONS, MODEL_PATH
+from services.feature_service import DEFAULT_FEATURE_GROUPS, model_columns
+from services.tree_compiler import compile_model
+
+CURRENT_POINTER = "CURRENT"
+VERSIONS_DIR = "versions"
+LEGACY_VERSION = "legacy"
+
+
+class ModelBundle:
+    """Immutable set of artifacts from one training run."""
+
+    def __init__(
+        self,
+        version: str,
+        scaler: Any,
+        models: Dict[str, Any],
+        training_info: Dict[str, Any],
+        model_accuracies: Dict[str, Any]
+    ):
+        self.version = version
+        self.scaler = scaler
+        self.models = models
+        self.training_info = training_info
+        self.model_accuracies = model_accuracies
+        self.loaded_at = datetime.now().isoformat()
+        # The scaler covers the union of every model's feature groups; models
+        # consuming only some groups see their own columns of it
+        self.feature_groups = tuple(training_info.get("feature_groups", DEFAULT_FEATURE_GROUPS))
+        self.columns = model_columns(self.feature_groups, training_info.get("model_feature_groups", {}))
+        # Compiled tree ensembles (models without a compiled path are absent)
+        self.compiled: Dict[str, Any] = {}
+        if COMPILED_INFERENCE:
+            for model_name, model in models.items():
+                compiled = compile_model(model)
+                if compiled is not None:
+                    self.compiled[model_name] = compiled
+
+    @property
+    def model_names(self):
+        return list(self.models.keys())
+
+    def scaled_features(self, store: Any, rows: Any = None) -> np.ndarray:
+        """Scaled feature rows of a DrawStore in this bundle's input space."""
+        return self.scaler.transform(store.feature_matrix(self.feature_groups, rows))
+
+    def predict(self, model_name: str, X: np.ndarray) -> np.ndarray:
+        """
+        Predict from scaled `scaled_features` rows with the compiled model
+        when available, else with sklearn.
+        """
+        columns = self.columns.get(model_name)
+        if columns is not None:
+            X = X[:, columns]
+        compiled = self.compiled.get(model_name)
+        if compiled is not None:
+            return compiled.predict(X)
+        return self.models[model_name].predict(X)
+
+
+def _load_bundle(version: str, path: Path) -> ModelBundle:
+    """Load every artifact of a version directory."""
+    training_info = joblib.load(path / "training_info.pkl")
+    # Flat-layout artifacts predate the model zoo and hold the original three families
+    model_names = training_info.get("model_names", ["random_forest", "gradient_boosting", "neural_network"])
+    accuracies_path = path / "model_accuracies.pkl"
+
+    return ModelBundle(
+        version=version,
+        scaler=joblib.load(path / "scaler.pkl"),
+        models={name: joblib.load(path / f"{name}.pkl") for name in model_names},
+        training_info=training_info,
+        model_accuracies=joblib.load(accuracies_path) if accuracies_path.exists() else {}
+    )
+
+
+class ModelRegistry:
+    """Holds the current ModelBundle and publishes new versions."""
+
+    def __init__(self, root: Path, keep_versions: int = MODEL_KEEP_VERSIONS):
+        self.root = Path(root)
+        self.keep_versions = keep_versions
+        self._bundle: Optional[ModelBundle] = None
+        self._lock = threading.Lock()
+
+    @property
+    def versions_dir(self) -> Path:
+        return self.root / VERSIONS_DIR
+
+    def current_version(self) -> Optional[str]:
+        """Read the version the on-disk pointer refers to."""
+        pointer = self.root / CURRENT_POINTER
+        if pointer.exists():
+            return pointer.read_text().strip() or None
+        if (self.root / "training_info.pkl").exists() and (self.root / "scaler.pkl").exists():
+            return LEGACY_VERSION  # Flat layout written before versioning
+        return None
+
+    def get(self) -> Optional[ModelBundle]:
+        """Get the loaded bundle, loading the current version on first use."""
+        bundle = self._bundle
+        if bundle is not None:
+            return bundle
+
+        with self._lock:
+            if self._bundle is None:
+                self._bundle = self._load_current()
+            return self._bundle
+
+    def reload(self) -> Optional[ModelBundle]:
+        """Reload the current version from disk (e.g. after another process retrained)."""
+        with self._lock:
+            self._bundle = self._load_current()
+            return self._bundle
+
+    def publish(
+        self,
+        scaler: Any,
+        models: Dict[str, Any],
+        training_info: Dict[str, Any],
+        model_accuracies: Dict[str, Any]
+    ) -> ModelBundle:
+        """
+        Write a new versioned artifact set and swap it in.
+        Files go to a temporary directory that is renamed into place before
+        the pointer is replaced, so readers never see a partial set.
+        """
+        version = f"{datetime.now().strftime('%Y%m%dT%H%M%S%f')}-{uuid.uuid4().hex[:6]}"
+        training_info = {**training_info, "version": version, "model_names": list(models.keys())}
+
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.versions_dir / f".tmp-{version}"
+        staging.mkdir()
+        joblib.dump(scaler, staging / "scaler.pkl")
+        for model_name, model in models.items():
+            joblib.dump(model, staging / f"{model_name}.pkl")
+        joblib.dump(training_info, staging / "training_info.pkl")
+        joblib.dump(model_accuracies, staging / "model_accuracies.pkl")
+        os.replace(staging, self.versions_dir / version)
+
+        pointer_tmp = self.root / f".{CURRENT_POINTER}.tmp"
+        pointer_tmp.write_text(version)
+        os.replace(pointer_tmp, self.root / CURRENT_POINTER)
+
+        bundle = ModelBundle(version, scaler, dict(models), training_info, model_accuracies)
+        with self._lock:
+            self._bundle = bundle
+
+        self._prune()
+        return bundle
+
+    def _load_current(self) -> Optional[ModelBundle]:
+        version = self.current_version()
+        if version is None:
+            return None
+        path = self.root if version == LEGACY_VERSION else self.versions_dir / version
+        try:
+            return _load_bundle(version, path)
+        except FileNotFoundError as e:
+            print(f"Error loading model version {version}: {e}")
+            return None
+
+    def _prune(self) -> None:
+        """Remove old versions beyond the retention limit."""
+        if not self.versions_dir.exists():
+            return
+        current = self.current_version()
+        versions = sorted(p for p in self.versions_dir.iterdir() if p.is_dir() and not p.name.startswith("."))
+        for path in versions[:max(0, len(versions) - self.keep_versions)]:
+            if path.name != current:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+model_registry = ModelRegistry(MODEL_PATH)
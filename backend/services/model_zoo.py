@@ -0,0 +1,122 @@
+"""
+Model zoo: every estimator family `train_models` can train.
+Each entry builds an unfitted single-output regressor and names the feature
+groups it consumes; the configured set (MODEL_SET) decides which families
+are trained and served.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from sklearn.ensemble import (
+    ExtraTreesRegressor,
+    GradientBoostingRegressor,
+    HistGradientBoostingRegressor,
+    RandomForestRegressor
+)
+from sklearn.linear_model import Ridge
+from sklearn.neighbors import KNeighborsRegressor
+from sklearn.neural_network import MLPRegressor
+
+from config import MODEL_FEATURE_GROUPS, MODEL_SET
+from services.feature_service import DEFAULT_FEATURE_GROUPS, resolve_feature_groups
+from services.parallel import resource_policy
+
+
+class ModelSpec:
+    """One model family of the zoo."""
+
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        build: Callable[[], Any],
+        native_multi_output: bool,
+        feature_groups: Sequence[str] = DEFAULT_FEATURE_GROUPS
+    ):
+        self.name = name
+        self.label = label
+        self.build = build  # Returns a fresh unfitted estimator
+        self.native_multi_output = native_multi_output  # Fits the (n, 6) target directly
+        self.feature_groups = tuple(feature_groups)  # Default input columns (MODEL_FEATURE_GROUPS overrides)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "name": self.name,
+            "label": self.label,
+            "native_multi_output": self.native_multi_output,
+            "enabled": self.name in enabled_models(),
+            "feature_groups": list(model_feature_groups(self.name))
+        }
+
+
+MODEL_ZOO: Dict[str, ModelSpec] = {
+    spec.name: spec for spec in [
+        # Random Forest (reduced complexity)
+        ModelSpec("random_forest", "Random Forest", lambda: RandomForestRegressor(
+            n_estimators=100,
+            max_depth=6,  # Reduced from 10
+            min_samples_split=10,  # Added to prevent overfitting
+            min_samples_leaf=5,  # Added to prevent overfitting
+            random_state=42,
+            n_jobs=resource_policy.threads  # Policy-capped, never every core
+        ), native_multi_output=True),
+        # Gradient Boosting (reduced complexity)
+        ModelSpec("gradient_boosting", "Gradient Boosting", lambda: GradientBoostingRegressor(
+            n_estimators=50,
+            max_depth=3,  # Reduced from 5
+            min_samples_split=10,  # Added
+            min_samples_leaf=5,  # Added
+            learning_rate=0.1,
+            random_state=42
+        ), native_multi_output=False),
+        # Neural Network (MLP) with regularization
+        ModelSpec("neural_network", "Neural Network (MLP)", lambda: MLPRegressor(
+            hidden_layer_sizes=(64, 32),  # Reduced from (128, 64, 32)
+            activation='relu',
+            alpha=0.01,  # L2 regularization
+            learning_rate='adaptive',
+            learning_rate_init=0.001,
+            max_iter=300,  # Reduced from 500
+            early_stopping=True,  # Stop when validation score stops improving
+            validation_fraction=0.15,
+            n_iter_no_change=20,
+            random_state=42
+        ), native_multi_output=True),
+        # Histogram-based boosting: binned features, much faster than GradientBoosting
+        ModelSpec("hist_gradient_boosting", "Hist Gradient Boosting", lambda: HistGradientBoostingRegressor(
+            max_iter=100,
+            max_depth=3,
+            min_samples_leaf=5,
+            learning_rate=0.1,
+            early_stopping=False,
+            random_state=42
+        ), native_multi_output=False),
+        # Extra Trees: random split thresholds, cheaper to fit than Random Forest
+        ModelSpec("extra_trees", "Extra Trees", lambda: ExtraTreesRegressor(
+            n_estimators=100,
+            max_depth=6,
+            min_samples_split=10,
+            min_samples_leaf=5,
+            random_state=42,
+            n_jobs=resource_policy.threads  # Policy-capped, never every core
+        ), native_multi_output=True),
+        # Linear baseline
+        ModelSpec("ridge", "Ridge (baseline)", lambda: Ridge(alpha=1.0), native_multi_output=True),
+        # Nearest-neighbour baseline
+        ModelSpec("knn", "KNN (baseline)", lambda: KNeighborsRegressor(n_neighbors=15), native_multi_output=True),
+    ]
+}
+
+
+def enabled_models() -> List[str]:
+    """Configured model families, in MODEL_SET order."""
+    unknown = [name for name in MODEL_SET if name not in MODEL_ZOO]
+    if unknown:
+        raise ValueError(f"Unknown models in MODEL_SET: {', '.join(unknown)}")
+    return list(MODEL_SET)
+
+
+def model_feature_groups(model_name: str) -> Tuple[str, ...]:
+    """Feature groups a model family consumes, in registry order."""
+    return resolve_feature_groups(MODEL_FEATURE_GROUPS.get(model_name, MODEL_ZOO[model_name].feature_groups))
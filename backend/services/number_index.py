@@ -0,0 +1,88 @@
+"""
+Normalized draw number index (draw_numbers table).
+One row per main number and one per bonus number of every stored draw,
+written in the same transaction as the draw itself so per-number
+aggregates can run as indexed GROUP BY queries inside SQLite.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from database import DrawNumber, LottoResult
+
+
+def number_rows(draw: LottoResult) -> List[Dict[str, Any]]:
+    """Index rows of one draw: its 6 main numbers and the bonus."""
+    numbers = [draw.num1, draw.num2, draw.num3, draw.num4, draw.num5, draw.num6]
+    rows = [{"draw_no": draw.draw_no, "number": int(number), "is_bonus": False} for number in numbers]
+    rows.append({"draw_no": draw.draw_no, "number": int(draw.bonus), "is_bonus": True})
+    return rows
+
+
+def main_numbers(start: Optional[int]):
+    """Filter on the main-number rows of the window."""
+    condition = DrawNumber.is_bonus.is_(False)
+    if start is not None:
+        condition = and_(condition, DrawNumber.draw_no >= start)
+    return condition
+
+
+def number_frequency(db: Session, start: Optional[int] = None) -> Dict[int, int]:
+    """Occurrences of each drawn main number from draw `start` on (absent numbers omitted)."""
+    rows = db.query(DrawNumber.number, func.count()).filter(
+        main_numbers(start)
+    ).group_by(DrawNumber.number).all()
+    return {int(number): int(count) for number, count in rows}
+
+
+class DrawNumberIndex:
+    """Service class for draw number index operations."""
+
+    @staticmethod
+    def add(db: Session, draw: LottoResult) -> None:
+        """Stage the index rows of a new draw (committed together with the draw)."""
+        db.add_all([DrawNumber(**row) for row in number_rows(draw)])
+
+    @staticmethod
+    def remove(db: Session, draw_no: int) -> None:
+        """Stage the removal of one draw's index rows."""
+        db.query(DrawNumber).filter(DrawNumber.draw_no == draw_no).delete(synchronize_session=False)
+
+    @staticmethod
+    def clear(db: Session) -> None:
+        """Stage the removal of every index row."""
+        db.query(DrawNumber).delete(synchronize_session=False)
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute the whole index from the draw table."""
+        draws = db.query(
+            LottoResult.draw_no,
+            LottoResult.num1, LottoResult.num2, LottoResult.num3,
+            LottoResult.num4, LottoResult.num5, LottoResult.num6,
+            LottoResult.bonus
+        ).all()
+
+        db.query(DrawNumber).delete(synchronize_session=False)
+        rows = [row for draw in draws for row in number_rows(draw)]
+        if rows:
+            db.bulk_insert_mappings(DrawNumber, rows)
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    def is_synced(db: Session) -> bool:
+        """Check that the index covers exactly the stored draws (7 rows each)."""
+        total_draws, latest_draw = db.query(func.count(LottoResult.id), func.max(LottoResult.draw_no)).one()
+        total_rows = db.query(func.count()).select_from(DrawNumber).scalar()
+        bonus_rows = db.query(func.count(DrawNumber.id)).filter(DrawNumber.is_bonus.is_(True)).scalar()
+        latest_row = db.query(func.max(DrawNumber.draw_no)).scalar()
+        return total_rows == 7 * total_draws and bonus_rows == total_draws and latest_row == latest_draw
+
+    @staticmethod
+    def ensure_synced(db: Session) -> None:
+        """Rebuild the index if it drifted from the draw table (e.g. databases created before it)."""
+        if not DrawNumberIndex.is_synced(db):
+            DrawNumberIndex.rebuild(db)
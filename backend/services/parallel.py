@@ -0,0 +1,159 @@
+"""
+Process pool helpers for CPU-bound ML jobs (training, evaluation fan-out).
+Every pool and background job runs under the training resource policy:
+a worker cap derived from the container CPU quota and a lowered CPU
+priority, plus capped BLAS/OpenMP threads in pool workers, so retraining
+leaves CPU to the API.
+"""
+
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from threadpoolctl import threadpool_limits
+
+from config import TRAIN_MAX_WORKERS, TRAIN_NICE, TRAIN_RESERVED_CPUS, TRAIN_THREADS, TRAIN_WORKERS
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def cpu_quota(root: Path = CGROUP_ROOT) -> Optional[float]:
+    """CPUs granted by the container's cgroup CPU quota (None: unlimited or unknown)."""
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    try:
+        quota, period = (root / "cpu.max").read_text().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    # cgroup v1: quota of -1 means unlimited
+    try:
+        quota = int((root / "cpu" / "cpu.cfs_quota_us").read_text())
+        period = int((root / "cpu" / "cpu.cfs_period_us").read_text())
+        return quota / period if quota > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: affinity mask, bounded by the CPU quota."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    quota = cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, math.floor(quota)))
+    return cpus
+
+
+class ResourcePolicy:
+    """CPU budget of training, backtest and search jobs."""
+
+    def __init__(self, max_workers: int = 0, reserved_cpus: int = 0, threads: int = 1, nice: int = 0):
+        self.max_workers = max_workers  # Hard cap on worker processes (0: no cap beyond the CPUs)
+        self.reserved_cpus = reserved_cpus  # CPUs left to the API server
+        self.threads = max(1, threads)  # BLAS/OpenMP/joblib threads per training process
+        self.nice = max(0, nice)  # Priority increment for training work (0: unchanged)
+
+    @classmethod
+    def from_config(cls) -> "ResourcePolicy":
+        return cls(TRAIN_MAX_WORKERS, TRAIN_RESERVED_CPUS, TRAIN_THREADS, TRAIN_NICE)
+
+    def worker_limit(self) -> int:
+        """Most worker processes a job may start."""
+        limit = max(1, available_cpus() - self.reserved_cpus)
+        if self.max_workers > 0:
+            limit = min(limit, self.max_workers)
+        return limit
+
+    def apply_to_process(self) -> None:
+        """Limit the current (worker) process: priority and native thread pools."""
+        if self.nice and hasattr(os, "nice"):
+            os.nice(self.nice)
+        for name in THREAD_ENV_VARS:
+            os.environ[name] = str(self.threads)  # For libraries loaded later
+        threadpool_limits(limits=self.threads)
+
+    def lower_thread_priority(self) -> None:
+        """Lower the priority of the calling thread only (Linux; no-op elsewhere)."""
+        if not self.nice or not hasattr(os, "setpriority") or not hasattr(threading, "get_native_id"):
+            return
+        try:
+            thread_id = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, thread_id, os.getpriority(os.PRIO_PROCESS, thread_id) + self.nice)
+        except OSError as e:
+            print(f"Could not lower training thread priority: {e}")
+
+    @contextmanager
+    def governed(self) -> Iterator[None]:
+        """
+        Run in-process job work under the policy. Only meant for dedicated
+        job threads: a lowered thread priority cannot be raised back.
+        Native thread pool limits are process-wide, so they are applied only
+        in spawned workers (`apply_to_process`), never around job threads.
+        """
+        self.lower_thread_priority()
+        yield
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "max_workers": self.max_workers,
+            "reserved_cpus": self.reserved_cpus,
+            "threads": self.threads,
+            "nice": self.nice,
+            "available_cpus": available_cpus(),
+            "cpu_quota": cpu_quota(),
+            "worker_limit": self.worker_limit()
+        }
+
+
+resource_policy = ResourcePolicy.from_config()
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """
+    Resolve worker count (None uses TRAIN_WORKERS, 0 or less uses every
+    CPU the policy allows); never more than the policy's worker limit.
+    """
+    if workers is None:
+        workers = TRAIN_WORKERS
+    limit = resource_policy.worker_limit()
+    if workers <= 0:
+        return limit
+    return min(workers, limit)
+
+
+def _init_pool_worker(
+    policy: ResourcePolicy,
+    initializer: Optional[Callable[..., None]],
+    initargs: Tuple[Any, ...]
+) -> None:
+    """Pool initializer: apply the resource policy, then the job's own initializer."""
+    policy.apply_to_process()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def create_process_pool(
+    workers: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = ()
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool for ML work.
+    Workers are spawned (not forked) so the server's threads and open
+    database connections are never duplicated into them.
+    """
+    return ProcessPoolExecutor(
+        max_workers=resolve_workers(workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_pool_worker,
+        initargs=(resource_policy, initializer, initargs)
+    )
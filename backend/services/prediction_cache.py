@@ -0,0 +1,61 @@
+"""
+Cache of the /predict output keyed by (latest draw_no, model version).
+Predictions only change when a draw is added or a new model set is published.
+"""
+
+import copy
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[Optional[int], str]
+
+
+class PredictionCache:
+    """Single-entry cache holding predictions for the current key."""
+
+    def __init__(self):
+        self._key: Optional[CacheKey] = None
+        self._value: Optional[Dict[str, Any]] = None
+        self._filled_at: Optional[str] = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Get cached predictions if they were computed for `key`."""
+        with self._lock:
+            if self._key == key and self._value is not None:
+                self._hits += 1
+                return copy.deepcopy(self._value)
+            self._misses += 1
+            return None
+
+    def put(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        """Store predictions for `key`, replacing any previous entry."""
+        with self._lock:
+            self._key = key
+            self._value = copy.deepcopy(value)
+            self._filled_at = datetime.now().isoformat()
+
+    def clear(self) -> None:
+        """Drop the cached entry."""
+        with self._lock:
+            self._key = None
+            self._value = None
+            self._filled_at = None
+
+    def state(self) -> Dict[str, Any]:
+        """Cache state for the admin status response."""
+        with self._lock:
+            return {
+                "filled": self._value is not None,
+                "latest_draw": self._key[0] if self._key else None,
+                "model_version": self._key[1] if self._key else None,
+                "filled_at": self._filled_at,
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+
+prediction_cache = PredictionCache()
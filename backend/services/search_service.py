@@ -0,0 +1,259 @@
+"""
+Hyperparameter search for the ML models.
+Grid or random search scored with time-series cross-validation; every
+(candidate, fold) fit runs in a process pool over a feature matrix that is
+computed once and cached on disk.
+"""
+
+import json
+import time
+from concurrent.futures import as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.model_selection import ParameterGrid, ParameterSampler, TimeSeriesSplit
+from sklearn.preprocessing import StandardScaler
+
+from config import MODEL_PATH, TRAIN_OUTPUT_MODE
+from services.draw_store import get_draw_store
+from services.evaluation_service import evaluate_predictions
+from services.feature_service import DEFAULT_FEATURE_GROUPS
+from services.ml_service import base_estimator, build_models, single_threaded, train_models
+from services.model_zoo import enabled_models, model_feature_groups
+from services.parallel import create_process_pool
+
+SEARCH_DIR = "search"
+FEATURES_DIR = "features"
+SEARCH_SEED = 42
+
+# Candidate values per model family (overrides of the `build_models` defaults)
+SEARCH_SPACES: Dict[str, Dict[str, List[Any]]] = {
+    "random_forest": {
+        "n_estimators": [50, 100, 200],
+        "max_depth": [4, 6, 8],
+        "min_samples_leaf": [3, 5, 10],
+    },
+    "gradient_boosting": {
+        "n_estimators": [50, 100],
+        "max_depth": [2, 3, 4],
+        "learning_rate": [0.05, 0.1],
+    },
+    "neural_network": {
+        "hidden_layer_sizes": [(32,), (64, 32), (128, 64)],
+        "alpha": [0.001, 0.01, 0.1],
+        "learning_rate_init": [0.001, 0.01],
+    },
+    "hist_gradient_boosting": {
+        "max_iter": [50, 100, 200],
+        "max_depth": [2, 3, 4],
+        "learning_rate": [0.05, 0.1],
+    },
+    "extra_trees": {
+        "n_estimators": [50, 100, 200],
+        "max_depth": [4, 6, 8],
+        "min_samples_leaf": [3, 5, 10],
+    },
+    "ridge": {
+        "alpha": [0.1, 1.0, 10.0, 100.0],
+    },
+    "knn": {
+        "n_neighbors": [5, 15, 30, 50],
+        "weights": ["uniform", "distance"],
+    },
+}
+
+# Feature matrix shared with pool workers (memory-mapped once per worker)
+_worker_data: Dict[str, np.ndarray] = {}
+
+
+def _init_search_worker(x_path: str, y_path: str) -> None:
+    """Pool initializer: map the cached feature matrix once per worker."""
+    _worker_data.update(X=np.load(x_path, mmap_mode="r"), y=np.load(y_path, mmap_mode="r"))
+
+
+def _fit_fold(
+    model_name: str,
+    params: Dict[str, Any],
+    output_mode: str,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray
+) -> Dict[str, Any]:
+    """Fit one candidate on one fold (in the training output mode) and score it on the fold's test rows."""
+    X, y = _worker_data["X"], _worker_data["y"]
+    model = build_models({model_name: params}, output_mode, model_names=[model_name])[model_name]
+    single_threaded(base_estimator(model))  # The pool provides the parallelism
+
+    start = time.perf_counter()
+    scaler = StandardScaler()
+    model.fit(scaler.fit_transform(X[train_idx]), y[train_idx])
+    fit_time = time.perf_counter() - start
+
+    metrics = evaluate_predictions(model.predict(scaler.transform(X[test_idx])), y[test_idx])
+    hits = metrics["hit_distribution"]
+    return {
+        "score": metrics["accuracy_within"]["3"],
+        "mean_hits": sum(int(h) * c for h, c in hits.items()) / max(1, sum(hits.values())),
+        "fit_time": fit_time
+    }
+
+
+def _search_dir(root: Optional[Path] = None) -> Path:
+    return Path(root) if root is not None else MODEL_PATH / SEARCH_DIR
+
+
+def _to_json(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in params.items()}
+
+
+def _from_json(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore tuple-valued parameters (e.g. hidden_layer_sizes) from JSON lists."""
+    return {k: tuple(v) if isinstance(v, list) else v for k, v in params.items()}
+
+
+def cached_features(
+    root: Optional[Path] = None,
+    groups: Tuple[str, ...] = DEFAULT_FEATURE_GROUPS
+) -> Tuple[Path, Path]:
+    """
+    Write the training rows (feature `groups`) of the current draw store to
+    disk once. Files are keyed by the data fingerprint and the groups, so
+    repeated searches on the same history reuse them; files of older
+    histories are removed.
+    """
+    store = get_draw_store()
+    features_dir = _search_dir(root) / FEATURES_DIR
+    fingerprint = store.fingerprint()[:16]
+    x_path = features_dir / f"{fingerprint}_{'+'.join(groups)}_X.npy"
+    y_path = features_dir / f"{fingerprint}_y.npy"
+
+    if not (x_path.exists() and y_path.exists()):
+        features_dir.mkdir(parents=True, exist_ok=True)
+        for stale in features_dir.glob("*.npy"):
+            if not stale.name.startswith(f"{fingerprint}_"):
+                stale.unlink()
+        # Start from index 5 (need 5 previous draws), as in train_models
+        np.save(x_path, np.ascontiguousarray(store.feature_matrix(groups, np.arange(5, len(store)))))
+        np.save(y_path, store.numbers[5:].astype(np.int64))
+    return x_path, y_path
+
+
+def search_candidates(model_name: str, method: str = "grid", n_iter: int = 10) -> List[Dict[str, Any]]:
+    """Parameter combinations to evaluate for a model family."""
+    space = SEARCH_SPACES[model_name]
+    if method == "grid":
+        return list(ParameterGrid(space))
+    if method == "random":
+        n_iter = min(n_iter, len(ParameterGrid(space)))
+        return list(ParameterSampler(space, n_iter=n_iter, random_state=SEARCH_SEED))
+    raise ValueError(f"Unknown search method: {method}")
+
+
+def run_search(
+    model_name: str,
+    method: str = "grid",
+    n_iter: int = 10,
+    n_splits: int = 5,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[str, float], None]] = None,
+    root: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Search hyperparameters for one model family and persist the leaderboard.
+    Candidates are ranked by mean ±3 accuracy over the time-series folds.
+    """
+    if model_name not in SEARCH_SPACES:
+        raise ValueError(f"Unknown model: {model_name}")
+    report = progress or (lambda phase, fraction: None)
+    candidates = search_candidates(model_name, method, n_iter)
+
+    report("loading_data", 0.0)
+    x_path, y_path = cached_features(root, model_feature_groups(model_name))
+    n_rows = len(np.load(y_path, mmap_mode="r"))
+    if n_rows <= n_splits + 1:
+        raise ValueError("Not enough data to search. Please sync data first.")
+    splits = list(TimeSeriesSplit(n_splits=n_splits).split(np.empty((n_rows, 1))))
+
+    report("searching", 0.05)
+    search_start = time.perf_counter()
+    fold_results: Dict[int, List[Dict[str, Any]]] = {i: [] for i in range(len(candidates))}
+    pool = create_process_pool(workers, initializer=_init_search_worker, initargs=(str(x_path), str(y_path)))
+    try:
+        futures = {
+            pool.submit(_fit_fold, model_name, params, TRAIN_OUTPUT_MODE, train_idx, test_idx): i
+            for i, params in enumerate(candidates)
+            for train_idx, test_idx in splits
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            fold_results[futures[future]].append(future.result())
+            report("searching", 0.05 + 0.9 * done / len(futures))
+    finally:
+        # Drop queued fits if we are leaving early (error or cancellation)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    leaderboard = []
+    for i, params in enumerate(candidates):
+        scores = [fold["score"] for fold in fold_results[i]]
+        leaderboard.append({
+            "params": _to_json(params),
+            "mean_score": round(float(np.mean(scores)), 4),
+            "std_score": round(float(np.std(scores)), 4),
+            "mean_hits": round(float(np.mean([fold["mean_hits"] for fold in fold_results[i]])), 4),
+            "fit_time": round(sum(fold["fit_time"] for fold in fold_results[i]), 3)
+        })
+    leaderboard.sort(key=lambda entry: (-entry["mean_score"], entry["std_score"]))
+    for rank, entry in enumerate(leaderboard, start=1):
+        entry["rank"] = rank
+
+    result = {
+        "model": model_name,
+        "method": method,
+        "output_mode": TRAIN_OUTPUT_MODE,
+        "n_splits": n_splits,
+        "candidates": len(candidates),
+        "samples": n_rows,
+        "searched_at": datetime.now().isoformat(),
+        "search_time": round(time.perf_counter() - search_start, 3),
+        "leaderboard": leaderboard
+    }
+
+    report("saving", 0.95)
+    path = _search_dir(root) / f"{model_name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    tmp_path.replace(path)
+    return result
+
+
+def load_leaderboard(model_name: str, root: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Load the last persisted search result of a model family."""
+    path = _search_dir(root) / f"{model_name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def promote(
+    model_name: str,
+    rank: int = 1,
+    progress: Optional[Callable[[str, float], None]] = None,
+    root: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Retrain with a leaderboard entry's parameters and publish the result.
+    Overrides already promoted for the other model families are kept.
+    """
+    if model_name not in enabled_models():
+        raise ValueError(f"Model not in MODEL_SET: {model_name}")
+    search = load_leaderboard(model_name, root)
+    if search is None:
+        raise ValueError(f"No search results for model: {model_name}")
+    entries = [entry for entry in search["leaderboard"] if entry["rank"] == rank]
+    if not entries:
+        raise ValueError(f"No leaderboard entry with rank {rank}")
+
+    params = {model_name: _from_json(entries[0]["params"])}
+    build_models(params, TRAIN_OUTPUT_MODE, model_names=[model_name])  # Validate the overrides before training
+    return train_models(progress=progress, params=params)
@@ -1,11 +1,8 @@
-from typing import Dict, List, Any, Tuple
-import random
+from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
-from services.ml_service import predict_numbers, extract_features, _postprocess_prediction
-from services.data_service import get_latest_draw, get_result_by_draw_no
-import joblib
-from pathlib import Path
-from config import MODEL_PATH
+from services.draw_store import get_draw_store
+from services.evaluation_service import winner_ranks
+from services.ticket_service import ensemble_scores, generate_tickets, sample_tickets
 
 
 def check_winner_rank(predicted_numbers: List[int], winning_numbers: List[int], bonus_number: int) -> int:
@@ -38,72 +35,45 @@ def check_winner_rank(predicted_numbers: List[int], winning_numbers: List[int],
 
 def generate_single_prediction() -> List[int]:
     """Generate a single prediction using ML models (ensemble approach)."""
-    try:
-        # Get current predictions from all models
-        predictions = predict_numbers()
-
-        # Combine predictions from all models
-        all_numbers = []
-        for model_name, pred_data in predictions["predictions"].items():
-            all_numbers.extend(pred_data["numbers"])
-
-        # Count frequency of each number across all models
-        number_freq = {}
-        for num in all_numbers:
-            number_freq[num] = number_freq.get(num, 0) + 1
-
-        # Select top 6 most frequent numbers
-        sorted_numbers = sorted(number_freq.items(), key=lambda x: x[1], reverse=True)
-        selected_numbers = [num for num, _ in sorted_numbers[:6]]
+    return generate_tickets(1)["tickets"][0]
 
-        # If we have less than 6 numbers, fill with random numbers
-        while len(selected_numbers) < 6:
-            new_num = random.randint(1, 45)
-            if new_num not in selected_numbers:
-                selected_numbers.append(new_num)
 
-        return sorted(selected_numbers[:6])
-
-    except Exception as e:
-        print(f"ML prediction failed: {e}, using fallback random generation")
-        # Fallback to pure random if ML fails
-        numbers = random.sample(range(1, 46), 6)
-        return sorted(numbers)
+SIMULATION_CHUNK = 100000
 
 
-def run_simulation(num_predictions: int = 1000) -> Dict[str, Any]:
+def run_simulation(num_predictions: int = 1000, seed: Optional[int] = None) -> Dict[str, Any]:
     """
     Run lottery prediction simulation.
 
     Args:
         num_predictions: Number of prediction sets to generate (default: 1000)
+        seed: Seed of the ticket generator (None: random)
 
     Returns:
         Dictionary containing simulation results with winner statistics
     """
     try:
         # Get the latest winning numbers for comparison
-        latest_draw_no = get_latest_draw()
-        if not latest_draw_no:
-            raise ValueError("No winning numbers available for comparison")
-
-        latest_result = get_result_by_draw_no(latest_draw_no)
+        latest_result = get_draw_store().latest_result()
         if not latest_result:
-            raise ValueError("Failed to get latest winning numbers")
+            raise ValueError("No winning numbers available for comparison")
 
         winning_numbers = latest_result["numbers"]
         bonus_number = latest_result["bonus"]
 
-        # Initialize winner statistics
-        winner_stats = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 0: 0}
-
-        # Generate predictions and check winners
-        predictions = []
-        for i in range(num_predictions):
-            predicted_numbers = generate_single_prediction()
-            rank = check_winner_rank(predicted_numbers, winning_numbers, bonus_number)
-            winner_stats[rank] += 1
-            predictions.append(predicted_numbers)
+        # Model outputs are scored once; tickets are drawn and ranked in chunks
+        scores = np.array(ensemble_scores()["scores"])
+        rng = np.random.default_rng(seed)
+        rank_counts = np.zeros(6, dtype=np.int64)
+        predictions: List[List[int]] = []
+        for start in range(0, num_predictions, SIMULATION_CHUNK):
+            count = min(SIMULATION_CHUNK, num_predictions - start)
+            tickets = sample_tickets(scores, count, rng)
+            ranks = winner_ranks(tickets, np.tile(winning_numbers, (count, 1)), np.full(count, bonus_number))
+            rank_counts += np.bincount(ranks, minlength=6)
+            if not predictions:
+                predictions = tickets[:10].tolist()
+        winner_stats = {rank: int(rank_counts[rank]) for rank in range(6)}
 
         # Calculate percentages
         winner_percentages = {}
@@ -128,7 +98,7 @@ def run_simulation(num_predictions: int = 1000) -> Dict[str, Any]:
                     "5th_place": {"count": winner_stats[5], "percentage": winner_percentages[5]},
                     "no_prize": {"count": winner_stats[0], "percentage": round((winner_stats[0] / num_predictions) * 100, 2)}
                 },
-                "sample_predictions": predictions[:10]  # Show first 10 predictions as examples
+                "sample_predictions": predictions  # Show first 10 predictions as examples
             }
         }
 
@@ -142,18 +112,11 @@ def run_simulation(num_predictions: int = 1000) -> Dict[str, Any]:
 def get_simulation_info() -> Dict[str, Any]:
     """Get information about simulation capabilities."""
     try:
-        latest_draw_no = get_latest_draw()
-        if not latest_draw_no:
-            return {
-                "status": "error",
-                "message": "No winning data available for simulation"
-            }
-
-        latest_result = get_result_by_draw_no(latest_draw_no)
+        latest_result = get_draw_store().latest_result()
         if not latest_result:
             return {
                 "status": "error",
-                "message": "Failed to get latest winning data"
+                "message": "No winning data available for simulation"
             }
 
         return {
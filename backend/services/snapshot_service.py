@@ -0,0 +1,98 @@
+"""
+Columnar snapshot of the draw table for fast data loading.
+The draw columns and precomputed feature rows are written to one
+uncompressed .npz file with compact dtypes and reloaded with a single read
+(no ORM objects, no row-by-row conversion) while the database is unchanged.
+"""
+
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import asc, func
+from sqlalchemy.orm import Session
+
+from config import SNAPSHOT_PATH
+from database import LottoResult
+from services.feature_store import FeatureStore
+
+SNAPSHOT_FORMAT = 2
+SNAPSHOT_COLUMNS = ("draw_no", "draw_date", "numbers", "bonus", "prize_1st", "features")
+
+
+def database_key(db: Session) -> str:
+    """Cheap stamp of the draw table; changes on any insert, delete or update."""
+    count, max_draw, max_updated = db.query(
+        func.count(LottoResult.id),
+        func.max(LottoResult.draw_no),
+        func.max(LottoResult.updated_at)
+    ).one()
+    return f"{SNAPSHOT_FORMAT}:{count}:{max_draw}:{max_updated}"
+
+
+def read_tables(db: Session) -> Dict[str, np.ndarray]:
+    """Read the draw columns and feature rows from the database."""
+    rows = db.query(
+        LottoResult.draw_no, LottoResult.draw_date,
+        LottoResult.num1, LottoResult.num2, LottoResult.num3,
+        LottoResult.num4, LottoResult.num5, LottoResult.num6,
+        LottoResult.bonus, LottoResult.prize_1st
+    ).order_by(asc(LottoResult.draw_no)).all()
+    features = FeatureStore.get_feature_matrix(db)
+
+    draw_no = np.array([row[0] for row in rows], dtype=np.int64)
+    draw_no_dtype = np.int16 if len(draw_no) == 0 or draw_no.max() <= np.iinfo(np.int16).max else np.int32
+
+    return {
+        "draw_no": draw_no.astype(draw_no_dtype),
+        "draw_date": np.array([row[1] for row in rows], dtype="U10"),
+        "numbers": np.array([row[2:8] for row in rows], dtype=np.uint8).reshape(-1, 6),
+        "bonus": np.array([row[8] for row in rows], dtype=np.uint8),
+        "prize_1st": np.array([row[9] or 0 for row in rows], dtype=np.int64),
+        "features": np.array(features, dtype=np.float32)
+    }
+
+
+def write_snapshot(arrays: Dict[str, np.ndarray], key: str, path: Path) -> None:
+    """Write the snapshot atomically (temporary file renamed into place)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, key=np.array(key), **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: Path, key: str) -> Optional[Dict[str, np.ndarray]]:
+    """Read the snapshot if it exists and was written for `key`."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["key"]) != key:
+                return None
+            return {name: data[name] for name in SNAPSHOT_COLUMNS}
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print(f"Ignoring unreadable draw snapshot {path}: {e}")
+        return None
+
+
+def load_snapshot(db: Session, path: Optional[Path] = None) -> Dict[str, np.ndarray]:
+    """
+    Get the draw columns, from the snapshot file when it is current.
+    A stale or missing snapshot is rebuilt from the database and rewritten.
+    """
+    path = Path(path) if path is not None else SNAPSHOT_PATH
+    key = database_key(db)
+
+    arrays = read_snapshot(path, key)
+    if arrays is not None:
+        return arrays
+
+    arrays = read_tables(db)
+    try:
+        write_snapshot(arrays, key, path)
+    except OSError as e:
+        print(f"Error writing draw snapshot {path}: {e}")
+    return arrays
@@ -1,43 +1,99 @@
-from typing import Dict, Any, Optional, List
-from collections import Counter
+"""
+Lotto statistics.
+Full-history statistics are the materialized totals row in SQLite (the
+"memory" source reads the draw store instead). Any window of draws, by
+draw range and/or recent count, is the difference of two rows of the draw
+store's prefix-sum index.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from config import STATISTICS_SOURCE
+from database import get_db
+from services.draw_store import DrawStore, get_draw_store
+from services.statistics_store import StatisticsStore, statistics_from_totals, unflatten_totals
+
+MAX_STATISTICS_WINDOWS = 20
+
+
+def calculate_statistics(
+    recent: Optional[int] = None,
+    from_draw: Optional[int] = None,
+    to_draw: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Calculate comprehensive lotto statistics over draws from_draw..to_draw
+    (inclusive, default: all), limited to the `recent` latest of them.
+    """
+    if from_draw is not None and to_draw is not None and from_draw > to_draw:
+        raise ValueError("from_draw must not be greater than to_draw.")
+
+    if STATISTICS_SOURCE == "sql" and not recent and from_draw is None and to_draw is None:
+        # Full history: a single read of the materialized totals row
+        db = next(get_db())
+        try:
+            stats = statistics_from_totals(StatisticsStore.get_totals(db))
+        finally:
+            db.close()
+    else:
+        stats = window_statistics(get_draw_store(), recent, from_draw, to_draw)
+
+    return stats if stats["total_draws"] else _empty_statistics()
+
+
+def window_statistics(
+    store: DrawStore,
+    recent: Optional[int] = None,
+    from_draw: Optional[int] = None,
+    to_draw: Optional[int] = None
+) -> Dict[str, Any]:
+    """Statistics of a draw window in O(1): the difference of two prefix-sum rows."""
+    start = 0 if from_draw is None else int(np.searchsorted(store.draw_no, from_draw, side="left"))
+    end = len(store) if to_draw is None else int(np.searchsorted(store.draw_no, to_draw, side="right"))
+    if recent:
+        start = max(start, end - recent)
 
-from services.data_service import get_all_results_df
+    prefix = store.statistics_prefix()
+    return statistics_from_totals(unflatten_totals(prefix[end].astype(np.int64) - prefix[start]))
 
 
-def calculate_statistics(recent: Optional[int] = None) -> Dict[str, Any]:
-    """Calculate comprehensive lotto statistics from database."""
-    df = get_all_results_df()
+def parse_windows(spec: str) -> List[Optional[int]]:
+    """Parse a window list such as "10,50,100,all" (None stands for all draws)."""
+    windows: List[Optional[int]] = []
+    for part in spec.split(","):
+        part = part.strip().lower()
+        if part == "all":
+            window = None
+        elif part.isdigit() and int(part) >= 1:
+            window = int(part)
+        else:
+            raise ValueError(f"Invalid window '{part}': use a positive draw count or 'all'.")
+        if window not in windows:
+            windows.append(window)
+    if len(windows) > MAX_STATISTICS_WINDOWS:
+        raise ValueError(f"At most {MAX_STATISTICS_WINDOWS} windows can be requested at once.")
+    return windows
 
-    if df is None or len(df) == 0:
-        return _empty_statistics()
 
-    # Sort by draw_no descending
-    df = df.sort_values('draw_no', ascending=False)
+def calculate_multi_statistics(windows: Sequence[Optional[int]]) -> Dict[str, Any]:
+    """
+    Statistics of several latest-N windows (None: all draws) from one store
+    snapshot: one prefix-sum index, one vectorized subtraction for every window.
+    """
+    store = get_draw_store()
+    prefix = store.statistics_prefix()
+    n = len(store)
 
-    # Limit to recent N if specified
-    if recent:
-        df = df.head(recent)
+    starts = [0 if window is None else max(0, n - window) for window in windows]
+    totals = prefix[n].astype(np.int64) - prefix[starts].astype(np.int64)
 
-    # Convert to list of tuples (num1, num2, num3, num4, num5, num6, bonus)
-    rows = [(row['num1'], row['num2'], row['num3'], row['num4'], row['num5'], row['num6'], row['bonus'])
-            for _, row in df.iterrows()]
-    total_draws = len(rows)
-
-    # Calculate all statistics
-    number_frequency = _calculate_number_frequency(rows)
-    odd_even_distribution = _calculate_odd_even(rows)
-    sum_distribution = _calculate_sum_distribution(rows)
-    consecutive_stats = _calculate_consecutive(rows)
-    section_distribution = _calculate_section_distribution(rows)
-
-    return {
-        "number_frequency": number_frequency,
-        "odd_even_distribution": odd_even_distribution,
-        "sum_distribution": sum_distribution,
-        "consecutive_stats": consecutive_stats,
-        "section_distribution": section_distribution,
-        "total_draws": total_draws
-    }
+    results: Dict[str, Any] = {}
+    for window, row in zip(windows, totals):
+        stats = statistics_from_totals(unflatten_totals(row))
+        results["all" if window is None else str(window)] = stats if stats["total_draws"] else _empty_statistics()
+    return {"windows": results, "latest_draw": store.latest_draw_no}
 
 
 def _empty_statistics() -> Dict[str, Any]:
@@ -57,108 +113,3 @@ def _empty_statistics() -> Dict[str, Any]:
         },
         "total_draws": 0
     }
-
-
-def _calculate_number_frequency(rows: List) -> Dict[str, int]:
-    """Calculate frequency of each number (1-45)."""
-    counter: Counter = Counter()
-
-    for row in rows:
-        for i in range(6):  # num1 to num6 (excluding bonus)
-            counter[row[i]] += 1
-
-    return {str(i): counter.get(i, 0) for i in range(1, 46)}
-
-
-def _calculate_odd_even(rows: List) -> Dict[str, int]:
-    """Calculate odd/even distribution per draw."""
-    distribution: Counter = Counter()
-
-    for row in rows:
-        numbers = [row[i] for i in range(6)]
-        odd_count = sum(1 for n in numbers if n % 2 == 1)
-        distribution[f"{odd_count}_odd"] += 1
-
-    return {f"{i}_odd": distribution.get(f"{i}_odd", 0) for i in range(7)}
-
-
-def _calculate_sum_distribution(rows: List) -> Dict[str, Any]:
-    """Calculate sum distribution of 6 numbers."""
-    ranges = ["61-80", "81-100", "101-120", "121-140", "141-160", "161-180", "181-200", "201+"]
-    counts = [0] * len(ranges)
-
-    for row in rows:
-        total = sum(row[i] for i in range(6))
-
-        if total <= 80:
-            counts[0] += 1
-        elif total <= 100:
-            counts[1] += 1
-        elif total <= 120:
-            counts[2] += 1
-        elif total <= 140:
-            counts[3] += 1
-        elif total <= 160:
-            counts[4] += 1
-        elif total <= 180:
-            counts[5] += 1
-        elif total <= 200:
-            counts[6] += 1
-        else:
-            counts[7] += 1
-
-    return {"ranges": ranges, "counts": counts}
-
-
-def _calculate_consecutive(rows: List) -> Dict[str, int]:
-    """Calculate consecutive number statistics."""
-    has_consecutive = 0
-    no_consecutive = 0
-
-    for row in rows:
-        numbers = sorted([row[i] for i in range(6)])
-        has_consec = False
-
-        for i in range(len(numbers) - 1):
-            if numbers[i + 1] - numbers[i] == 1:
-                has_consec = True
-                break
-
-        if has_consec:
-            has_consecutive += 1
-        else:
-            no_consecutive += 1
-
-    return {"has_consecutive": has_consecutive, "no_consecutive": no_consecutive}
-
-
-def _calculate_section_distribution(rows: List) -> Dict[str, Any]:
-    """Calculate section distribution (low: 1-15, mid: 16-30, high: 31-45)."""
-    low_counts: List[int] = []
-    mid_counts: List[int] = []
-    high_counts: List[int] = []
-
-    for row in rows:
-        numbers = [row[i] for i in range(6)]
-        low = sum(1 for n in numbers if 1 <= n <= 15)
-        mid = sum(1 for n in numbers if 16 <= n <= 30)
-        high = sum(1 for n in numbers if 31 <= n <= 45)
-
-        low_counts.append(low)
-        mid_counts.append(mid)
-        high_counts.append(high)
-
-    def calc_section_stats(counts: List[int]) -> Dict[str, Any]:
-        if not counts:
-            return {"avg": 0, "distribution": {}}
-        counter = Counter(counts)
-        return {
-            "avg": round(sum(counts) / len(counts), 2),
-            "distribution": {str(k): v for k, v in sorted(counter.items())}
-        }
-
-    return {
-        "low_1_15": calc_section_stats(low_counts),
-        "mid_16_30": calc_section_stats(mid_counts),
-        "high_31_45": calc_section_stats(high_counts)
-    }
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+Materialized lotto statistics.
+Statistics are running totals: per-number counts plus histograms of per-draw
+profiles (odd count, sum range, numbers per section, consecutive pair). The
+totals of the whole history live in one lotto_statistics row that every
+draw insert and delete updates in its own transaction, so full-history
+statistics are a single-row read. Prefix sums of the per-draw totals answer
+any draw range by subtracting two rows.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import and_, case, func, literal
+from sqlalchemy.orm import Session
+
+from database import DrawNumber, LottoResult, LottoStatistics
+from services.number_index import DrawNumberIndex, main_numbers, number_frequency
+
+SUM_RANGES = ["61-80", "81-100", "101-120", "121-140", "141-160", "161-180", "181-200", "201+"]
+SUM_BIN_EDGES = np.array([80, 100, 120, 140, 160, 180, 200])  # Inclusive upper bounds
+SECTION_EDGES = np.array([15, 30])  # low 1-15, mid 16-30, high 31-45
+SECTION_NAMES = ["low_1_15", "mid_16_30", "high_31_45"]
+
+Profile = Tuple[int, int, int, int, int, int]  # odd count, sum bucket, low, mid, high, has consecutive pair
+
+# Running totals as one flat vector: (name, shape) in column order
+TOTALS_LAYOUT = (
+    ("number_counts", (45,)),
+    ("odd_even_counts", (7,)),
+    ("sum_counts", (len(SUM_RANGES),)),
+    ("section_counts", (len(SECTION_NAMES), 7)),
+    ("consecutive_draws", ()),
+    ("total_draws", ())
+)
+TOTALS_OFFSETS = dict(zip(
+    (name for name, _ in TOTALS_LAYOUT),
+    np.cumsum([0] + [int(np.prod(shape)) for _, shape in TOTALS_LAYOUT])[:-1].tolist()
+))
+TOTALS_WIDTH = sum(int(np.prod(shape)) for _, shape in TOTALS_LAYOUT)
+
+
+def draw_profile(numbers: Sequence[int]) -> Profile:
+    """Profile of one draw's 6 main numbers."""
+    numbers = sorted(int(n) for n in numbers)
+    total = sum(numbers)
+    sections = np.bincount(np.digitize(numbers, SECTION_EDGES, right=True), minlength=3)
+    consecutive = any(b - a == 1 for a, b in zip(numbers, numbers[1:]))
+    return (
+        sum(n % 2 for n in numbers),
+        int(np.count_nonzero(total > SUM_BIN_EDGES)),
+        *(int(count) for count in sections),
+        int(consecutive)
+    )
+
+
+def draw_profiles(db: Session, start: Optional[int] = None) -> Dict[Profile, int]:
+    """
+    Count draws per profile from draw `start` on, inside SQLite. One scan
+    over the window; at most a few hundred distinct profiles come back,
+    whatever the history length.
+    """
+    number = DrawNumber.number
+    total = func.sum(number)
+    per_draw = db.query(
+        func.sum(number % 2).label("odd"),
+        case(*[(total <= edge, bucket) for bucket, edge in enumerate(SUM_BIN_EDGES.tolist())],
+             else_=len(SUM_BIN_EDGES)).label("sum_bucket"),
+        func.sum(case((number <= 15, 1), else_=0)).label("low"),
+        func.sum(case((and_(number > 15, number <= 30), 1), else_=0)).label("mid"),
+        func.sum(case((number > 30, 1), else_=0)).label("high"),
+        # Bit set of the draw's numbers (distinct, so the sum is a bitwise OR)
+        func.sum(literal(1).op("<<")(number)).label("mask")
+    ).filter(main_numbers(start)).group_by(DrawNumber.draw_no).subquery()
+
+    # A consecutive pair is a set bit whose neighbour bit is set too
+    mask = per_draw.c.mask
+    consecutive = case((mask.op("&")(mask.op(">>")(1)) != 0, 1), else_=0)
+    columns = [per_draw.c.odd, per_draw.c.sum_bucket, per_draw.c.low, per_draw.c.mid, per_draw.c.high, consecutive]
+    rows = db.query(*columns, func.count()).group_by(*columns).all()
+    return {tuple(int(value) for value in row[:-1]): int(row[-1]) for row in rows}
+
+
+def empty_totals() -> Dict[str, Any]:
+    """Running totals of zero draws."""
+    return {
+        "total_draws": 0,
+        "number_counts": np.zeros(45, dtype=np.int64),
+        "odd_even_counts": np.zeros(7, dtype=np.int64),
+        "sum_counts": np.zeros(len(SUM_RANGES), dtype=np.int64),
+        "section_counts": np.zeros((len(SECTION_NAMES), 7), dtype=np.int64),
+        "consecutive_draws": 0
+    }
+
+
+def fold_totals(frequency: Dict[int, int], profiles: Dict[Profile, int]) -> Dict[str, Any]:
+    """Running totals from per-number counts and per-profile draw counts."""
+    totals = empty_totals()
+    for number, count in frequency.items():
+        totals["number_counts"][number - 1] += count
+    for (odd, bucket, low, mid, high, consecutive), count in profiles.items():
+        totals["total_draws"] += count
+        totals["odd_even_counts"][odd] += count
+        totals["sum_counts"][bucket] += count
+        for section, value in enumerate((low, mid, high)):
+            totals["section_counts"][section, value] += count
+        totals["consecutive_draws"] += count if consecutive else 0
+    return totals
+
+
+def draw_totals(numbers: Sequence[int]) -> Dict[str, Any]:
+    """Running totals of a single draw."""
+    return fold_totals({int(n): 1 for n in numbers}, {draw_profile(numbers): 1})
+
+
+def statistics_from_totals(totals: Dict[str, Any]) -> Dict[str, Any]:
+    """Statistics response structure (as `calculate_statistics`) from running totals."""
+    n = int(totals["total_draws"])
+    section_distribution: Dict[str, Any] = {}
+    for name, counts in zip(SECTION_NAMES, totals["section_counts"].tolist()):
+        numbers = sum(k * v for k, v in enumerate(counts))
+        section_distribution[name] = {
+            "avg": round(numbers / n, 2) if n else 0,
+            "distribution": {str(k): v for k, v in enumerate(counts) if v}
+        }
+
+    consecutive = int(totals["consecutive_draws"])
+    return {
+        "number_frequency": {str(i + 1): count for i, count in enumerate(totals["number_counts"].tolist())},
+        "odd_even_distribution": {f"{i}_odd": count for i, count in enumerate(totals["odd_even_counts"].tolist())},
+        "sum_distribution": {"ranges": list(SUM_RANGES), "counts": totals["sum_counts"].tolist()},
+        "consecutive_stats": {"has_consecutive": consecutive, "no_consecutive": n - consecutive},
+        "section_distribution": section_distribution,
+        "total_draws": n
+    }
+
+
+def flatten_totals(totals: Dict[str, Any]) -> np.ndarray:
+    """Running totals as a flat int64 vector (TOTALS_LAYOUT order)."""
+    return np.concatenate([np.ravel(totals[name]).astype(np.int64) for name, _ in TOTALS_LAYOUT])
+
+
+def unflatten_totals(vector: np.ndarray) -> Dict[str, Any]:
+    """Running totals from a flat vector (TOTALS_LAYOUT order)."""
+    vector = np.asarray(vector, dtype=np.int64)
+    totals: Dict[str, Any] = {}
+    for name, shape in TOTALS_LAYOUT:
+        offset = TOTALS_OFFSETS[name]
+        values = vector[offset:offset + int(np.prod(shape))]
+        totals[name] = int(values[0]) if shape == () else values.reshape(shape)
+    return totals
+
+
+def draw_totals_matrix(numbers: np.ndarray) -> np.ndarray:
+    """Flat running totals of every single draw, (n, TOTALS_WIDTH) indicator rows."""
+    numbers = np.asarray(numbers, dtype=np.int64).reshape(-1, 6)
+    n = len(numbers)
+    rows = np.arange(n)
+    totals = np.zeros((n, TOTALS_WIDTH), dtype=np.uint8)
+
+    # Numbers are distinct within a draw, so each sets its own column
+    totals[rows[:, None], TOTALS_OFFSETS["number_counts"] + numbers - 1] = 1
+    totals[rows, TOTALS_OFFSETS["odd_even_counts"] + np.count_nonzero(numbers & 1, axis=1)] = 1
+    buckets = np.digitize(numbers.sum(axis=1), SUM_BIN_EDGES, right=True)
+    totals[rows, TOTALS_OFFSETS["sum_counts"] + buckets] = 1
+    sections = np.digitize(numbers, SECTION_EDGES, right=True)
+    for section in range(len(SECTION_NAMES)):
+        counts = np.count_nonzero(sections == section, axis=1)
+        totals[rows, TOTALS_OFFSETS["section_counts"] + section * 7 + counts] = 1
+    gaps = np.diff(np.sort(numbers, axis=1), axis=1)
+    totals[:, TOTALS_OFFSETS["consecutive_draws"]] = (gaps == 1).any(axis=1)
+    totals[:, TOTALS_OFFSETS["total_draws"]] = 1
+    return totals
+
+
+def prefix_totals(numbers: np.ndarray) -> np.ndarray:
+    """
+    Cumulative running totals, (n + 1, TOTALS_WIDTH) with a leading zero row:
+    the totals of draws [i, j) are row j minus row i. Stored in the smallest
+    unsigned dtype that holds n (uint16 for the real history).
+    """
+    per_draw = draw_totals_matrix(numbers)
+    dtype = np.min_scalar_type(max(len(per_draw), 1))
+    prefix = np.zeros((len(per_draw) + 1, TOTALS_WIDTH), dtype=dtype)
+    prefix[1:] = per_draw
+    np.cumsum(prefix, axis=0, out=prefix)  # In place: no widened temporary
+    return prefix
+
+
+def _decode(row: LottoStatistics) -> Dict[str, Any]:
+    """Running totals of a stored row."""
+    return {
+        "total_draws": row.total_draws,
+        "number_counts": np.frombuffer(row.number_counts, dtype=np.int64).copy(),
+        "odd_even_counts": np.frombuffer(row.odd_even_counts, dtype=np.int64).copy(),
+        "sum_counts": np.frombuffer(row.sum_counts, dtype=np.int64).copy(),
+        "section_counts": np.frombuffer(row.section_counts, dtype=np.int64).reshape(len(SECTION_NAMES), 7).copy(),
+        "consecutive_draws": row.consecutive_draws
+    }
+
+
+def _encode(row: LottoStatistics, totals: Dict[str, Any]) -> None:
+    """Write running totals into a row."""
+    row.total_draws = int(totals["total_draws"])
+    row.number_counts = np.asarray(totals["number_counts"], dtype=np.int64).tobytes()
+    row.odd_even_counts = np.asarray(totals["odd_even_counts"], dtype=np.int64).tobytes()
+    row.sum_counts = np.asarray(totals["sum_counts"], dtype=np.int64).tobytes()
+    row.section_counts = np.asarray(totals["section_counts"], dtype=np.int64).tobytes()
+    row.consecutive_draws = int(totals["consecutive_draws"])
+
+
+class StatisticsStore:
+    """Service class for the materialized statistics row."""
+
+    @staticmethod
+    def is_synced(db: Session, row: Optional[LottoStatistics]) -> bool:
+        """Check that the row covers exactly the stored draws (same count and latest draw)."""
+        if row is None:
+            return False
+        total_draws, latest_draw = db.query(func.count(LottoResult.id), func.max(LottoResult.draw_no)).one()
+        return row.total_draws == total_draws and row.latest_draw == latest_draw
+
+    @staticmethod
+    def get_totals(db: Session) -> Dict[str, Any]:
+        """
+        Running totals of the whole history (materialized on first use).
+        A row that drifted from the draw table (e.g. draws written around
+        LottoDBService) is rebuilt.
+        """
+        row = db.query(LottoStatistics).first()
+        if not StatisticsStore.is_synced(db, row):
+            return StatisticsStore.rebuild(db)
+        return _decode(row)
+
+    @staticmethod
+    def rebuild(db: Session) -> Dict[str, Any]:
+        """Recompute the totals with GROUP BY queries over draw_numbers."""
+        DrawNumberIndex.ensure_synced(db)
+        totals = fold_totals(number_frequency(db), draw_profiles(db))
+        latest_draw = db.query(func.max(LottoResult.draw_no)).scalar()
+
+        # Update the row in place (it may already be loaded in this session)
+        row = db.query(LottoStatistics).first()
+        if row is None:
+            row = LottoStatistics()
+            db.add(row)
+        row.latest_draw = latest_draw
+        _encode(row, totals)
+        db.commit()
+        return totals
+
+    @staticmethod
+    def on_draw_added(db: Session, draw: LottoResult) -> None:
+        """Stage the totals update for an inserted draw (committed with the draw)."""
+        StatisticsStore._apply(db, draw, 1)
+
+    @staticmethod
+    def on_draw_removed(db: Session, draw: LottoResult) -> None:
+        """Stage the totals update for a deleted draw (committed with the delete)."""
+        StatisticsStore._apply(db, draw, -1)
+
+    @staticmethod
+    def clear(db: Session) -> None:
+        """Stage the removal of the totals (rebuilt empty on the next read)."""
+        db.query(LottoStatistics).delete(synchronize_session=False)
+
+    @staticmethod
+    def _apply(db: Session, draw: LottoResult, sign: int) -> None:
+        # Flush first: the pending draw write takes SQLite's write lock, so
+        # this read-modify-write cannot interleave with another writer
+        db.flush()
+        row = db.query(LottoStatistics).first()
+        if row is None:
+            return  # Not materialized yet; the next read rebuilds it
+
+        totals = _decode(row)
+        delta = draw_totals([draw.num1, draw.num2, draw.num3, draw.num4, draw.num5, draw.num6])
+        for key, value in delta.items():
+            totals[key] = totals[key] + sign * value
+        _encode(row, totals)
+
+        # The draw itself may not be flushed as deleted yet, so exclude it
+        latest = db.query(func.max(LottoResult.draw_no)).filter(LottoResult.draw_no != draw.draw_no).scalar()
+        if sign > 0:
+            latest = max(latest or draw.draw_no, draw.draw_no)
+        row.latest_draw = latest
@@ -0,0 +1,91 @@
+"""
+Ensemble ticket engine.
+Runs every served model once on the next-draw features, turns the raw
+position predictions into one score per number (1-45) and samples any
+number of distinct-number tickets from it in a single vectorized step.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from services.draw_store import get_draw_store
+from services.model_registry import model_registry
+from services.prediction_cache import PredictionCache
+
+SCORE_BANDWIDTH = 1.5  # Spread of each predicted value over neighbouring numbers
+SCORE_FLOOR = 0.05  # Share of the score mass spread evenly, so every number stays possible
+MAX_TICKETS = 10000
+
+# Number scores only change when a draw is added or a new model set is published
+score_cache = PredictionCache()
+
+
+def number_scores(raw: np.ndarray) -> np.ndarray:
+    """
+    Per-number probabilities (45,) from raw model outputs (models, 6).
+    Each predicted value votes for the numbers around it with a Gaussian
+    kernel; the votes of all models and positions are averaged.
+    """
+    raw = np.atleast_2d(np.asarray(raw, dtype=np.float64))
+    numbers = np.arange(1, 46, dtype=np.float64)
+    votes = np.exp(-0.5 * ((numbers[None, None, :] - raw[:, :, None]) / SCORE_BANDWIDTH) ** 2)
+    # Every prediction casts one vote in total, whatever its position
+    votes /= votes.sum(axis=2, keepdims=True)
+    scores = votes.mean(axis=(0, 1))
+    return (1 - SCORE_FLOOR) * scores + SCORE_FLOOR / 45
+
+
+def sample_tickets(scores: np.ndarray, count: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Draw `count` sorted tickets of 6 distinct numbers, (count, 6).
+    Gumbel top-k: the 6 largest log-score + Gumbel noise keys of a row are a
+    sample without replacement proportional to the scores.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    keys = np.log(scores)[None, :] + rng.gumbel(size=(count, 45))
+    top = np.argpartition(-keys, 5, axis=1)[:, :6]
+    return np.sort(top + 1, axis=1)
+
+
+def ensemble_scores() -> Dict[str, Any]:
+    """
+    Number scores of the served models for the next draw (cached per data
+    and model version). Uniform scores when no model is trained.
+    """
+    bundle = model_registry.get()
+    store = get_draw_store()
+    if bundle is None or len(store) < 5:
+        return {"scores": [1 / 45] * 45, "source": "random", "version": None, "latest_draw": store.latest_draw_no}
+
+    key = (store.latest_draw_no, bundle.version)
+    cached = score_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # One predict call per model on the next-draw feature row
+    X = bundle.scaled_features(store, [-1])
+    raw = np.vstack([bundle.predict(model_name, X) for model_name in bundle.models])
+    result = {
+        "scores": number_scores(raw).tolist(),
+        "source": "ensemble",
+        "version": bundle.version,
+        "latest_draw": store.latest_draw_no
+    }
+    score_cache.put(key, result)
+    return result
+
+
+def generate_tickets(count: int, seed: Optional[int] = None) -> Dict[str, Any]:
+    """Generate `count` ensemble tickets; the same seed yields the same tickets."""
+    if not 1 <= count <= MAX_TICKETS:
+        raise ValueError(f"count must be between 1 and {MAX_TICKETS}.")
+
+    ensemble = ensemble_scores()
+    tickets = sample_tickets(np.array(ensemble["scores"]), count, np.random.default_rng(seed))
+    return {
+        **ensemble,
+        "count": count,
+        "seed": seed,
+        "tickets": tickets.tolist()
+    }
@@ -0,0 +1,167 @@
+"""
+Compiled inference for the tree ensembles.
+Flattens the fitted forests and boosting stages of a MultiOutputRegressor
+(or a native multi-output forest) into contiguous node arrays and evaluates
+every tree of every number position with one vectorized fixed-depth
+traversal, bypassing sklearn's per-call validation and dispatch.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import ExtraTreesRegressor, GradientBoostingRegressor, RandomForestRegressor
+from sklearn.multioutput import MultiOutputRegressor
+
+TREE_LEAF = -1
+FORESTS = (RandomForestRegressor, ExtraTreesRegressor)
+
+
+class CompiledTreeEnsemble:
+    """
+    Node arrays of all trees of a multi-output tree ensemble.
+
+    Leaves point to themselves, so `max_depth` traversal steps land every
+    row on its leaf regardless of the depth of the individual trees.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        targets: List[Tuple[int, int, int]],
+        init: np.ndarray,
+        scale: np.ndarray,
+        n_features: int
+    ):
+        self.kind = kind                # "forest" or "boosting"
+        self.feature = feature          # int32 (nodes,), 0 for leaves
+        self.threshold = threshold      # float64 (nodes,)
+        self.left = left                # int32 (nodes,), self for leaves
+        self.right = right              # int32 (nodes,), self for leaves
+        self.value = value              # float64 (nodes, outputs per tree)
+        self.roots = roots              # int32 (trees,)
+        self.max_depth = max_depth
+        self.targets = targets          # per number position: (tree start, tree end, value column)
+        self.init = init                # float64 (positions,) boosting baseline
+        self.scale = scale              # float64 (positions,) learning rate
+        self.n_features_in_ = n_features
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def leaf_nodes(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node reached by each row in each tree, shape (rows, trees)."""
+        # Trees split on float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict (rows, positions); matches the sklearn model's `predict`."""
+        X = np.atleast_2d(X)
+        leaves = self.leaf_nodes(X)
+        out = np.empty((len(X), len(self.targets)), dtype=np.float64)
+
+        for t, (start, end, column) in enumerate(self.targets):
+            values = self.value[leaves[:, start:end], column]
+            # Accumulate tree by tree in the same order as sklearn, so the
+            # floating point result is identical (cumsum is sequential)
+            if self.kind == "forest":
+                out[:, t] = np.cumsum(values, axis=1)[:, -1] / (end - start)
+            else:
+                terms = np.empty((len(X), end - start + 1), dtype=np.float64)
+                terms[:, 0] = self.init[t]
+                terms[:, 1:] = self.scale[t] * values
+                out[:, t] = np.cumsum(terms, axis=1)[:, -1]
+        return out
+
+
+def _trees_of(estimator: Any) -> Optional[Tuple[str, List[Any], float, float]]:
+    """(kind, trees, init, scale) of a fitted single-output tree ensemble."""
+    if isinstance(estimator, FORESTS):
+        return "forest", list(estimator.estimators_), 0.0, 1.0
+    if isinstance(estimator, GradientBoostingRegressor):
+        if estimator.init_ == "zero":
+            init = 0.0
+        else:
+            init = float(estimator.init_.predict(np.zeros((1, estimator.n_features_in_)))[0])
+        trees = [stage[0] for stage in estimator.estimators_]
+        return "boosting", trees, init, float(estimator.learning_rate)
+    return None
+
+
+def compile_model(model: Any) -> Optional[CompiledTreeEnsemble]:
+    """
+    Compile a fitted MultiOutputRegressor of forests or boosting ensembles,
+    or a native multi-output forest.
+    Returns None for models without a compiled path (e.g. the MLP).
+    """
+    if not hasattr(model, "estimators_"):
+        return None
+    if isinstance(model, FORESTS):
+        # One set of trees whose leaves hold every output
+        return _compile_parts([_trees_of(model)], outputs=model.n_outputs_, n_features=model.n_features_in_)
+    if not isinstance(model, MultiOutputRegressor):
+        return None
+
+    parts = [_trees_of(estimator) for estimator in model.estimators_]
+    if any(part is None for part in parts) or len({kind for kind, _, _, _ in parts}) != 1:
+        return None
+    return _compile_parts(parts, outputs=1, n_features=model.n_features_in_)
+
+
+def _compile_parts(
+    parts: List[Tuple[str, List[Any], float, float]],
+    outputs: int,
+    n_features: int
+) -> CompiledTreeEnsemble:
+    """Concatenate the node arrays of every tree of every part."""
+    features, thresholds, lefts, rights, values = [], [], [], [], []
+    roots: List[int] = []
+    targets: List[Tuple[int, int, int]] = []
+    max_depth = 0
+    offset = 0
+
+    for _, trees, _, _ in parts:
+        start = len(roots)
+        for tree in trees:
+            nodes = tree.tree_
+            node_ids = np.arange(nodes.node_count, dtype=np.int32)
+            is_leaf = nodes.children_left == TREE_LEAF
+
+            features.append(np.where(is_leaf, 0, nodes.feature).astype(np.int32))
+            thresholds.append(nodes.threshold.astype(np.float64))
+            lefts.append(np.where(is_leaf, node_ids, nodes.children_left).astype(np.int32) + offset)
+            rights.append(np.where(is_leaf, node_ids, nodes.children_right).astype(np.int32) + offset)
+            values.append(nodes.value[:, :, 0].astype(np.float64))
+            roots.append(offset)
+
+            max_depth = max(max_depth, int(nodes.max_depth))
+            offset += nodes.node_count
+        targets.extend((start, len(roots), column) for column in range(outputs))
+
+    return CompiledTreeEnsemble(
+        kind=parts[0][0],
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        left=np.concatenate(lefts),
+        right=np.concatenate(rights),
+        value=np.concatenate(values),
+        roots=np.array(roots, dtype=np.int32),
+        max_depth=max_depth,
+        targets=targets,
+        init=np.repeat([init for _, _, init, _ in parts], outputs).astype(np.float64),
+        scale=np.repeat([scale for _, _, _, scale in parts], outputs).astype(np.float64),
+        n_features=int(n_features)
+    )
@@ -0,0 +1,38 @@
+"""Fixtures shared by the service tests: database sessions and model environments."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import services.ml_service as ml_service
+import services.parallel as parallel
+from database import Base
+from services.model_registry import ModelRegistry
+from services.prediction_cache import PredictionCache
+from tests.helpers import make_store
+
+
+@pytest.fixture
+def db():
+    """In-memory database session."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def ml_env(tmp_path, monkeypatch):
+    """Train against a synthetic store into a temporary model directory."""
+    store = make_store(60)
+    # Allow the multi-worker tests regardless of the machine's CPU budget
+    monkeypatch.setattr(parallel, "available_cpus", lambda: 4)
+    monkeypatch.setattr(parallel, "resource_policy", parallel.ResourcePolicy())
+    monkeypatch.setattr(ml_service, "model_registry", ModelRegistry(tmp_path))
+    monkeypatch.setattr(ml_service, "get_draw_store", lambda: store)
+    # Predictions cached by earlier tests belong to other stores and registries
+    monkeypatch.setattr(ml_service, "prediction_cache", PredictionCache())
+    return store
@@ -0,0 +1,34 @@
+"""Synthetic data builders shared by the service tests."""
+
+import numpy as np
+
+from services.draw_store import DrawStore
+from services.feature_service import build_feature_matrix
+
+
+def make_draws(n: int, seed: int = 0) -> list:
+    """Build synthetic draw payloads in the API format."""
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "draw_no": i + 1,
+            "draw_date": "2024-01-01",
+            "numbers": [int(x) for x in rng.choice(45, 6, replace=False) + 1],
+            "bonus": int(rng.integers(1, 46)),
+        }
+        for i in range(n)
+    ]
+
+
+def make_store(n: int, seed: int = 0) -> DrawStore:
+    """Build an in-memory DrawStore from synthetic draws."""
+    rng = np.random.default_rng(seed)
+    numbers = np.sort(np.array([rng.choice(45, 6, replace=False) + 1 for _ in range(n)]), axis=1)
+    return DrawStore(
+        draw_no=np.arange(1, n + 1, dtype=np.int16),
+        draw_dates=np.array(["2024-01-01"] * n, dtype=object),
+        numbers=numbers.astype(np.uint8),
+        bonus=rng.integers(1, 46, n).astype(np.uint8),
+        features=build_feature_matrix(numbers, dtype=np.float32),
+        version=0
+    )
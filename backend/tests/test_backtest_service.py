@@ -0,0 +1,71 @@
+import pytest
+
+import services.backtest_service as backtest_service
+from services.draw_store import DrawStore
+from tests.helpers import make_store
+
+
+def truncate(store: DrawStore, n: int) -> DrawStore:
+    """Store holding only the first n draws of `store`."""
+    return DrawStore(
+        draw_no=store.draw_no[:n],
+        draw_dates=store.draw_dates[:n],
+        numbers=store.numbers[:n],
+        bonus=store.bonus[:n],
+        features=store.features[:n + 1],
+        version=n
+    )
+
+
+@pytest.fixture
+def full_store():
+    return make_store(70)
+
+
+class TestBacktest:
+    """Test walk-forward backtesting and its fold cache."""
+
+    def test_scores_every_draw_after_min_train(self, full_store, tmp_path, monkeypatch):
+        monkeypatch.setattr(backtest_service, "get_draw_store", lambda: truncate(full_store, 60))
+
+        result = backtest_service.run_backtest("random_forest", step=10, min_train=40, workers=1, cache_dir=tmp_path)
+
+        assert result["folds"] == 2
+        assert result["computed_folds"] == 2
+        assert result["draws_evaluated"] == 20
+        assert [draw["draw_no"] for draw in result["draws"]] == list(range(41, 61))
+        assert sum(result["hit_distribution"].values()) == 20
+        assert sum(result["rank_counts"].values()) == 20
+        for draw in result["draws"]:
+            assert len(set(draw["numbers"])) == 6
+
+    def test_only_new_folds_run_after_sync(self, full_store, tmp_path, monkeypatch):
+        monkeypatch.setattr(backtest_service, "get_draw_store", lambda: truncate(full_store, 60))
+        first = backtest_service.run_backtest("random_forest", step=10, min_train=40, workers=1, cache_dir=tmp_path)
+
+        again = backtest_service.run_backtest("random_forest", step=10, min_train=40, workers=1, cache_dir=tmp_path)
+        assert again["computed_folds"] == 0
+        assert again["draws"] == first["draws"]
+
+        monkeypatch.setattr(backtest_service, "get_draw_store", lambda: full_store)
+        synced = backtest_service.run_backtest("random_forest", step=10, min_train=40, workers=1, cache_dir=tmp_path)
+        assert synced["computed_folds"] == 1
+        assert synced["cached_folds"] == 2
+        assert synced["draws"][:20] == first["draws"]
+
+    def test_uses_training_output_mode(self, full_store, tmp_path, monkeypatch):
+        monkeypatch.setattr(backtest_service, "get_draw_store", lambda: truncate(full_store, 60))
+        monkeypatch.setattr(backtest_service, "TRAIN_OUTPUT_MODE", "wrapped")
+        wrapped = backtest_service.run_backtest("random_forest", step=10, min_train=40, workers=1, cache_dir=tmp_path)
+        assert wrapped["output_mode"] == "wrapped"
+
+        monkeypatch.setattr(backtest_service, "TRAIN_OUTPUT_MODE", "native")
+        native = backtest_service.run_backtest("random_forest", step=10, min_train=40, workers=1, cache_dir=tmp_path)
+
+        # Native estimators have their own fold cache
+        assert native["output_mode"] == "native"
+        assert native["computed_folds"] == 2
+
+    def test_unknown_model(self, tmp_path):
+        with pytest.raises(ValueError):
+            backtest_service.run_backtest("unknown", cache_dir=tmp_path)
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import services.draw_store as draw_store
+import services.snapshot_service as snapshot_service
+from database import Base
+from services.db_service import LottoDBService
+from tests.helpers import make_draws
+
+
+@pytest.fixture
+def session_factory(monkeypatch, tmp_path):
+    """Point the DrawStore at an in-memory database and a temporary snapshot."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(draw_store, "SessionLocal", factory)
+    monkeypatch.setattr(draw_store, "SNAPSHOT_PATH", tmp_path / "draw_snapshot.npz")
+    monkeypatch.setattr(snapshot_service, "SNAPSHOT_PATH", tmp_path / "draw_snapshot.npz")
+    draw_store.invalidate_draw_store()
+    yield factory
+    draw_store.invalidate_draw_store()
+
+
+class TestDrawStore:
+    """Test in-memory draw store loading and invalidation."""
+
+    def test_load_arrays(self, session_factory):
+        db = session_factory()
+        draws = make_draws(20)
+        for draw in draws:
+            LottoDBService.add_draw(db, draw)
+
+        store = draw_store.get_draw_store()
+
+        assert len(store) == 20
+        assert store.draw_no.dtype == np.int16
+        assert store.numbers.dtype == np.uint8
+        assert store.features.shape == (21, 79)
+        assert store.features.dtype == np.float32
+        assert store.latest_result()["numbers"] == sorted(draws[-1]["numbers"])
+        expected_mask = sum(1 << (n - 1) for n in draws[0]["numbers"])
+        assert int(store.masks[0]) == expected_mask
+
+    def test_reused_until_data_version_changes(self, session_factory):
+        db = session_factory()
+        draws = make_draws(11)
+        for draw in draws[:10]:
+            LottoDBService.add_draw(db, draw)
+
+        store = draw_store.get_draw_store()
+        assert draw_store.get_draw_store() is store
+
+        LottoDBService.add_draw(db, draws[10])
+        reloaded = draw_store.get_draw_store()
+
+        assert reloaded is not store
+        assert len(reloaded) == 11
+
+        LottoDBService.delete_draw_by_number(db, 11)
+        assert len(draw_store.get_draw_store()) == 10
+
+
+class TestSnapshot:
+    """Test the columnar draw snapshot."""
+
+    def test_snapshot_reused_until_table_changes(self, session_factory, tmp_path, monkeypatch):
+        db = session_factory()
+        draws = make_draws(12)
+        for draw in draws[:11]:
+            LottoDBService.add_draw(db, draw)
+
+        path = tmp_path / "draw_snapshot.npz"
+        first = snapshot_service.load_snapshot(db, path)
+        assert path.exists()
+
+        # A current snapshot is served without touching the tables
+        reads = []
+        read_tables = snapshot_service.read_tables
+        monkeypatch.setattr(snapshot_service, "read_tables", lambda db: reads.append(1) or read_tables(db))
+        cached = snapshot_service.load_snapshot(db, path)
+        assert reads == []
+        for name in snapshot_service.SNAPSHOT_COLUMNS:
+            np.testing.assert_array_equal(cached[name], first[name])
+
+        LottoDBService.add_draw(db, draws[11])
+        updated = snapshot_service.load_snapshot(db, path)
+        assert reads == [1]
+        assert len(updated["draw_no"]) == 12
+        assert updated["features"].shape == (13, 79)
+        assert updated["numbers"].dtype == np.uint8
+
+    def test_ml_dataframe_from_snapshot(self, session_factory):
+        db = session_factory()
+        draws = make_draws(8)
+        for draw in draws:
+            LottoDBService.add_draw(db, draw)
+
+        df = LottoDBService.get_all_draws_for_ml(db)
+
+        assert list(df.columns) == [
+            "draw_no", "draw_date", "num1", "num2", "num3", "num4", "num5", "num6", "bonus", "prize_1st"
+        ]
+        assert df["draw_no"].tolist() == [draw["draw_no"] for draw in draws]
+        assert df.iloc[-1][[f"num{j}" for j in range(1, 7)]].tolist() == sorted(draws[-1]["numbers"])
@@ -0,0 +1,59 @@
+import numpy as np
+
+from services.evaluation_service import evaluate_predictions, hit_counts, postprocess_batch, winner_ranks
+from services.simulation_service import check_winner_rank
+
+
+def loop_accuracy(predictions: np.ndarray, y: np.ndarray, k: int) -> float:
+    """Reference ±k accuracy computed the way evaluate_model used to."""
+    correct = sum(
+        1 for i in range(len(predictions)) for j in range(6)
+        if abs(round(predictions[i][j]) - y[i][j]) <= k
+    )
+    return round(correct / predictions.size, 4)
+
+
+class TestEvaluationEngine:
+    """Test vectorized evaluation metrics."""
+
+    def test_accuracy_matches_reference_loop(self):
+        rng = np.random.default_rng(1)
+        predictions = rng.uniform(0, 46, (200, 6))
+        predictions[:5] = np.array([0.5, 1.5, 2.5, 3.5, 44.5, 45.5])  # Round-half-even cases
+        y = rng.integers(1, 46, (200, 6))
+
+        metrics = evaluate_predictions(predictions, y)
+
+        for k in range(6):
+            assert metrics["accuracy_within"][str(k)] == loop_accuracy(predictions, y, k)
+        np.testing.assert_allclose(metrics["position_mae"], np.abs(predictions - y).mean(axis=0).round(4))
+        assert sum(metrics["hit_distribution"].values()) == 200
+
+    def test_postprocess_batch_yields_valid_tickets(self):
+        raw = np.array([[1.2, 1.4, 50.0, -3.0, 10.0, 10.4], [5, 6, 7, 8, 9, 10]], dtype=float)
+        tickets = postprocess_batch(raw, np.random.default_rng(0))
+
+        assert tickets.shape == (2, 6)
+        assert all(len(set(row)) == 6 for row in tickets.tolist())
+        assert {1, 45, 10}.issubset(tickets[0])
+        assert tickets[1].tolist() == [5, 6, 7, 8, 9, 10]
+
+    def test_hit_counts(self):
+        tickets = np.array([[1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]])
+        actual = np.array([[1, 2, 3, 40, 41, 42], [7, 8, 9, 10, 11, 12]])
+
+        assert hit_counts(tickets, actual).tolist() == [3, 6]
+
+    def test_winner_ranks_match_check_winner_rank(self):
+        rng = np.random.default_rng(3)
+        actual = np.sort(np.array([rng.choice(45, 6, replace=False) + 1 for _ in range(300)]), axis=1)
+        bonus = np.array([rng.choice(np.setdiff1d(np.arange(1, 46), row)) for row in actual])
+        # Tickets overlapping the draw by 0-6 numbers, some holding the bonus
+        tickets = actual.copy()
+        for i, keep in enumerate(rng.integers(0, 7, len(actual))):
+            others = rng.permutation(np.setdiff1d(np.arange(1, 46), actual[i]))[:6 - keep]
+            tickets[i] = np.sort(np.concatenate([actual[i][:keep], others]))
+
+        expected = [check_winner_rank(t, a, int(b)) for t, a, b in zip(tickets.tolist(), actual.tolist(), bonus)]
+        np.testing.assert_array_equal(winner_ranks(tickets, actual, bonus), expected)
+        assert set(expected) == {0, 1, 2, 3, 4, 5}
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.feature_service import (
+    DEFAULT_FEATURE_GROUPS,
+    N_FEATURES,
+    build_feature_matrix,
+    group_columns,
+    incidence_matrix,
+    resolve_feature_groups,
+    to_number_matrix
+)
+from services.ml_service import extract_features, prepare_training_data
+
+
+def make_draws_df(n: int, seed: int = 0) -> pd.DataFrame:
+    """Build a synthetic draws DataFrame with sorted numbers."""
+    rng = np.random.default_rng(seed)
+    numbers = np.sort(np.array([rng.choice(45, 6, replace=False) + 1 for _ in range(n)]).reshape(n, 6), axis=1)
+    df = pd.DataFrame(numbers, columns=[f'num{j}' for j in range(1, 7)])
+    df.insert(0, 'draw_no', np.arange(1, n + 1))
+    df['bonus'] = rng.integers(1, 46, n)
+    return df
+
+
+class TestFeatureMatrix:
+    """Test vectorized feature matrix against extract_features."""
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 6, 120, 250])
+    def test_parity_with_extract_features(self, n):
+        df = make_draws_df(n, seed=n)
+        matrix = build_feature_matrix(to_number_matrix(df))
+
+        assert matrix.shape == (n + 1, N_FEATURES)
+        for idx in range(n + 1):
+            np.testing.assert_array_equal(matrix[idx], np.array(extract_features(df, idx)))
+
+    def test_prepare_training_data_shapes(self):
+        df = make_draws_df(40)
+        X, y = prepare_training_data(df)
+
+        assert X.shape == (35, N_FEATURES)
+        assert X.dtype == np.float32
+        np.testing.assert_array_equal(y, to_number_matrix(df)[5:])
+        np.testing.assert_array_equal(X[0], np.array(extract_features(df, 5), dtype=np.float32))
+
+    def test_incidence_matrix(self):
+        incidence = incidence_matrix(np.array([[1, 2, 3, 4, 5, 45]]))
+
+        assert incidence.shape == (1, 45)
+        assert incidence.sum() == 6
+        assert incidence[0, 44] == 1
+
+
+class TestFeatureGroups:
+    """Test the feature-group registry."""
+
+    def test_groups_match_reference_loops(self):
+        df = make_draws_df(130, seed=9)
+        numbers = to_number_matrix(df)
+        matrix = build_feature_matrix(numbers, groups=("gaps", "pair_counts"))
+
+        for idx in range(len(numbers) + 1):
+            previous = set(numbers[idx - 1]) if idx > 0 else set()
+            for k in range(1, 46):
+                drawn = [j for j in range(idx) if k in numbers[j]]
+                assert matrix[idx, k - 1] == idx - (drawn[-1] if drawn else -1)
+                pairs = sum(
+                    len(previous & set(numbers[j]))
+                    for j in range(max(0, idx - 101), idx - 1) if k in numbers[j]
+                )
+                assert matrix[idx, 45 + k - 1] == pairs
+
+    def test_group_columns_select_from_combined_matrix(self):
+        numbers = to_number_matrix(make_draws_df(50, seed=2))
+        groups = resolve_feature_groups(["frequency", "gaps", "prev_draws"])
+        combined = build_feature_matrix(numbers, groups=groups)
+
+        assert groups == ("prev_draws", "frequency", "gaps")
+        np.testing.assert_array_equal(
+            combined[:, group_columns(groups, ["gaps"])], build_feature_matrix(numbers, groups=["gaps"])
+        )
+        np.testing.assert_array_equal(
+            combined[:, group_columns(groups, ["prev_draws", "frequency"])],
+            build_feature_matrix(numbers, groups=["prev_draws", "frequency"])
+        )
+        assert build_feature_matrix(numbers).shape[1] == N_FEATURES
+        assert len(group_columns(DEFAULT_FEATURE_GROUPS, DEFAULT_FEATURE_GROUPS)) == N_FEATURES
+
+    def test_unknown_group(self):
+        with pytest.raises(ValueError):
+            resolve_feature_groups(["frequency", "moon_phase"])
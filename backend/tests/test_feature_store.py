@@ -0,0 +1,57 @@
+import numpy as np
+
+from database import LottoFeature
+from services.db_service import LottoDBService
+from services.feature_service import build_feature_matrix
+from services.feature_store import FeatureStore
+from tests.helpers import make_draws
+
+
+def expected_matrix(draws: list) -> np.ndarray:
+    ordered = sorted(draws, key=lambda d: d["draw_no"])
+    return build_feature_matrix(np.array([sorted(d["numbers"]) for d in ordered]))
+
+
+class TestFeatureStore:
+    """Test incremental feature store maintenance."""
+
+    def test_incremental_append_matches_full_build(self, db):
+        draws = make_draws(130)
+        for draw in draws:
+            LottoDBService.add_draw(db, draw)
+
+        X, y = FeatureStore.get_training_rows(db)
+        expected = expected_matrix(draws)
+
+        np.testing.assert_array_equal(X, expected[5:130])
+        np.testing.assert_array_equal(FeatureStore.get_next_features(db), expected[130])
+        assert y.shape == (125, 6)
+
+    def test_pending_row_keyed_after_latest(self, db):
+        for draw in make_draws(8):
+            LottoDBService.add_draw(db, draw)
+
+        pending = db.query(LottoFeature).filter(LottoFeature.is_next.is_(True)).one()
+        assert pending.draw_no == 9
+
+    def test_out_of_order_insert_and_delete_rebuild(self, db):
+        draws = make_draws(30)
+        for draw in draws[:10] + draws[11:]:
+            LottoDBService.add_draw(db, draw)
+        LottoDBService.add_draw(db, draws[10])
+
+        X, _ = FeatureStore.get_training_rows(db)
+        np.testing.assert_array_equal(X, expected_matrix(draws)[5:30])
+
+        LottoDBService.delete_draw_by_number(db, 20)
+        remaining = [d for d in draws if d["draw_no"] != 20]
+        np.testing.assert_array_equal(FeatureStore.get_next_features(db), expected_matrix(remaining)[-1])
+
+    def test_resync_after_bulk_load(self, db):
+        for draw in make_draws(12):
+            LottoDBService.add_draw(db, draw)
+        FeatureStore.clear(db)
+
+        assert not FeatureStore.is_synced(db)
+        X, _ = FeatureStore.get_training_rows(db)
+        assert X.shape == (7, 79)
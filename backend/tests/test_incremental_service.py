@@ -0,0 +1,56 @@
+import pytest
+
+import services.incremental_service as incremental_service
+import services.ml_service as ml_service
+from tests.helpers import make_store
+
+
+@pytest.fixture
+def trained(ml_env, monkeypatch):
+    """Models trained on 60 draws; the store then grows to 70 draws."""
+    monkeypatch.setattr(ml_service, "TRAIN_PARALLEL", False)
+    monkeypatch.setattr(incremental_service, "model_registry", ml_service.model_registry)
+    monkeypatch.setattr(incremental_service, "get_draw_store", lambda: ml_env)
+    ml_service.train_models()
+
+    grown = make_store(70)
+    monkeypatch.setattr(ml_service, "get_draw_store", lambda: grown)
+    monkeypatch.setattr(incremental_service, "get_draw_store", lambda: grown)
+    monkeypatch.setattr(incremental_service, "INCREMENTAL_DRIFT_TOLERANCE", 1.0)
+    return ml_service.model_registry.get()
+
+
+class TestIncrementalUpdate:
+    """Test warm-start / partial_fit updates and the full-retrain fallbacks."""
+
+    def test_incremental_update_grows_trees(self, trained):
+        result = incremental_service.update_models()
+        bundle = ml_service.model_registry.get()
+
+        assert result["update_mode"] == "incremental"
+        assert result["incremental_updates"] == 1
+        assert bundle.version != trained.version
+        assert bundle.training_info["trained_rows"] == 70
+        assert bundle.scaler is trained.scaler
+        for target, estimator in enumerate(bundle.models["random_forest"].estimators_):
+            old = trained.models["random_forest"].estimators_[target]
+            assert len(estimator.estimators_) == len(old.estimators_) + incremental_service.INCREMENTAL_TREES
+        assert ml_service.predict_numbers()["predictions"]
+
+        # Nothing new after the update
+        assert incremental_service.update_models() is None
+
+    def test_scheduled_full_retrain(self, trained, monkeypatch):
+        monkeypatch.setattr(incremental_service, "INCREMENTAL_FULL_RETRAIN_EVERY", 0)
+        result = incremental_service.update_models()
+
+        assert result["update_mode"] == "full"
+        assert result["full_retrain_reason"] == "scheduled"
+        assert ml_service.model_registry.get().training_info["incremental_updates"] == 0
+
+    def test_drift_triggers_full_retrain(self, trained, monkeypatch):
+        monkeypatch.setattr(incremental_service, "INCREMENTAL_DRIFT_TOLERANCE", -1.0)
+        result = incremental_service.update_models()
+
+        assert result["full_retrain_reason"] == "drift"
+        assert ml_service.model_registry.get().training_info["trained_rows"] == 70
@@ -0,0 +1,93 @@
+import threading
+import time
+
+from services.job_service import JobManager
+
+
+def wait_done(job, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while not job.done and time.time() < deadline:
+        time.sleep(0.01)
+
+
+class TestJobManager:
+    """Test background job lifecycle."""
+
+    def test_completes_with_result_and_progress(self):
+        manager = JobManager()
+
+        def work(ctx):
+            ctx.report("step", 0.5)
+            return {"value": 42}
+
+        job, created = manager.submit("train", work)
+        wait_done(job)
+
+        assert created
+        assert job.status == "completed"
+        assert job.progress == 1.0
+        assert job.result == {"value": 42}
+        assert job.to_dict()["elapsed"] >= 0
+
+    def test_single_flight_coalesces_submissions(self):
+        manager = JobManager()
+        release = threading.Event()
+
+        def work(ctx):
+            release.wait(5)
+            return "done"
+
+        first, created_first = manager.submit("train", work)
+        second, created_second = manager.submit("train", work)
+        release.set()
+        wait_done(first)
+
+        assert created_first and not created_second
+        assert first is second
+
+        third, created_third = manager.submit("train", lambda ctx: "again")
+        assert created_third and third is not first
+
+    def test_cancel_stops_at_next_report(self):
+        manager = JobManager()
+        started = threading.Event()
+
+        def work(ctx):
+            started.set()
+            while True:
+                ctx.report("looping", 0.1)
+                time.sleep(0.01)
+
+        job, _ = manager.submit("train", work)
+        started.wait(5)
+        manager.cancel(job.id)
+        wait_done(job)
+
+        assert job.status == "cancelled"
+
+    def test_failure_records_error(self):
+        manager = JobManager()
+
+        def work(ctx):
+            raise ValueError("boom")
+
+        job, _ = manager.submit("train", work)
+        wait_done(job)
+
+        assert job.status == "failed"
+        assert job.error == "boom"
+
+    def test_job_thread_runs_under_resource_policy(self, monkeypatch):
+        import os
+        import services.job_service as job_service
+        from services.parallel import ResourcePolicy
+        monkeypatch.setattr(job_service, "resource_policy", ResourcePolicy(nice=2))
+        manager = JobManager()
+
+        def work(ctx):
+            return os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+
+        job, _ = manager.submit("train", work)
+        wait_done(job)
+
+        assert job.result == os.getpriority(os.PRIO_PROCESS, 0) + 2
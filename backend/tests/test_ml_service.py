@@ -0,0 +1,279 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import services.ml_service as ml_service
+from services.model_registry import ModelRegistry
+from tests.helpers import make_store
+
+
+class TestTraining:
+    """Test sequential and parallel training modes."""
+
+    def test_parallel_matches_sequential(self, ml_env):
+        X = ml_env.features[5:len(ml_env)]
+
+        sequential = ml_service.train_models(parallel=False)
+        seq_models = ml_service.model_registry.get().models
+        parallel = ml_service.train_models(parallel=True, workers=2)
+
+        assert parallel["parallel"] is True
+        assert parallel["workers"] == 2
+        for name in ml_service.enabled_models():
+            par_model = ml_service.model_registry.get().models[name]
+            np.testing.assert_allclose(par_model.predict(X), seq_models[name].predict(X))
+            assert parallel["models"][name]["test_accuracy"] == sequential["models"][name]["test_accuracy"]
+            assert parallel["models"][name]["fit_time"] > 0
+
+    def test_predict_after_training(self, ml_env):
+        ml_service.train_models(parallel=False)
+        result = ml_service.predict_numbers()
+
+        assert set(result["predictions"]) == set(ml_service.enabled_models())
+        for prediction in result["predictions"].values():
+            assert len(set(prediction["numbers"])) == 6
+
+    def test_abort_before_saving_writes_nothing(self, ml_env):
+        def progress(phase, fraction):
+            if phase == "saving":
+                raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError):
+            ml_service.train_models(parallel=False, progress=progress)
+
+        assert ml_service.model_registry.get() is None
+        assert not ml_service.model_registry.versions_dir.exists()
+
+
+class TestPredictAsOf:
+    """Test batched point-in-time predictions."""
+
+    def test_range_with_ranks_and_upcoming_draw(self, ml_env):
+        ml_service.train_models(parallel=False)
+        result = ml_service.predict_as_of(50, 61)
+        bundle = ml_service.model_registry.get()
+
+        assert [draw["draw_no"] for draw in result["draws"]] == list(range(50, 62))
+        upcoming = result["draws"][-1]
+        assert upcoming["actual"] is None and upcoming["predictions"]["random_forest"]["rank"] is None
+
+        X = bundle.scaler.transform(ml_env.features[49:61])
+        raw = bundle.predict("random_forest", X)
+        for offset, draw in enumerate(result["draws"][:-1]):
+            prediction = draw["predictions"]["random_forest"]
+            assert draw["actual"] == sorted(ml_env.numbers[49 + offset].tolist())
+            assert len(set(prediction["numbers"])) == 6
+            assert prediction["hits"] == len(set(prediction["numbers"]) & set(draw["actual"]))
+            # Tickets keep every distinct rounded prediction
+            rounded = set(np.clip(np.round(raw[offset]), 1, 45).astype(int).tolist())
+            assert rounded <= set(prediction["numbers"])
+        assert sum(result["summary"]["random_forest"]["rank_counts"].values()) == 11
+
+    def test_deterministic_and_validated(self, ml_env):
+        ml_service.train_models(parallel=False)
+
+        assert ml_service.predict_as_of(10, 20) == ml_service.predict_as_of(10, 20)
+        with pytest.raises(ValueError):
+            ml_service.predict_as_of(20, 10)
+        with pytest.raises(ValueError):
+            ml_service.predict_as_of(1, 4)  # No row has 5 previous draws
+        with pytest.raises(ValueError):
+            ml_service.predict_as_of(1, ml_service.MAX_AS_OF_DRAWS + 1)
+
+
+class TestTrainingData:
+    """Test the float32 copy-free training split."""
+
+    def test_split_matches_train_test_split(self, ml_env):
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+
+        scaler, X_train, X_test, y_train, y_test = ml_service.split_training_data(ml_env)
+        ref_train, ref_test, ref_y_train, ref_y_test = train_test_split(
+            ml_env.features[5:len(ml_env)], ml_env.numbers[5:].astype(np.int64), test_size=0.2, random_state=42
+        )
+        ref_scaler = StandardScaler().fit(ref_train)
+
+        assert X_train.dtype == X_test.dtype == np.float32
+        np.testing.assert_array_equal(y_train, ref_y_train)
+        np.testing.assert_array_equal(y_test, ref_y_test)
+        np.testing.assert_allclose(X_train, ref_scaler.transform(ref_train), atol=1e-5)
+        np.testing.assert_allclose(X_test, ref_scaler.transform(ref_test), atol=1e-5)
+
+    def test_splits_are_views_and_store_is_untouched(self, ml_env):
+        features = ml_env.features.copy()
+        scaler, X_train, X_test, _, _ = ml_service.split_training_data(ml_env)
+
+        assert X_train.base is not None and X_train.base is X_test.base
+        scaler.transform(ml_env.features)
+        np.testing.assert_array_equal(ml_env.features, features)
+
+    def test_train_reports_memory(self, ml_env):
+        result = ml_service.train_models(parallel=False)
+
+        assert result["memory"]["data_peak_mb"] is None  # Tracing is opt-in
+        assert result["memory"]["max_rss_mb"] > 0
+
+    def test_train_traces_memory_when_enabled(self, ml_env, monkeypatch):
+        monkeypatch.setattr(ml_service, "TRAIN_TRACE_MEMORY", True)
+        result = ml_service.train_models(parallel=False)
+
+        assert result["memory"]["data_peak_mb"] >= 0
+        assert not tracemalloc.is_tracing()
+
+
+class TestModelRegistry:
+    """Test versioned artifact publishing and atomic swap."""
+
+    def test_publish_swaps_and_reloads(self, tmp_path):
+        registry = ModelRegistry(tmp_path, keep_versions=2)
+        assert registry.get() is None
+
+        first = registry.publish("scaler-1", {"m": 1}, {"trained_at": "t1"}, {})
+        second = registry.publish("scaler-2", {"m": 2}, {"trained_at": "t2"}, {})
+
+        assert registry.get() is second
+        assert registry.current_version() == second.version != first.version
+
+        reloaded = ModelRegistry(tmp_path).get()
+        assert reloaded.version == second.version
+        assert reloaded.scaler == "scaler-2"
+        assert reloaded.models == {"m": 2}
+
+    def test_prunes_old_versions(self, tmp_path):
+        registry = ModelRegistry(tmp_path, keep_versions=2)
+        for i in range(4):
+            registry.publish(f"scaler-{i}", {"m": i}, {}, {})
+
+        assert len(list(registry.versions_dir.iterdir())) == 2
+
+
+class TestPredictionCache:
+    """Test prediction caching keyed by (latest draw, model version)."""
+
+    def test_filled_after_training_and_served_from_cache(self, ml_env):
+        ml_service.train_models(parallel=False)
+
+        state = ml_service.prediction_cache.state()
+        assert state["filled"]
+        assert state["latest_draw"] == ml_env.latest_draw_no
+        assert state["model_version"] == ml_service.model_registry.get().version
+
+        first = ml_service.predict_numbers()
+        second = ml_service.predict_numbers()
+
+        assert first == second
+        assert ml_service.prediction_cache.state()["hits"] == 2
+
+    def test_miss_when_latest_draw_changes(self, ml_env, monkeypatch):
+        ml_service.train_models(parallel=False)
+
+        newer = make_store(61)
+        monkeypatch.setattr(ml_service, "get_draw_store", lambda: newer)
+        ml_service.predict_numbers()
+
+        state = ml_service.prediction_cache.state()
+        assert state["misses"] == 1
+        assert state["latest_draw"] == 61
+
+
+class TestOutputModes:
+    """Test native multi-output training."""
+
+    def test_native_mode_trains_single_estimators(self, ml_env):
+        result = ml_service.train_models(parallel=False, output_mode="native")
+        bundle = ml_service.model_registry.get()
+
+        assert result["output_mode"] == "native"
+        assert not isinstance(bundle.models["random_forest"], ml_service.MultiOutputRegressor)
+        assert isinstance(bundle.models["gradient_boosting"], ml_service.MultiOutputRegressor)
+        assert "random_forest" in bundle.compiled
+        assert ml_service.predict_numbers()["predictions"]["neural_network"]["numbers"]
+
+    def test_native_parallel_matches_sequential(self, ml_env):
+        X = ml_env.features[5:len(ml_env)]
+        ml_service.train_models(parallel=False, output_mode="native")
+        sequential = ml_service.model_registry.get().models
+        ml_service.train_models(parallel=True, workers=2, output_mode="native")
+        parallel = ml_service.model_registry.get().models
+
+        for name in ml_service.enabled_models():
+            np.testing.assert_allclose(parallel[name].predict(X), sequential[name].predict(X))
+
+    def test_compare_output_modes(self, ml_env, monkeypatch):
+        import services.model_comparison as model_comparison
+        monkeypatch.setattr(model_comparison, "get_draw_store", lambda: ml_env)
+
+        report = model_comparison.compare_output_modes(repeat=2)
+
+        assert set(report["modes"]) == {"wrapped", "native"}
+        native = report["modes"]["native"]
+        assert native["random_forest"]["native"] and not native["gradient_boosting"]["native"]
+        for stats in report["modes"]["wrapped"].values():
+            assert stats["pickle_bytes"] > 0 and stats["predict_ms"] > 0
+
+
+class TestFeatureGroupSelection:
+    """Test models consuming different feature groups."""
+
+    def test_lazy_groups_cached_per_store(self, ml_env, monkeypatch):
+        import services.draw_store as draw_store
+        calls = []
+        build = draw_store.build_feature_matrix
+        monkeypatch.setattr(draw_store, "build_feature_matrix", lambda *a, **k: calls.append(k["groups"]) or build(*a, **k))
+
+        assert np.shares_memory(ml_env.feature_group("frequency"), ml_env.features)
+        gaps = ml_env.feature_group("gaps")
+        assert ml_env.feature_group("gaps") is gaps
+        assert gaps.dtype == np.float32
+        ml_env.feature_matrix(("prev_draws", "gaps"), rows=[5, 6])
+        assert calls == [["gaps"]]
+
+    def test_train_and_serve_with_model_feature_groups(self, ml_env, monkeypatch):
+        import services.model_zoo as model_zoo
+        monkeypatch.setattr(model_zoo, "MODEL_FEATURE_GROUPS", {"neural_network": ["frequency", "gaps"]})
+
+        result = ml_service.train_models(parallel=False)
+        bundle = ml_service.model_registry.get()
+
+        assert bundle.feature_groups == ("prev_draws", "odd_even", "high_low", "mean_std", "frequency", "gaps")
+        assert set(bundle.columns) == {"random_forest", "gradient_boosting", "neural_network"}
+        assert bundle.models["neural_network"].n_features_in_ == 90
+        assert result["models"]["neural_network"]["feature_groups"] == ["frequency", "gaps"]
+        assert set(ml_service.predict_numbers()["predictions"]) == set(ml_service.enabled_models())
+
+        # Parallel fits select the same columns
+        ml_service.train_models(parallel=True, workers=2)
+        parallel_bundle = ml_service.model_registry.get()
+        X = bundle.scaled_features(ml_env, np.arange(5, 20))
+        for name in ml_service.enabled_models():
+            np.testing.assert_allclose(parallel_bundle.predict(name, X), bundle.predict(name, X))
+
+
+class TestModelZoo:
+    """Test training and serving a configured model set."""
+
+    def test_train_and_serve_every_zoo_model(self, ml_env, monkeypatch):
+        import services.model_zoo as model_zoo
+        import services.simulation_service as simulation_service
+        import services.ticket_service as ticket_service
+        monkeypatch.setattr(model_zoo, "MODEL_SET", list(model_zoo.MODEL_ZOO))
+        monkeypatch.setattr(ticket_service, "model_registry", ml_service.model_registry)
+        monkeypatch.setattr(ticket_service, "get_draw_store", ml_service.get_draw_store)
+
+        result = ml_service.train_models(parallel=False)
+
+        assert set(result["models"]) == set(model_zoo.MODEL_ZOO)
+        for stats in result["models"].values():
+            assert stats["predict_ms"] > 0
+            assert stats["model_bytes"] > 0
+        assert set(ml_service.predict_numbers()["predictions"]) == set(model_zoo.MODEL_ZOO)
+        assert len(simulation_service.generate_single_prediction()) == 6
+
+    def test_unknown_model_in_model_set(self, monkeypatch):
+        import services.model_zoo as model_zoo
+        monkeypatch.setattr(model_zoo, "MODEL_SET", ["random_forest", "xgboost"])
+
+        with pytest.raises(ValueError):
+            ml_service.build_models()
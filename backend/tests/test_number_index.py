@@ -0,0 +1,61 @@
+from collections import Counter
+
+from database import DrawNumber
+from services.db_service import LottoDBService
+from services.number_index import DrawNumberIndex
+from tests.helpers import make_draws
+
+
+def index_rows(db) -> Counter:
+    return Counter(db.query(DrawNumber.draw_no, DrawNumber.number, DrawNumber.is_bonus).all())
+
+
+def expected_rows(draws: list) -> Counter:
+    rows = Counter()
+    for draw in draws:
+        rows.update((draw["draw_no"], n, False) for n in draw["numbers"])
+        rows[(draw["draw_no"], draw["bonus"], True)] += 1
+    return rows
+
+
+class TestDrawNumberIndex:
+    """Test that every write path keeps draw_numbers in sync."""
+
+    def test_add_draw_writes_index_rows(self, db):
+        draws = make_draws(20)
+        LottoDBService.add_multiple_draws(db, draws)
+
+        assert index_rows(db) == expected_rows(draws)
+        assert DrawNumberIndex.is_synced(db)
+
+    def test_delete_draw_removes_index_rows(self, db):
+        draws = make_draws(20)
+        LottoDBService.add_multiple_draws(db, draws)
+
+        assert LottoDBService.delete_draw_by_number(db, 7)
+        assert index_rows(db) == expected_rows([d for d in draws if d["draw_no"] != 7])
+        assert DrawNumberIndex.is_synced(db)
+
+    def test_clear_removes_every_row(self, db):
+        LottoDBService.add_multiple_draws(db, make_draws(10))
+
+        LottoDBService.clear_all_draws(db)
+        assert db.query(DrawNumber).count() == 0
+        assert DrawNumberIndex.is_synced(db)
+
+    def test_ensure_synced_rebuilds_after_direct_writes(self, db):
+        draws = make_draws(15)
+        LottoDBService.add_multiple_draws(db, draws)
+        db.query(DrawNumber).delete()
+        db.commit()
+        assert not DrawNumberIndex.is_synced(db)
+
+        DrawNumberIndex.ensure_synced(db)
+        assert index_rows(db) == expected_rows(draws)
+
+    def test_number_frequency_counts_main_numbers(self, db):
+        draws = make_draws(40, seed=5)
+        LottoDBService.add_multiple_draws(db, draws)
+
+        expected = Counter(n for d in draws for n in d["numbers"])
+        assert LottoDBService.get_number_frequency(db) == dict(expected)
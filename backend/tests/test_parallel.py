@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+import services.parallel as parallel
+from services.parallel import ResourcePolicy, cpu_quota
+
+
+class TestCpuQuota:
+    """Test reading the container CPU quota from cgroup files."""
+
+    def test_cgroup_v2_quota(self, tmp_path):
+        (tmp_path / "cpu.max").write_text("250000 100000\n")
+        assert cpu_quota(tmp_path) == 2.5
+
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        assert cpu_quota(tmp_path) is None
+
+    def test_cgroup_v1_quota(self, tmp_path):
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("150000\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+        assert cpu_quota(tmp_path) == 1.5
+
+    def test_no_cgroup(self, tmp_path):
+        assert cpu_quota(tmp_path) is None
+
+
+class TestResourcePolicy:
+    """Test the worker cap of the training resource policy."""
+
+    @pytest.fixture(autouse=True)
+    def eight_cpus(self, monkeypatch):
+        monkeypatch.setattr(parallel, "available_cpus", lambda: 8)
+
+    def test_worker_limit(self):
+        assert ResourcePolicy().worker_limit() == 8
+        assert ResourcePolicy(reserved_cpus=1).worker_limit() == 7
+        assert ResourcePolicy(max_workers=3, reserved_cpus=1).worker_limit() == 3
+        assert ResourcePolicy(reserved_cpus=20).worker_limit() == 1
+
+    def test_resolve_workers_is_capped(self, monkeypatch):
+        monkeypatch.setattr(parallel, "resource_policy", ResourcePolicy(max_workers=4))
+
+        assert parallel.resolve_workers(0) == 4
+        assert parallel.resolve_workers(2) == 2
+        assert parallel.resolve_workers(16) == 4
+
+    def test_pool_workers_run_under_policy(self, monkeypatch):
+        monkeypatch.setattr(parallel, "resource_policy", ResourcePolicy(max_workers=1, threads=1, nice=3))
+
+        with parallel.create_process_pool(4) as pool:
+            assert pool._max_workers == 1
+            niceness = pool.submit(os.nice, 0).result()
+            threads = pool.submit(os.getenv, "OMP_NUM_THREADS").result()
+
+        assert niceness == os.nice(0) + 3
+        assert threads == "1"
+
+    def test_governed_leaves_process_thread_pools_alone(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(parallel, "threadpool_limits", lambda **kwargs: calls.append(kwargs))
+
+        with ResourcePolicy(threads=1).governed():
+            pass
+
+        # Limits are process-wide: only spawned workers may set them
+        assert calls == []
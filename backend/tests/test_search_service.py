@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import services.ml_service as ml_service
+import services.search_service as search_service
+
+
+@pytest.fixture
+def search_env(ml_env, monkeypatch):
+    """Small search space over the synthetic store used by ml_env."""
+    monkeypatch.setattr(search_service, "get_draw_store", lambda: ml_env)
+    monkeypatch.setattr(search_service, "SEARCH_SPACES", {
+        "gradient_boosting": {"n_estimators": [5, 10], "max_depth": [2, 3]},
+        "neural_network": {"hidden_layer_sizes": [(8,), (8, 4)]},
+    })
+    return ml_env
+
+
+class TestSearch:
+    """Test hyperparameter search, leaderboard persistence and promotion."""
+
+    def test_leaderboard_is_ranked_and_persisted(self, search_env, tmp_path):
+        result = search_service.run_search("gradient_boosting", n_splits=2, workers=1, root=tmp_path)
+
+        assert result["candidates"] == 4
+        scores = [entry["mean_score"] for entry in result["leaderboard"]]
+        assert scores == sorted(scores, reverse=True)
+        assert [entry["rank"] for entry in result["leaderboard"]] == [1, 2, 3, 4]
+        assert search_service.load_leaderboard("gradient_boosting", tmp_path) == result
+
+    def test_random_search_samples_subset(self):
+        candidates = search_service.search_candidates("random_forest", method="random", n_iter=3)
+        assert len(candidates) == 3
+
+    def test_feature_cache_is_reused(self, search_env, tmp_path):
+        x_path, y_path = search_service.cached_features(tmp_path)
+        mtime = x_path.stat().st_mtime_ns
+
+        assert search_service.cached_features(tmp_path) == (x_path, y_path)
+        assert x_path.stat().st_mtime_ns == mtime
+
+    def test_promote_publishes_params(self, search_env, tmp_path):
+        result = search_service.run_search("neural_network", n_splits=2, workers=1, root=tmp_path)
+        best = result["leaderboard"][0]["params"]
+
+        search_service.promote("neural_network", root=tmp_path)
+        bundle = ml_service.model_registry.get()
+
+        assert bundle.training_info["params"]["neural_network"] == {"hidden_layer_sizes": tuple(best["hidden_layer_sizes"])}
+        assert bundle.models["neural_network"].estimator.hidden_layer_sizes == tuple(best["hidden_layer_sizes"])
+
+        # A plain retrain keeps the promoted parameters
+        ml_service.train_models(parallel=False)
+        assert ml_service.model_registry.get().training_info["params"] == bundle.training_info["params"]
+
+    def test_promote_without_results(self, search_env, tmp_path):
+        with pytest.raises(ValueError):
+            search_service.promote("neural_network", root=tmp_path)
+
+    def test_promote_requires_enabled_model(self, search_env, tmp_path, monkeypatch):
+        import services.model_zoo as model_zoo
+        search_service.run_search("neural_network", n_splits=2, workers=1, root=tmp_path)
+        monkeypatch.setattr(model_zoo, "MODEL_SET", ["gradient_boosting"])
+
+        with pytest.raises(ValueError, match="MODEL_SET"):
+            search_service.promote("neural_network", root=tmp_path)
+
+    def test_folds_use_training_output_mode(self, search_env, tmp_path, monkeypatch):
+        monkeypatch.setattr(search_service, "TRAIN_OUTPUT_MODE", "native")
+        result = search_service.run_search("neural_network", n_splits=2, workers=1, root=tmp_path)
+        assert result["output_mode"] == "native"
+
+        modes = []
+        build = search_service.build_models
+        monkeypatch.setattr(search_service, "build_models", lambda *a, **k: modes.append(a[1]) or build(*a, **k))
+        monkeypatch.setattr(search_service, "_worker_data", {
+            "X": search_env.features[5:len(search_env)], "y": search_env.numbers[5:].astype(np.int64)
+        })
+        search_service._fit_fold("neural_network", {"hidden_layer_sizes": (8,)}, "native", np.arange(30), np.arange(30, 40))
+        assert modes == ["native"]
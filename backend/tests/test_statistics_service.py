@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import services.statistics_service as statistics_service
+from routers.statistics import router
+from services.statistics_store import SECTION_NAMES, SUM_RANGES, prefix_totals, statistics_from_totals, unflatten_totals
+from tests.helpers import make_store
+
+
+def reference_statistics(numbers: np.ndarray) -> dict:
+    """Per-draw loop reference of the statistics output."""
+    draws = [sorted(int(n) for n in row) for row in numbers]
+    sums = [sum(draw) for draw in draws]
+    edges = [80, 100, 120, 140, 160, 180, 200]
+    sections = [[sum(1 for n in draw if lo <= n <= hi) for draw in draws] for lo, hi in [(1, 15), (16, 30), (31, 45)]]
+    consecutive = sum(1 for draw in draws if any(b - a == 1 for a, b in zip(draw, draw[1:])))
+    return {
+        "number_frequency": {str(k): sum(draw.count(k) for draw in draws) for k in range(1, 46)},
+        "odd_even_distribution": {f"{i}_odd": sum(1 for d in draws if sum(n % 2 for n in d) == i) for i in range(7)},
+        "sum_distribution": {
+            "ranges": SUM_RANGES,
+            "counts": [sum(1 for s in sums if sum(s > e for e in edges) == b) for b in range(8)]
+        },
+        "consecutive_stats": {"has_consecutive": consecutive, "no_consecutive": len(draws) - consecutive},
+        "section_distribution": {
+            name: {
+                "avg": round(sum(counts) / len(counts), 2),
+                "distribution": {str(k): counts.count(k) for k in sorted(set(counts))}
+            }
+            for name, counts in zip(SECTION_NAMES, sections)
+        },
+        "total_draws": len(draws)
+    }
+
+
+class TestStatistics:
+    """Test full-history and recent statistics against a per-draw reference."""
+
+    @pytest.mark.parametrize("n, recent", [(1, None), (6, None), (250, None), (250, 40)])
+    def test_matches_reference(self, monkeypatch, n, recent):
+        store = make_store(n, seed=n)
+        monkeypatch.setattr(statistics_service, "STATISTICS_SOURCE", "memory")
+        monkeypatch.setattr(statistics_service, "get_draw_store", lambda: store)
+
+        expected = reference_statistics(store.numbers[-recent:] if recent else store.numbers)
+        assert statistics_service.calculate_statistics(recent) == expected
+
+    def test_empty_history(self):
+        prefix = prefix_totals(np.empty((0, 6), dtype=np.uint8))
+        stats = statistics_from_totals(unflatten_totals(prefix[0]))
+
+        assert stats["total_draws"] == 0
+        assert sum(stats["number_frequency"].values()) == 0
+
+
+class TestWindowStatistics:
+    """Test draw-range statistics served from the prefix-sum index."""
+
+    @pytest.mark.parametrize("from_draw, to_draw, recent, rows", [
+        (None, None, None, slice(0, 200)),
+        (50, 120, None, slice(49, 120)),
+        (None, 80, 30, slice(50, 80)),
+        (150, None, 500, slice(149, 200)),
+        (200, 200, None, slice(199, 200))
+    ])
+    def test_matches_reference(self, monkeypatch, from_draw, to_draw, recent, rows):
+        store = make_store(200, seed=11)
+        monkeypatch.setattr(statistics_service, "STATISTICS_SOURCE", "memory")
+        monkeypatch.setattr(statistics_service, "get_draw_store", lambda: store)
+
+        stats = statistics_service.calculate_statistics(recent, from_draw=from_draw, to_draw=to_draw)
+        assert stats == reference_statistics(store.numbers[rows])
+
+    def test_prefix_is_cached_per_store(self):
+        store = make_store(20)
+
+        assert store.statistics_prefix() is store.statistics_prefix()
+        assert store.statistics_prefix().shape[0] == 21
+
+    def test_range_without_draws_is_empty(self, monkeypatch):
+        store = make_store(20)
+        monkeypatch.setattr(statistics_service, "get_draw_store", lambda: store)
+
+        assert statistics_service.calculate_statistics(from_draw=500)["total_draws"] == 0
+
+    def test_reversed_range_rejected(self):
+        with pytest.raises(ValueError):
+            statistics_service.calculate_statistics(from_draw=10, to_draw=5)
+
+
+class TestMultiStatistics:
+    """Test several windows answered from one prefix-sum index."""
+
+    def test_windows_match_single_requests(self, monkeypatch):
+        store = make_store(120, seed=13)
+        monkeypatch.setattr(statistics_service, "STATISTICS_SOURCE", "memory")
+        monkeypatch.setattr(statistics_service, "get_draw_store", lambda: store)
+
+        result = statistics_service.calculate_multi_statistics([10, 50, 500, None])
+        assert list(result["windows"]) == ["10", "50", "500", "all"]
+        assert result["latest_draw"] == 120
+        for key, stats in result["windows"].items():
+            recent = None if key == "all" else int(key)
+            assert stats == reference_statistics(store.numbers[-recent:] if recent else store.numbers)
+
+    def test_parse_windows(self):
+        assert statistics_service.parse_windows("10, 50,all,10") == [10, 50, None]
+        for spec in ("0", "abc", "10,-5", ",".join(str(i) for i in range(1, 30))):
+            with pytest.raises(ValueError):
+                statistics_service.parse_windows(spec)
+
+    def test_endpoint(self, monkeypatch):
+        store = make_store(60, seed=14)
+        monkeypatch.setattr(statistics_service, "get_draw_store", lambda: store)
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        client = TestClient(app)
+
+        response = client.get("/api/v1/statistics/multi", params={"windows": "10,all"})
+        assert response.status_code == 200
+        windows = response.json()["data"]["windows"]
+        assert windows["10"]["total_draws"] == 10
+        assert windows["all"]["total_draws"] == 60
+        assert client.get("/api/v1/statistics/multi", params={"windows": "x"}).status_code == 400
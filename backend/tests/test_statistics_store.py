@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import services.statistics_service as statistics_service
+from database import LottoResult, LottoStatistics
+from services.db_service import LottoDBService
+from services.statistics_store import StatisticsStore, draw_profile, draw_totals, statistics_from_totals
+from tests.helpers import make_draws
+from tests.test_statistics_service import reference_statistics
+
+
+def stored_statistics(db) -> dict:
+    return statistics_from_totals(StatisticsStore.get_totals(db))
+
+
+def reference_for(draws: list) -> dict:
+    return reference_statistics(np.array([d["numbers"] for d in draws]))
+
+
+class TestStatisticsStore:
+    """Test the materialized statistics row against a per-draw reference."""
+
+    def test_draw_profile(self):
+        assert draw_profile([1, 2, 17, 31, 44, 45]) == (4, 3, 2, 1, 3, 1)
+        assert draw_profile([3, 9, 20, 26, 33, 41]) == (4, 3, 2, 2, 2, 0)
+
+    def test_single_draw_totals_match_kernel(self):
+        numbers = [5, 6, 18, 29, 30, 42]
+        totals = draw_totals(numbers)
+
+        assert statistics_from_totals(totals) == reference_statistics(np.array([numbers]))
+
+    def test_inserts_update_materialized_row(self, db):
+        draws = make_draws(60, seed=2)
+        LottoDBService.add_multiple_draws(db, draws[:10])
+        stored_statistics(db)  # Materialize, later inserts update the row in place
+
+        LottoDBService.add_multiple_draws(db, draws[10:])
+        assert db.query(LottoStatistics).count() == 1
+        assert stored_statistics(db) == reference_for(draws)
+
+    def test_delete_and_clear_update_materialized_row(self, db):
+        draws = make_draws(30, seed=4)
+        LottoDBService.add_multiple_draws(db, draws)
+        stored_statistics(db)
+
+        assert LottoDBService.delete_draw_by_number(db, 12)
+        assert stored_statistics(db) == reference_for([d for d in draws if d["draw_no"] != 12])
+
+        LottoDBService.clear_all_draws(db)
+        assert stored_statistics(db)["total_draws"] == 0
+
+    def test_incremental_row_stays_synced(self, db, monkeypatch):
+        draws = make_draws(20, seed=5)
+        LottoDBService.add_multiple_draws(db, draws[:10])
+        stored_statistics(db)
+        LottoDBService.add_multiple_draws(db, draws[10:])
+        assert LottoDBService.delete_draw_by_number(db, 20)
+
+        monkeypatch.setattr(StatisticsStore, "rebuild", lambda db: pytest.fail("unexpected rebuild"))
+        assert stored_statistics(db) == reference_for(draws[:19])
+
+    def test_draws_written_around_the_store_trigger_rebuild(self, db):
+        draws = make_draws(21, seed=7)
+        LottoDBService.add_multiple_draws(db, draws[:20])
+        stored_statistics(db)
+
+        # E.g. an older build or a manual SQL fix: no totals update
+        extra = draws[20]
+        db.add(LottoResult(
+            draw_no=extra["draw_no"], draw_date=extra["draw_date"],
+            **{f"num{i + 1}": n for i, n in enumerate(sorted(extra["numbers"]))}, bonus=extra["bonus"]
+        ))
+        db.commit()
+        assert stored_statistics(db) == reference_for(draws)
+
+        # Same count, different latest draw
+        db.query(LottoResult).filter(LottoResult.draw_no == 1).delete()
+        db.add(LottoResult(draw_no=30, draw_date="2024-01-01", num1=1, num2=2, num3=3, num4=4, num5=5, num6=6, bonus=7))
+        db.commit()
+        expected = draws[1:] + [{"draw_no": 30, "numbers": [1, 2, 3, 4, 5, 6]}]
+        assert stored_statistics(db) == reference_for(expected)
+
+    def test_rebuild_matches_reference(self, db):
+        draws = make_draws(120, seed=3)
+        LottoDBService.add_multiple_draws(db, draws)
+
+        assert statistics_from_totals(StatisticsStore.rebuild(db)) == reference_for(draws)
+
+    def test_rebuild_of_empty_database(self, db):
+        assert StatisticsStore.rebuild(db)["total_draws"] == 0
+
+    def test_rebuild_matches_incremental_totals(self, db):
+        LottoDBService.add_multiple_draws(db, make_draws(1))
+        stored_statistics(db)
+        LottoDBService.add_multiple_draws(db, make_draws(45, seed=6)[1:])
+        incremental = stored_statistics(db)
+
+        StatisticsStore.rebuild(db)
+        assert stored_statistics(db) == incremental
+
+    def test_calculate_statistics_reads_materialized_row(self, db, monkeypatch):
+        draws = make_draws(25, seed=8)
+        LottoDBService.add_multiple_draws(db, draws)
+        monkeypatch.setattr(statistics_service, "STATISTICS_SOURCE", "sql")
+        monkeypatch.setattr(statistics_service, "get_db", lambda: iter([db]))
+
+        assert statistics_service.calculate_statistics() == reference_for(draws)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import services.ml_service as ml_service
+import services.simulation_service as simulation_service
+import services.ticket_service as ticket_service
+from services.model_registry import ModelRegistry
+from services.prediction_cache import PredictionCache
+from services.ticket_service import number_scores, sample_tickets
+from tests.helpers import make_store
+
+
+@pytest.fixture
+def ticket_env(tmp_path, monkeypatch):
+    """Trained models on a synthetic store, shared by ml_service and the ticket engine."""
+    store = make_store(60)
+    registry = ModelRegistry(tmp_path)
+    monkeypatch.setattr(ml_service, "model_registry", registry)
+    monkeypatch.setattr(ml_service, "get_draw_store", lambda: store)
+    monkeypatch.setattr(ticket_service, "model_registry", registry)
+    monkeypatch.setattr(ticket_service, "get_draw_store", lambda: store)
+    monkeypatch.setattr(ticket_service, "score_cache", PredictionCache())
+    monkeypatch.setattr(simulation_service, "get_draw_store", lambda: store)
+    return store
+
+
+class TestTicketSampling:
+    """Test score vectors and vectorized ticket sampling."""
+
+    def test_number_scores(self):
+        scores = number_scores(np.array([[3.0, 10.0, 20.0, 30.0, 40.0, 44.6]]))
+
+        assert scores.shape == (45,)
+        assert scores.sum() == pytest.approx(1.0)
+        assert scores.min() > 0
+        assert scores[2] > scores[5] > scores[15]  # Peaks at the predicted values
+
+    def test_tickets_are_distinct_sorted_and_seeded(self):
+        scores = number_scores(np.array([[5.0, 12.0, 18.0, 25.0, 33.0, 41.0]]))
+        tickets = sample_tickets(scores, 500, np.random.default_rng(7))
+
+        assert tickets.shape == (500, 6)
+        assert ((tickets >= 1) & (tickets <= 45)).all()
+        assert (np.diff(tickets, axis=1) > 0).all()
+        np.testing.assert_array_equal(tickets, sample_tickets(scores, 500, np.random.default_rng(7)))
+
+    def test_frequencies_follow_scores(self):
+        scores = np.full(45, 1.0)
+        scores[:6] = 50.0
+        scores /= scores.sum()
+        tickets = sample_tickets(scores, 2000, np.random.default_rng(0))
+
+        counts = np.bincount(tickets.ravel(), minlength=46)[1:]
+        assert counts[:6].min() > counts[6:].max()
+
+
+class TestTicketEngine:
+    """Test ensemble tickets from the served models."""
+
+    def test_random_source_without_models(self, ticket_env):
+        result = ticket_service.generate_tickets(3, seed=1)
+
+        assert result["source"] == "random"
+        assert len(result["tickets"]) == 3
+
+    def test_models_run_once_per_version(self, ticket_env, monkeypatch):
+        ml_service.train_models(parallel=False)
+        bundle = ml_service.model_registry.get()
+        calls = []
+        predict = bundle.predict
+        monkeypatch.setattr(bundle, "predict", lambda name, X: calls.append(name) or predict(name, X))
+
+        first = ticket_service.generate_tickets(50, seed=3)
+        second = ticket_service.generate_tickets(50, seed=3)
+
+        assert first["source"] == "ensemble"
+        assert first["tickets"] == second["tickets"]
+        assert sorted(calls) == sorted(bundle.models)
+
+    def test_count_validated(self, ticket_env):
+        with pytest.raises(ValueError):
+            ticket_service.generate_tickets(0)
+
+    def test_simulation_uses_batch_engine(self, ticket_env):
+        ml_service.train_models(parallel=False)
+        result = simulation_service.run_simulation(1000, seed=5)["simulation_results"]
+
+        counts = [stats["count"] for stats in result["winner_stats"].values()]
+        assert sum(counts) == 1000
+        assert len(result["sample_predictions"]) == 10
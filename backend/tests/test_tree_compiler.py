@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from services.ml_service import build_models
+from services.model_registry import ModelBundle
+from services.tree_compiler import compile_model
+
+
+@pytest.fixture(scope="module")
+def fitted_models():
+    """Default model families fitted on random data."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 79))
+    y = np.sort(rng.integers(1, 46, (200, 6)), axis=1)
+    models = build_models(model_names=["random_forest", "gradient_boosting", "neural_network", "extra_trees"])
+    models["random_forest"].estimator.set_params(n_jobs=1)
+    models["extra_trees"].estimator.set_params(n_jobs=1)
+    for model in models.values():
+        model.fit(X, y)
+    return models
+
+
+class TestTreeCompiler:
+    """Test compiled tree inference against sklearn predict."""
+
+    @pytest.mark.parametrize("model_name", ["random_forest", "gradient_boosting", "extra_trees"])
+    def test_identical_to_sklearn(self, fitted_models, model_name):
+        model = fitted_models[model_name]
+        compiled = compile_model(model)
+        X = np.random.default_rng(1).normal(size=(64, 79))
+
+        np.testing.assert_array_equal(compiled.predict(X), model.predict(X))
+        np.testing.assert_array_equal(compiled.predict(X[:1]), model.predict(X[:1]))
+        np.testing.assert_array_equal(compiled.predict(X[0]), model.predict(X[:1]))
+
+    def test_mlp_not_compiled(self, fitted_models):
+        assert compile_model(fitted_models["neural_network"]) is None
+
+    def test_bundle_prefers_compiled(self, fitted_models):
+        bundle = ModelBundle("test", None, fitted_models, {}, {})
+        X = np.random.default_rng(2).normal(size=(3, 79))
+
+        assert set(bundle.compiled) == {"random_forest", "gradient_boosting", "extra_trees"}
+        for model_name, model in fitted_models.items():
+            np.testing.assert_array_equal(bundle.predict(model_name, X), model.predict(X))
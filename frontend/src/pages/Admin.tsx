@@ -1,7 +1,11 @@
 import { useEffect, useState } from 'react';
 import { api } from '../services/api';
 import { LoadingSpinner, ErrorMessage } from '../components';
-import type { SystemStatus, TrainData } from '../types';
+import type { SystemStatus, TrainData, TrainJob } from '../types';
+
+const TRAIN_POLL_INTERVAL = 1000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 
 export default function Admin() {
   const [status, setStatus] = useState<SystemStatus | null>(null);
@@ -11,6 +15,7 @@ export default function Admin() {
   const [training, setTraining] = useState(false);
   const [message, setMessage] = useState<string | null>(null);
   const [trainResult, setTrainResult] = useState<TrainData | null>(null);
+  const [trainJob, setTrainJob] = useState<TrainJob | null>(null);
 
   const fetchStatus = async () => {
     setLoading(true);
@@ -46,16 +51,40 @@ export default function Admin() {
     setMessage(null);
     setTrainResult(null);
     try {
-      const response = await api.admin.train();
-      const modelCount = Object.keys(response.data.models).length;
-      setMessage(`${modelCount}개 모델 학습 완료`);
-      setTrainResult(response.data);
-      fetchStatus();
+      // Training runs as a background job; poll until it finishes
+      let job = (await api.admin.train()).data;
+      setTrainJob(job);
+      while (job.status === 'queued' || job.status === 'running') {
+        await sleep(TRAIN_POLL_INTERVAL);
+        job = (await api.admin.trainStatus(job.job_id)).data;
+        setTrainJob(job);
+      }
+
+      if (job.status === 'completed' && job.result) {
+        const modelCount = Object.keys(job.result.models).length;
+        setMessage(`${modelCount}개 모델 학습 완료`);
+        setTrainResult(job.result);
+        fetchStatus();
+      } else if (job.status === 'cancelled') {
+        setMessage('모델 학습이 취소되었습니다.');
+      } else {
+        setMessage(job.error || '모델 학습 중 오류가 발생했습니다.');
+      }
     } catch (err: any) {
       const errorMsg = err.response?.data?.detail || '모델 학습 중 오류가 발생했습니다.';
       setMessage(errorMsg);
     } finally {
       setTraining(false);
+      setTrainJob(null);
+    }
+  };
+
+  const handleCancelTrain = async () => {
+    if (!trainJob) return;
+    try {
+      await api.admin.cancelTrain(trainJob.job_id);
+    } catch (err) {
+      setMessage('학습 취소 요청에 실패했습니다.');
     }
   };
 
@@ -177,8 +206,23 @@ export default function Admin() {
               disabled={training || status.database.total_draws < 10}
               className="w-full px-4 py-2 bg-purple-600 text-white rounded-lg hover:bg-purple-700 disabled:opacity-50"
             >
-              {training ? '학습 중...' : '모델 학습'}
+              {training
+                ? `학습 중... ${trainJob ? Math.round(trainJob.progress * 100) : 0}%`
+                : '모델 학습'}
             </button>
+            {training && trainJob && (
+              <div className="mt-2 flex items-center justify-between text-xs text-gray-500">
+                <span>
+                  {trainJob.phase} · {trainJob.elapsed.toFixed(1)}초
+                </span>
+                <button
+                  onClick={handleCancelTrain}
+                  className="text-red-600 hover:underline"
+                >
+                  취소
+                </button>
+              </div>
+            )}
           </div>
         </div>
       </div>
@@ -7,12 +7,18 @@ const MODEL_NAMES: Record<string, string> = {
   random_forest: 'Random Forest',
   gradient_boosting: 'Gradient Boosting',
   neural_network: 'Neural Network (MLP)',
+  hist_gradient_boosting: 'Hist Gradient Boosting',
+  extra_trees: 'Extra Trees',
+  ridge: 'Ridge (baseline)',
+  knn: 'KNN (baseline)',
 };
 
 const MODEL_COLORS: Record<string, string> = {
   random_forest: 'border-green-500 bg-green-50',
   gradient_boosting: 'border-blue-500 bg-blue-50',
   neural_network: 'border-purple-500 bg-purple-50',
+  hist_gradient_boosting: 'border-sky-500 bg-sky-50',
+  extra_trees: 'border-emerald-500 bg-emerald-50',
 };
 
 export default function Predict() {
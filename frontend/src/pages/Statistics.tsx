@@ -16,10 +16,13 @@ import { api } from '../services/api';
 import { LoadingSpinner, ErrorMessage } from '../components';
 import type { Statistics, SimulationData, SimulationInfo } from '../types';
 
+// Windows offered by the period selector, fetched together in one request
+const WINDOWS = ['all', '10', '50', '100', '500'];
+
 const COLORS = ['#FBC400', '#69C8F2', '#FF7272', '#AAAAAA', '#B0D840', '#9b59b6', '#1abc9c'];
 
 export default function StatisticsPage() {
-  const [stats, setStats] = useState<Statistics | null>(null);
+  const [windowStats, setWindowStats] = useState<Record<string, Statistics> | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [recent, setRecent] = useState<number | undefined>(undefined);
@@ -36,8 +39,8 @@ export default function StatisticsPage() {
     setLoading(true);
     setError(null);
     try {
-      const response = await api.statistics.get(recent);
-      setStats(response.data);
+      const response = await api.statistics.getMulti(WINDOWS);
+      setWindowStats(response.data.windows);
     } catch (err) {
       setError('통계 데이터를 불러오는데 실패했습니다.');
     } finally {
@@ -48,7 +51,7 @@ export default function StatisticsPage() {
   useEffect(() => {
     fetchStats();
     fetchSimulationInfo();
-  }, [recent]);
+  }, []);
 
   const fetchSimulationInfo = async () => {
     try {
@@ -93,6 +96,7 @@ export default function StatisticsPage() {
 
   if (loading) return <LoadingSpinner message="통계 계산 중..." />;
   if (error) return <ErrorMessage message={error} onRetry={fetchStats} />;
+  const stats = windowStats?.[recent ? String(recent) : 'all'];
   if (!stats) return null;
 
   // Prepare frequency data
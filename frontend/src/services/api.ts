@@ -4,11 +4,12 @@ import type {
   PaginatedResults,
   LottoResult,
   Statistics,
+  MultiStatistics,
   PredictionData,
   RecommendData,
   SystemStatus,
   SyncData,
-  TrainData,
+  TrainJob,
   SimulationData,
   SimulationInfo,
 } from '../types';
@@ -51,6 +52,13 @@ export const api = {
       });
       return response.data;
     },
+
+    getMulti: async (windows: string[]): Promise<APIResponse<MultiStatistics>> => {
+      const response = await client.get('/statistics/multi', {
+        params: { windows: windows.join(',') },
+      });
+      return response.data;
+    },
   },
 
   // Predict
@@ -103,11 +111,21 @@ export const api = {
       return response.data;
     },
 
-    train: async (): Promise<APIResponse<TrainData>> => {
+    train: async (): Promise<APIResponse<TrainJob>> => {
       const response = await client.post('/admin/train');
       return response.data;
     },
 
+    trainStatus: async (jobId: string): Promise<APIResponse<TrainJob>> => {
+      const response = await client.get(`/admin/train/${jobId}`);
+      return response.data;
+    },
+
+    cancelTrain: async (jobId: string): Promise<APIResponse<TrainJob>> => {
+      const response = await client.post(`/admin/train/${jobId}/cancel`);
+      return response.data;
+    },
+
     status: async (): Promise<APIResponse<SystemStatus>> => {
       const response = await client.get('/admin/status');
       return response.data;
@@ -56,6 +56,11 @@ export interface Statistics {
   total_draws: number;
 }
 
+export interface MultiStatistics {
+  windows: Record<string, Statistics>;
+  latest_draw: number | null;
+}
+
 // Prediction
 export interface ModelPrediction {
   numbers: number[];
@@ -63,11 +68,7 @@ export interface ModelPrediction {
 }
 
 export interface PredictionData {
-  predictions: {
-    random_forest: ModelPrediction;
-    gradient_boosting: ModelPrediction;
-    neural_network: ModelPrediction;
-  };
+  predictions: Record<string, ModelPrediction>;
   disclaimer: string;
   last_trained?: string;
 }
@@ -99,11 +100,24 @@ export interface MLModelStatus {
   trained: boolean;
   last_trained?: string;
   models_available: string[];
+  version?: string;
+  loaded_at?: string;
+  compiled_models?: string[];
+}
+
+export interface PredictionCacheStatus {
+  filled: boolean;
+  latest_draw?: number;
+  model_version?: string;
+  filled_at?: string;
+  hits: number;
+  misses: number;
 }
 
 export interface SystemStatus {
   database: DatabaseStatus;
   ml_models: MLModelStatus;
+  prediction_cache?: PredictionCacheStatus;
   last_sync?: string;
 }
 
@@ -114,10 +128,22 @@ export interface SyncData {
 }
 
 // Train Response
+export interface EvaluationMetrics {
+  accuracy_within: Record<string, number>;
+  hit_distribution: Record<string, number>;
+  position_mae: number[];
+}
+
 export interface ModelTrainResult {
   train_accuracy: number;
   test_accuracy: number;
   trained: boolean;
+  fit_time?: number;
+  predict_ms?: number;
+  model_bytes?: number;
+  feature_groups?: string[];
+  train_metrics?: EvaluationMetrics;
+  test_metrics?: EvaluationMetrics;
 }
 
 export interface TrainData {
@@ -125,6 +151,30 @@ export interface TrainData {
   trained_at: string;
   training_samples: number;
   test_samples: number;
+  output_mode?: 'wrapped' | 'native';
+  parallel: boolean;
+  workers: number;
+  fit_wall_time?: number;
+  update_mode?: 'full' | 'incremental';
+  full_retrain_reason?: string;
+  incremental_updates?: number;
+  drift?: Record<string, number>;
+  memory?: { data_peak_mb: number | null; max_rss_mb: number | null };
+}
+
+// Background Job
+export type JobState = 'queued' | 'running' | 'completed' | 'failed' | 'cancelled';
+
+export interface TrainJob {
+  job_id: string;
+  kind: string;
+  status: JobState;
+  phase: string;
+  progress: number;
+  elapsed: number;
+  created_at: string;
+  error?: string;
+  result?: TrainData;
 }
 
 // Simulation Types